@@ -1,4 +1,28 @@
 __all__ = ["prompt", "prompt_async", "get_style"]
 
-from InquirerPy.resolver import prompt, prompt_async
-from InquirerPy.utils import get_style
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from InquirerPy.resolver import prompt, prompt_async
+    from InquirerPy.utils import get_style
+
+_ATTRIBUTE_MODULES = {
+    "prompt": "InquirerPy.resolver",
+    "prompt_async": "InquirerPy.resolver",
+    "get_style": "InquirerPy.utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module of `name` on first access to keep `import InquirerPy` fast."""
+    if name not in _ATTRIBUTE_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_ATTRIBUTE_MODULES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the public attributes including the ones not imported yet."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,6 @@
 """Contains the interface class :class:`.BaseComplexPrompt` for more complex prompts and the mocked document class :class:`.FakeDocument`."""
 import shutil
+import time
 from dataclasses import dataclass
 from typing import Any, Callable, List, Optional, Tuple, Union
 
@@ -11,6 +12,8 @@ from prompt_toolkit.keys import Keys
 
 from InquirerPy.base.simple import BaseSimplePrompt
 from InquirerPy.enum import INQUIRERPY_KEYBOARD_INTERRUPT
+from InquirerPy.profiler import Profiler, get_profiler
+from InquirerPy.session import get_session
 from InquirerPy.utils import (
     InquirerPySessionResult,
     InquirerPyStyle,
@@ -45,6 +48,11 @@ class BaseComplexPrompt(BaseSimplePrompt):
         Use :class:`~InquirerPy.base.BaseListPrompt` to create a complex list prompt which involves multiple choices. It has
         more methods and helper function implemented.
 
+    Note:
+        Set `profiler` or the environment variable `INQUIRERPY_PROFILE` to the path of a trace file
+        to time the keybinding handlers, validation and render passes of the prompt.
+        Refer to :class:`~InquirerPy.profiler.Profiler`.
+
     See Also:
         :class:`~InquirerPy.base.BaseListPrompt`
         :class:`~InquirerPy.prompts.fuzzy.FuzzyPrompt`
@@ -69,6 +77,7 @@ class BaseComplexPrompt(BaseSimplePrompt):
         mandatory: bool = True,
         mandatory_message: str = "Mandatory prompt",
         session_result: Optional[InquirerPySessionResult] = None,
+        profiler: Optional[Profiler] = None,
     ) -> None:
         super().__init__(
             message=message,
@@ -94,6 +103,8 @@ class BaseComplexPrompt(BaseSimplePrompt):
         self._application: Application
         self._long_instruction = long_instruction
         self._border = border
+        self._profiler = profiler if profiler is not None else get_profiler()
+        self._instrumented = False
         self._height_offset = 2  # prev prompt result + current prompt question
         if self._border:
             self._height_offset += 2
@@ -129,7 +140,12 @@ class BaseComplexPrompt(BaseSimplePrompt):
             def executable(event):
                 if self._invalid:
                     self._invalid = False
-                func(event)
+                if self._profiler is None:
+                    func(event)
+                    return
+                name = " ".join(str(getattr(key, "value", key)) for key in keys)
+                with self._profiler.span("key %s" % name):
+                    func(event)
 
             return executable
 
@@ -203,13 +219,56 @@ class BaseComplexPrompt(BaseSimplePrompt):
         post_answer = ("class:answer", " %s" % self.status["result"])
         return super()._get_prompt_message(pre_answer, post_answer)
 
+    def _instrument(self, profiler: Profiler) -> None:
+        """Time the validation and the render passes of the application.
+
+        Override to time additional operations of the prompt.
+
+        Args:
+            profiler: Profiler to record the timings.
+        """
+        render_start = 0.0
+
+        def before_render(_) -> None:
+            nonlocal render_start
+            render_start = time.perf_counter()
+
+        def after_render(_) -> None:
+            profiler.record("render", render_start, time.perf_counter() - render_start)
+
+        self.application.before_render += before_render
+        self.application.after_render += after_render
+        self._validator = profiler.wrap_validator(self._validator)
+
+    def _start_profiler(self) -> None:
+        """Instrument the prompt once if profiling is enabled."""
+        if self._profiler is not None and not self._instrumented:
+            self._instrumented = True
+            self._instrument(self._profiler)
+
+    def _stop_profiler(self) -> None:
+        """Write the trace file of the profiler if profiling is enabled."""
+        if self._profiler is not None:
+            self._profiler.write()
+
     def _run(self) -> Any:
         """Run the application."""
-        return self.application.run()
+        self._start_profiler()
+        try:
+            return self.application.run()
+        finally:
+            self._stop_profiler()
 
     async def _run_async(self) -> None:
         """Run the application asynchronously."""
-        return await self.application.run_async()
+        self._start_profiler()
+        try:
+            session = get_session()
+            if session is not None:
+                return await session.run_guest(self.application)
+            return await self.application.run_async()
+        finally:
+            self._stop_profiler()
 
     @property
     def application(self) -> Application:
@@ -1,16 +1,32 @@
 """Contains the content control class :class:`.InquirerPyUIListControl`."""
 from abc import abstractmethod
 from dataclasses import asdict, dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from prompt_toolkit.layout.controls import FormattedTextControl
 
+from InquirerPy.base.selection import SelectableChoice, SelectedIndices
+from InquirerPy.base.store import ChoiceStore
+from InquirerPy.cache import LRUCache
 from InquirerPy.exceptions import InvalidArgument, RequiredKeyNotFound
 from InquirerPy.separator import Separator
 from InquirerPy.utils import InquirerPyListChoices, InquirerPySessionResult
 
 __all__ = ["Choice", "InquirerPyUIListControl"]
 
+FRAGMENT_CACHE_SIZE = 1000
+
 
 @dataclass
 class Choice:
@@ -49,6 +65,9 @@ class InquirerPyUIListControl(FormattedTextControl):
         default: Default value, this will affect the cursor position.
         multiselect: Indicate if the current prompt has `multiselect` enabled.
         session_result: Current session result.
+        compact: Store the processed choices in a :class:`~InquirerPy.base.store.ChoiceStore`
+            instead of a list of dictionaries to reduce the memory usage of large choice lists.
+        max_lines: Maximum number of choices to render, refer to :attr:`.InquirerPyUIListControl.max_lines`.
     """
 
     def __init__(
@@ -57,11 +76,16 @@ class InquirerPyUIListControl(FormattedTextControl):
         default: Any = None,
         multiselect: bool = False,
         session_result: Optional[InquirerPySessionResult] = None,
+        compact: bool = False,
+        max_lines: Optional[int] = None,
     ) -> None:
         self._session_result = session_result or {}
+        self._compact = compact
+        self.max_lines = max_lines
         self._selected_choice_index: int = 0
         self._choice_func = None
         self._multiselect = multiselect
+        self._choice_fragments = LRUCache(max_entries=FRAGMENT_CACHE_SIZE)
         self._default = (
             default
             if not isinstance(default, Callable)
@@ -72,12 +96,15 @@ class InquirerPyUIListControl(FormattedTextControl):
             if not isinstance(choices, Callable)
             else cast(Callable, choices)(self._session_result)
         )
-        self._choices = self._get_choices(self._raw_choices, self._default)
+        self._selected = SelectedIndices()
+        self.choices = self._get_choices(self._raw_choices, self._default)
         self._safety_check()
         self._format_choices()
         super().__init__(self._get_formatted_choices)
 
-    def _get_choices(self, choices: List[Any], default: Any) -> List[Dict[str, Any]]:
+    def _get_choices(
+        self, choices: List[Any], default: Any
+    ) -> Union[List[Dict[str, Any]], ChoiceStore]:
         """Process the raw user input choices and format it into dictionary.
 
         Args:
@@ -85,52 +112,66 @@ class InquirerPyUIListControl(FormattedTextControl):
             default: Default value, this will affect the :attr:`.InquirerPyUIListControl.selected_choice_index`
 
         Returns:
-            List of choices.
+            List of choices, or a :class:`~InquirerPy.base.store.ChoiceStore` when `compact` is enabled.
+
+        Raises:
+            RequiredKeyNotFound: When the provided choice is missing the `name` or `value` key.
+        """
+        processed_choices: Union[List[Dict[str, Any]], ChoiceStore] = (
+            ChoiceStore() if self._compact else []
+        )
+        processed_choices.extend(self._iter_choices(choices, default))
+        return processed_choices
+
+    def _iter_choices(
+        self, choices: List[Any], default: Any, start: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """Process the raw user input choices one by one.
+
+        Args:
+            choices: List of choices to process.
+            default: Default value, this will affect the :attr:`.InquirerPyUIListControl.selected_choice_index`
+            start: Position of the first choice in :attr:`.InquirerPyUIListControl.choices`.
+
+        Yields:
+            The processed choice dictionary of each choice.
 
         Raises:
             RequiredKeyNotFound: When the provided choice is missing the `name` or `value` key.
         """
-        processed_choices: List[Dict[str, Any]] = []
         try:
-            for index, choice in enumerate(choices, start=0):
+            for index, choice in enumerate(choices, start=start):
                 if isinstance(choice, dict):
                     if choice["value"] == default:
                         self.selected_choice_index = index
-                    processed_choices.append(
-                        {
-                            "name": str(choice["name"]),
-                            "value": choice["value"],
-                            "enabled": choice.get("enabled", False)
-                            if self._multiselect
-                            else False,
-                        }
-                    )
+                    yield {
+                        "name": str(choice["name"]),
+                        "value": choice["value"],
+                        "enabled": choice.get("enabled", False)
+                        if self._multiselect
+                        else False,
+                    }
                 elif isinstance(choice, Separator):
                     if self.selected_choice_index == index:
                         self.selected_choice_index = (
                             self.selected_choice_index + 1
-                        ) % len(choices)
-                    processed_choices.append(
-                        {"name": str(choice), "value": choice, "enabled": False}
-                    )
+                        ) % (start + len(choices))
+                    yield {"name": str(choice), "value": choice, "enabled": False}
                 elif isinstance(choice, Choice):
                     dict_choice = asdict(choice)
                     if dict_choice["value"] == default:
                         self.selected_choice_index = index
                     if not self._multiselect:
                         dict_choice["enabled"] = False
-                    processed_choices.append(dict_choice)
+                    yield dict_choice
                 else:
                     if choice == default:
                         self.selected_choice_index = index
-                    processed_choices.append(
-                        {"name": str(choice), "value": choice, "enabled": False}
-                    )
+                    yield {"name": str(choice), "value": choice, "enabled": False}
         except KeyError:
             raise RequiredKeyNotFound(
                 "dictionary type of choice require a 'name' key and a 'value' key"
             )
-        return processed_choices
 
     @property
     def selected_choice_index(self) -> int:
@@ -148,7 +189,43 @@ class InquirerPyUIListControl(FormattedTextControl):
 
     @choices.setter
     def choices(self, value: List[Dict[str, Any]]) -> None:
+        if isinstance(value, ChoiceStore):
+            self._selected = value.selected
+        else:
+            self._selected = SelectedIndices()
+            value = self._track_choices(value)
         self._choices = value
+        self._choice_fragments.clear()
+
+    def _track_choices(
+        self, choices: List[Dict[str, Any]], start: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Convert processed choices to :class:`~InquirerPy.base.selection.SelectableChoice`.
+
+        Changes of the `enabled` key are recorded in the positions of the enabled choices,
+        refer to :attr:`.InquirerPyUIListControl.selected_count`.
+
+        Args:
+            choices: Processed choices to track.
+            start: Position of the first choice in :attr:`.InquirerPyUIListControl.choices`.
+
+        Returns:
+            The tracked choices.
+        """
+        return [
+            SelectableChoice(choice, self._selected, index)
+            for index, choice in enumerate(choices, start)
+        ]
+
+    @property
+    def selected_count(self) -> int:
+        """int: Number of enabled choices, without scanning the choices."""
+        return len(self._selected)
+
+    @property
+    def selected_choices(self) -> List[Dict[str, Any]]:
+        """List[Dict[str, Any]]: Enabled choices in order, without scanning the choices."""
+        return [self.choices[index] for index in self._selected]
 
     def _safety_check(self) -> None:
         """Validate processed choices.
@@ -175,16 +252,85 @@ class InquirerPyUIListControl(FormattedTextControl):
         """
         display_choices = []
 
-        for index, choice in enumerate(self.choices):
-            if index == self.selected_choice_index:
-                display_choices += self._get_hover_text(choice)
-            else:
-                display_choices += self._get_normal_text(choice)
+        for index in self._get_viewport():
+            display_choices += self._get_choice_text(
+                index, self.choices[index], index == self.selected_choice_index
+            )
             display_choices.append(("", "\n"))
         if display_choices:
             display_choices.pop()
         return display_choices
 
+    def _get_viewport(self) -> range:
+        """Get the index of the choices to render.
+
+        The viewport holds up to :attr:`.InquirerPyUIListControl.max_lines` choices and
+        only scrolls when the selected choice moves out of it, the :class:`~prompt_toolkit.layout.Window`
+        never receives more lines than it can display.
+
+        Returns:
+            Index of the visible choices.
+        """
+        count = self.choice_count
+        height = count if self._max_lines is None else min(self._max_lines, count)
+
+        if (self._last_line - self._first_line) < height:
+            self._last_line = height
+            self._first_line = 0
+
+        if self._selected_choice_index <= self._first_line:
+            self._first_line = self._selected_choice_index
+            self._last_line = self._first_line + height
+        elif self._selected_choice_index >= self._last_line:
+            self._last_line = self._selected_choice_index + 1
+            self._first_line = self._last_line - height
+
+        if self._last_line > count:
+            self._last_line = count
+            self._first_line = self._last_line - height
+        if self._first_line < 0:
+            self._first_line = 0
+            self._last_line = height
+        return range(self._first_line, self._last_line)
+
+    def _get_fragment_key(self, choice: Dict[str, Any]) -> Hashable:
+        """Get the state of the `choice` which its formatted text depends on.
+
+        Args:
+            choice: The choice being displayed.
+
+        Returns:
+            Cached formatted text of the `choice` is reused while the key is unchanged.
+        """
+        return choice["name"], choice["enabled"], choice.get("instruction")
+
+    def _get_choice_text(
+        self, index: int, choice: Dict[str, Any], hovered: bool
+    ) -> List[Tuple[str, str]]:
+        """Get the formatted text of a single choice from the fragment cache.
+
+        The formatted text is only generated again when the choice changes hovered state
+        or its :meth:`.InquirerPyUIListControl._get_fragment_key` changes, moving the cursor
+        only generates the text of the newly hovered and unhovered choices once.
+
+        Args:
+            index: Index of the choice in :attr:`.InquirerPyUIListControl.choices`.
+            choice: The choice being displayed.
+            hovered: Indicate if the choice is the current highlighted choice.
+
+        Returns:
+            Formatted text in list of tuple format, the list should not be modified.
+        """
+        key = self._get_fragment_key(choice)
+        cached = self._choice_fragments.get((index, hovered))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        fragments = (
+            self._get_hover_text(choice) if hovered else self._get_normal_text(choice)
+        )
+        self._choice_fragments.set((index, hovered), (key, fragments))
+        return fragments
+
     def _format_choices(self) -> None:
         """Perform post processing on the choices.
 
@@ -210,6 +356,21 @@ class InquirerPyUIListControl(FormattedTextControl):
         """
         pass
 
+    @property
+    def max_lines(self) -> Optional[int]:
+        """Optional[int]: Maximum number of choices to render, all choices are rendered when None.
+
+        Prompts set this to the maximum height of the choice window so that rendering
+        does not depend on the number of choices.
+        """
+        return self._max_lines
+
+    @max_lines.setter
+    def max_lines(self, value: Optional[int]) -> None:
+        self._max_lines = value if value is None or value > 0 else 1
+        self._first_line = 0
+        self._last_line = 0
+
     @property
     def choice_count(self) -> int:
         """int: Total count of choices."""
@@ -7,7 +7,8 @@ from prompt_toolkit.keys import Keys
 
 from InquirerPy.base.complex import BaseComplexPrompt
 from InquirerPy.base.control import InquirerPyUIListControl
-from InquirerPy.separator import Separator
+from InquirerPy.history import FrecencyHistory
+from InquirerPy.profiler import Profiler
 from InquirerPy.utils import (
     InquirerPyKeybindings,
     InquirerPyMessage,
@@ -51,6 +52,8 @@ class BaseListPrompt(BaseComplexPrompt):
         mandatory: bool = True,
         mandatory_message: str = "Mandatory prompt",
         session_result: Optional[InquirerPySessionResult] = None,
+        profiler: Optional[Profiler] = None,
+        history: Optional[FrecencyHistory] = None,
     ) -> None:
         super().__init__(
             message=message,
@@ -70,12 +73,14 @@ class BaseListPrompt(BaseComplexPrompt):
             mandatory=mandatory,
             mandatory_message=mandatory_message,
             session_result=session_result,
+            profiler=profiler,
         )
 
         self._content_control: InquirerPyUIListControl
         self._multiselect = multiselect
         self._is_multiselect = Condition(lambda: self._multiselect)
         self._cycle = cycle
+        self._history = history
 
         if not keybindings:
             keybindings = {}
@@ -149,6 +154,47 @@ class BaseListPrompt(BaseComplexPrompt):
     def content_control(self, value: InquirerPyUIListControl) -> None:
         self._content_control = value
 
+    def _run(self) -> Any:
+        """Run the application and record the selected choices in the history."""
+        result = super()._run()
+        self._record_history()
+        return result
+
+    async def _run_async(self) -> Any:
+        """Run the application asynchronously and record the selected choices in the history."""
+        result = await super()._run_async()
+        self._record_history()
+        return result
+
+    def _instrument(self, profiler: Profiler) -> None:
+        """Time the formatting of the choices in addition to the operations of :class:`~InquirerPy.base.BaseComplexPrompt`.
+
+        Args:
+            profiler: Profiler to record the timings.
+        """
+        super()._instrument(profiler)
+        self.content_control.text = profiler.wrap(
+            "format_choices", self.content_control.text
+        )
+
+    def _record_history(self) -> None:
+        """Record the names of the selected choices when the prompt is answered.
+
+        Empty results, e.g. answering the fuzzy prompt without any match, are not recorded.
+        """
+        if (
+            self._history is None
+            or not self.status["answered"]
+            or self.status["skipped"]
+        ):
+            return
+        names = self.status["result"]
+        if not isinstance(names, list):
+            names = [names]
+        names = [name for name in names if name not in (None, "")]
+        if names:
+            self._history.record(names)
+
     @property
     def result_name(self) -> Any:
         """Get the result value that should be printed to the terminal.
@@ -179,12 +225,11 @@ class BaseListPrompt(BaseComplexPrompt):
 
     @property
     def selected_choices(self) -> List[Any]:
-        """List[Any]: Get all user selected choices."""
+        """List[Any]: Get all user selected choices.
 
-        def filter_choice(choice):
-            return not isinstance(choice, Separator) and choice["enabled"]
-
-        return list(filter(filter_choice, self.content_control.choices))
+        Refer to :attr:`~InquirerPy.base.control.InquirerPyUIListControl.selected_choices`.
+        """
+        return self.content_control.selected_choices
 
     def _handle_down(self, _) -> bool:
         """Handle event when user attempts to move down.
@@ -0,0 +1,127 @@
+"""Module contains the classes tracking the enabled choices of multiselect prompts."""
+from typing import Any, Iterator, Mapping, Set, Tuple
+
+__all__ = ["SelectedIndices", "SelectableChoice"]
+
+
+class SelectedIndices:
+    """Positions of the enabled choices.
+
+    Updated whenever the `enabled` key of a choice changes so that counting the
+    selected choices does not scan the choices.
+
+    Examples:
+        >>> selected = SelectedIndices()
+        >>> selected.update(3, True)
+        >>> selected.update(1, True)
+        >>> len(selected), list(selected)
+        (2, [1, 3])
+    """
+
+    def __init__(self) -> None:
+        self._indices: Set[int] = set()
+
+    def update(self, index: int, enabled: Any) -> None:
+        """Record the `enabled` state of the choice at `index`.
+
+        Args:
+            index: Position of the choice.
+            enabled: The `enabled` value of the choice.
+        """
+        if enabled:
+            self._indices.add(index)
+        else:
+            self._indices.discard(index)
+
+    def clear(self) -> None:
+        """Forget all enabled choices."""
+        self._indices.clear()
+
+    def __contains__(self, index: object) -> bool:
+        """Check if the choice at `index` is enabled."""
+        return index in self._indices
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate the positions of the enabled choices in order."""
+        return iter(sorted(self._indices))
+
+    def __len__(self) -> int:
+        """Get the number of enabled choices."""
+        return len(self._indices)
+
+
+class SelectableChoice(dict):
+    """A processed choice dictionary reporting changes of its `enabled` key.
+
+    Copying or pickling the choice produces a plain :class:`dict` which is no longer tracked.
+
+    Args:
+        choice: The processed choice.
+        selected: The positions of the enabled choices to keep up to date.
+        index: Position of the choice.
+    """
+
+    __slots__ = ("_selected", "_index")
+
+    def __init__(
+        self, choice: Mapping[str, Any], selected: SelectedIndices, index: int
+    ) -> None:
+        super().__init__(choice)
+        self._selected = selected
+        self._index = index
+        self._track()
+
+    def _track(self) -> None:
+        """Record the current `enabled` key in the selection."""
+        self._selected.update(self._index, self.get("enabled"))
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set the value of `key`, the `enabled` key is also recorded in the selection."""
+        super().__setitem__(key, value)
+        if key == "enabled":
+            self._track()
+
+    def __delitem__(self, key: str) -> None:
+        """Remove `key`, removing the `enabled` key deselects the choice."""
+        super().__delitem__(key)
+        if key == "enabled":
+            self._track()
+
+    def __ior__(self, other: Any) -> "SelectableChoice":
+        """Update the choice with `other` in place."""
+        self.update(other)
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the choice as a plain dictionary."""
+        return dict, (dict(self),)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Update the choice, the `enabled` key is also recorded in the selection."""
+        super().update(*args, **kwargs)
+        self._track()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Get the value of `key`, setting it to `default` when missing."""
+        value = super().setdefault(key, default)
+        if key == "enabled":
+            self._track()
+        return value
+
+    def pop(self, key: str, *args: Any) -> Any:
+        """Remove `key` and return its value, removing the `enabled` key deselects the choice."""
+        value = super().pop(key, *args)
+        if key == "enabled":
+            self._track()
+        return value
+
+    def popitem(self) -> Tuple[str, Any]:
+        """Remove the last inserted key and return it with its value."""
+        item = super().popitem()
+        self._track()
+        return item
+
+    def clear(self) -> None:
+        """Remove all keys, deselecting the choice."""
+        super().clear()
+        self._track()
@@ -18,7 +18,6 @@ from prompt_toolkit.enums import EditingMode
 from prompt_toolkit.filters.base import Condition, FilterOrBool
 from prompt_toolkit.key_binding.key_bindings import KeyBindings, KeyHandlerCallable
 from prompt_toolkit.keys import Keys
-from prompt_toolkit.styles.style import Style
 from prompt_toolkit.validation import Validator
 
 from InquirerPy.enum import INQUIRERPY_KEYBOARD_INTERRUPT
@@ -28,6 +27,7 @@ from InquirerPy.utils import (
     InquirerPySessionResult,
     InquirerPyStyle,
     InquirerPyValidate,
+    get_compiled_style,
     get_style,
 )
 
@@ -81,7 +81,7 @@ class BaseSimplePrompt(ABC):
         self._default = (
             default if not isinstance(default, Callable) else default(self._result)
         )
-        self._style = Style.from_dict(style.dict if style else get_style().dict)
+        self._style = get_compiled_style(style if style else get_style())
         self._qmark = qmark
         self._amark = amark
         self._status = {"answered": False, "result": None, "skipped": False}
@@ -0,0 +1,371 @@
+"""Contains the compact choice storage :class:`.ChoiceStore`."""
+import threading
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Sequence,
+    Union,
+    overload,
+)
+
+from InquirerPy.base.selection import SelectedIndices
+from InquirerPy.separator import Separator
+
+__all__ = ["ChoiceStore", "ChoiceView", "ChoiceNames"]
+
+_ENABLED = 1
+_SEPARATOR = 2
+_INSTRUCTION = 4
+
+_SAME_AS_NAME = object()
+
+
+class ChoiceView(MutableMapping):
+    """A dictionary like view of a single choice within a :class:`.ChoiceStore`.
+
+    Reading and writing the keys directly alters the store, the view itself only
+    holds the position of the choice.
+
+    Args:
+        store: The store containing the choice.
+        index: Position of the choice in the store.
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "ChoiceStore", index: int) -> None:
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the value of `key` from the store."""
+        return self._store._get_key(self._index, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set the value of `key` in the store."""
+        self._store._set_key(self._index, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove the additional `key` from the store."""
+        self._store._del_key(self._index, key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate the available keys of the choice."""
+        return iter(self._store._get_keys(self._index))
+
+    def __len__(self) -> int:
+        """Get the number of available keys of the choice."""
+        return len(self._store._get_keys(self._index))
+
+    def __repr__(self) -> str:
+        """Represent the choice as a dictionary."""
+        return repr(dict(self))
+
+
+class ChoiceStore(Sequence):
+    """A column oriented store of processed choices.
+
+    The names are joined into blocks of text with their end offsets kept in an
+    :class:`array.array`, values are kept in a parallel list and the `enabled` and
+    separator state in a :class:`bytearray`. Keys other than `name`, `value`, `enabled`
+    and `instruction` are kept per choice only when present. The positions of the enabled
+    choices are tracked in `selected`, a :class:`~InquirerPy.base.selection.SelectedIndices`.
+
+    Choices are accessed through :class:`.ChoiceView` which behaves like the choice
+    dictionary used by :class:`~InquirerPy.base.control.InquirerPyUIListControl`.
+
+    Names can be read from another thread while choices are appended.
+
+    Args:
+        choices: Processed choices to store.
+        block_size: Number of appended names to join into a single block of text.
+
+    Examples:
+        >>> store = ChoiceStore([{"name": "a", "value": 1, "enabled": False}])
+        >>> store[0]["name"], store[0]["value"]
+        ('a', 1)
+        >>> store[0]["enabled"] = True
+        >>> store[0]
+        {'name': 'a', 'value': 1, 'enabled': True}
+    """
+
+    def __init__(
+        self, choices: Iterable[Mapping[str, Any]] = (), block_size: int = 65536
+    ) -> None:
+        self.indexed = False
+        self._block_size = block_size if block_size > 0 else 1
+        self._blocks: List[str] = []
+        self._block_starts: List[int] = []
+        self._ends = array("Q")
+        self._pending: List[str] = []
+        self._values: List[Any] = []
+        self._flags = bytearray()
+        self._extras: Dict[int, Dict[str, Any]] = {}
+        self._separator_count = 0
+        self.selected = SelectedIndices()
+        self._lock = threading.Lock()
+        self.names = ChoiceNames(self)
+        self.extend(choices)
+
+    def append(self, choice: Mapping[str, Any]) -> None:
+        """Append a processed choice.
+
+        Args:
+            choice: Choice dictionary containing the `name`, `value` and `enabled` key.
+        """
+        index = len(self._values)
+        name = choice["name"]
+        value = choice["value"]
+        flags = _ENABLED if choice["enabled"] else 0
+        self.selected.update(index, flags)
+        if isinstance(value, Separator):
+            flags |= _SEPARATOR
+            self._separator_count += 1
+        if len(choice) > 3:
+            extras = {
+                key: item
+                for key, item in choice.items()
+                if key not in {"name", "value", "enabled", "index"}
+            }
+            if "instruction" in extras and extras["instruction"] is None:
+                flags |= _INSTRUCTION
+                del extras["instruction"]
+            if extras:
+                self._extras[index] = extras
+        with self._lock:
+            self._pending.append(name)
+            if len(self._pending) >= self._block_size:
+                self._flush()
+        self._values.append(
+            _SAME_AS_NAME if isinstance(value, str) and value == name else value
+        )
+        self._flags.append(flags)
+
+    def extend(self, choices: Iterable[Mapping[str, Any]]) -> None:
+        """Append processed choices.
+
+        Args:
+            choices: Choice dictionaries, refer to :meth:`.ChoiceStore.append`.
+        """
+        for choice in choices:
+            self.append(choice)
+
+    def _flush(self) -> None:
+        """Join the pending names into a new block of text, requires holding the lock.
+
+        The end offsets are extended last so that names below `len(self._ends)` can
+        be read without holding the lock.
+        """
+        if not self._pending:
+            return
+        self._blocks.append("".join(self._pending))
+        self._block_starts.append(len(self._ends))
+        self._ends.extend(accumulate(len(name) for name in self._pending))
+        self._pending = []
+
+    def get_name(self, index: int) -> str:
+        """Get the name of the choice at `index`.
+
+        Args:
+            index: Position of the choice.
+
+        Returns:
+            Name of the choice.
+        """
+        ends = self._ends
+        if index >= len(ends):
+            with self._lock:
+                self._flush()
+        starts = self._block_starts
+        block = bisect_right(starts, index) - 1
+        start = 0 if index == starts[block] else ends[index - 1]
+        return self._blocks[block][start : ends[index]]
+
+    def get_names(self, start: int, stop: int) -> List[str]:
+        """Get the names of the choices from `start` to `stop`.
+
+        Slicing the text blocks directly is considerably faster than obtaining the
+        names one by one with :meth:`.ChoiceStore.get_name`.
+
+        Args:
+            start: Position of the first choice.
+            stop: Position after the last choice.
+
+        Returns:
+            Names of the choices.
+        """
+        ends = self._ends
+        if stop > len(ends):
+            with self._lock:
+                self._flush()
+        starts = self._block_starts
+        names: List[str] = []
+        index = start
+        block = bisect_right(starts, index) - 1
+        while index < stop:
+            block_stop = starts[block + 1] if block + 1 < len(starts) else stop
+            text = self._blocks[block]
+            offset = 0 if index == starts[block] else ends[index - 1]
+            for end in ends[index : min(stop, block_stop)]:
+                names.append(text[offset:end])
+                offset = end
+            index = block_stop
+            block += 1
+        return names
+
+    def get_value(self, index: int) -> Any:
+        """Get the value of the choice at `index`.
+
+        Args:
+            index: Position of the choice.
+
+        Returns:
+            Value of the choice.
+        """
+        value = self._values[index]
+        return self.get_name(index) if value is _SAME_AS_NAME else value
+
+    def _get_key(self, index: int, key: str) -> Any:
+        """Get the value of `key` for the choice at `index`."""
+        if key == "name":
+            return self.get_name(index)
+        if key == "value":
+            return self.get_value(index)
+        if key == "enabled":
+            return bool(self._flags[index] & _ENABLED)
+        if key == "index" and self.indexed:
+            return index
+        if key == "instruction" and self._flags[index] & _INSTRUCTION:
+            return None
+        extras = self._extras.get(index)
+        if extras is None or key not in extras:
+            raise KeyError(key)
+        return extras[key]
+
+    def _set_key(self, index: int, key: str, value: Any) -> None:
+        """Set the value of `key` for the choice at `index`."""
+        if key == "enabled":
+            if value:
+                self._flags[index] |= _ENABLED
+            else:
+                self._flags[index] &= ~_ENABLED
+            self.selected.update(index, value)
+        elif key == "value":
+            if isinstance(self._values[index], Separator):
+                self._separator_count -= 1
+                self._flags[index] &= ~_SEPARATOR
+            if isinstance(value, Separator):
+                self._separator_count += 1
+                self._flags[index] |= _SEPARATOR
+            self._values[index] = value
+        elif key == "index" and self.indexed and value == index:
+            pass
+        elif key in {"name", "index"}:
+            raise KeyError(f"choice key '{key}' cannot be altered in the store")
+        else:
+            if key == "instruction":
+                self._flags[index] &= ~_INSTRUCTION
+            self._extras.setdefault(index, {})[key] = value
+
+    def _del_key(self, index: int, key: str) -> None:
+        """Remove the additional `key` of the choice at `index`."""
+        if key == "instruction" and self._flags[index] & _INSTRUCTION:
+            self._flags[index] &= ~_INSTRUCTION
+            return
+        extras = self._extras.get(index, {})
+        if key not in extras:
+            raise KeyError(key)
+        del extras[key]
+        if not extras:
+            del self._extras[index]
+
+    def _get_keys(self, index: int) -> List[str]:
+        """Get the available keys of the choice at `index`."""
+        keys = ["name", "value", "enabled"]
+        if self._flags[index] & _INSTRUCTION:
+            keys.append("instruction")
+        if self.indexed:
+            keys.append("index")
+        keys.extend(self._extras.get(index, ()))
+        return keys
+
+    @property
+    def separator_count(self) -> int:
+        """int: Number of :class:`~InquirerPy.separator.Separator` choices."""
+        return self._separator_count
+
+    @overload
+    def __getitem__(self, index: int) -> ChoiceView:
+        """Get the view of the choice at `index`."""
+
+    @overload
+    def __getitem__(self, index: slice) -> List[ChoiceView]:
+        """Get the views of the choices within the `index` slice."""
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[ChoiceView, List[ChoiceView]]:
+        """Get the view of the choice at `index`."""
+        if isinstance(index, slice):
+            return [ChoiceView(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("choice index out of range")
+        return ChoiceView(self, index)
+
+    def __len__(self) -> int:
+        """Get the number of choices."""
+        return len(self._values)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the choices with another sequence of choices."""
+        if isinstance(other, (list, ChoiceStore)):
+            return len(self) == len(other) and all(
+                choice == other_choice for choice, other_choice in zip(self, other)
+            )
+        return NotImplemented
+
+
+class ChoiceNames(Sequence):
+    """A read only sequence of the choice names in a :class:`.ChoiceStore`.
+
+    Args:
+        store: The store containing the choices.
+    """
+
+    def __init__(self, store: ChoiceStore) -> None:
+        self._store = store
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        """Get the name of the choice at `index`."""
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]:
+        """Get the names of the choices within the `index` slice."""
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        """Get the name of the choice at `index`."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._store))
+            if step == 1:
+                return self._store.get_names(start, stop)
+            return [self._store.get_name(i) for i in range(start, stop, step)]
+        if index < 0:
+            index += len(self._store)
+        if index < 0 or index >= len(self._store):
+            raise IndexError("choice index out of range")
+        return self._store.get_name(index)
+
+    def __len__(self) -> int:
+        """Get the number of choices."""
+        return len(self._store)
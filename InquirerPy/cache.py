@@ -0,0 +1,115 @@
+"""Module contains the bounded cache class :class:`.LRUCache`."""
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+__all__ = ["LRUCache"]
+
+
+class LRUCache:
+    """A least recently used cache bounded by entry count and total size.
+
+    When either of the limit is exceeded, the least recently used entries are
+    evicted until the cache is back within the budget.
+
+    Args:
+        max_entries: Maximum number of entries to keep. Set to 0 to disable the cache.
+        max_size: Maximum total size of all the entries measured by `sizeof`.
+            If not provided, only `max_entries` will be used to bound the cache.
+        sizeof: Function to measure the size of a value. Each entry is counted as 1 by default.
+
+    Examples:
+        >>> cache = LRUCache(max_entries=2)
+        >>> cache.set("a", 1)
+        >>> cache.set("b", 2)
+        >>> cache.get("a")
+        1
+        >>> cache.set("c", 3)
+        >>> "b" in cache
+        False
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_size: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_size = max_size
+        self._sizeof = sizeof or (lambda _: 1)
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes = {}
+        self._size = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the value of `key` and mark it as most recently used.
+
+        Args:
+            key: Key of the entry.
+            default: Value to return when the `key` is not cached.
+
+        Returns:
+            The cached value or `default`.
+        """
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            return default
+        return self._entries[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache the `value` under `key` and evict entries exceeding the budget.
+
+        Values larger than `max_size` by themselves are not cached.
+
+        Args:
+            key: Key of the entry.
+            value: Value to cache.
+        """
+        if self._max_entries <= 0:
+            return
+        size = self._sizeof(value)
+        if self._max_size is not None and size > self._max_size:
+            return
+        self.pop(key)
+        self._entries[key] = value
+        self._sizes[key] = size
+        self._size += size
+        while len(self._entries) > self._max_entries or (
+            self._max_size is not None and self._size > self._max_size
+        ):
+            self.pop(next(iter(self._entries)))
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove the entry of `key` from the cache.
+
+        Args:
+            key: Key of the entry.
+            default: Value to return when the `key` is not cached.
+
+        Returns:
+            The removed value or `default`.
+        """
+        if key not in self._entries:
+            return default
+        self._size -= self._sizes.pop(key)
+        return self._entries.pop(key)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._sizes.clear()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """int: Total size of all the cached entries."""
+        return self._size
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if `key` is cached without altering the usage order."""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Get the number of cached entries."""
+        return len(self._entries)
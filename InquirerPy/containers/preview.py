@@ -0,0 +1,144 @@
+"""Module contains :class:`.PreviewWindow` which displays the preview of the highlighted choice."""
+import asyncio
+import inspect
+from functools import partial
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Union
+
+from prompt_toolkit.application.current import get_app
+from prompt_toolkit.layout.containers import Window
+from prompt_toolkit.layout.controls import FormattedTextControl
+
+from InquirerPy.cache import LRUCache
+
+if TYPE_CHECKING:
+    from prompt_toolkit.formatted_text.base import AnyFormattedText
+
+__all__ = ["PreviewWindow", "InquirerPyPreview"]
+
+InquirerPyPreview = Callable[[Any], Union[str, Awaitable[str]]]
+
+PREVIEW_CACHE_SIZE = 128
+PREVIEW_CACHE_BUDGET = 10000000
+
+
+class PreviewControl(FormattedTextControl):
+    """A :class:`~prompt_toolkit.layout.FormattedTextControl` displaying the preview of a choice.
+
+    The preview of a choice is generated in the background the first time the choice is
+    highlighted, sync callables run in the default executor of the event loop and async
+    callables run on the event loop. Generating a preview is cancelled once another choice
+    is highlighted, a sync callable still runs to completion in its thread but its result is
+    discarded.
+
+    Args:
+        preview: Callable to generate the preview text with the value of the highlighted choice.
+        get_choice: Callable to get the highlighted choice, None if no choice is highlighted.
+        cache_size: Number of previews to keep in memory.
+        cache_budget: Maximum total length of the previews kept in memory.
+    """
+
+    def __init__(
+        self,
+        preview: InquirerPyPreview,
+        get_choice: Callable[[], Optional[Dict[str, Any]]],
+        cache_size: int = PREVIEW_CACHE_SIZE,
+        cache_budget: Optional[int] = PREVIEW_CACHE_BUDGET,
+    ) -> None:
+        self._preview = preview
+        self._get_choice = get_choice
+        self._cache = LRUCache(
+            max_entries=cache_size, max_size=cache_budget, sizeof=len
+        )
+        self._pending: Optional[int] = None
+        self._task: Optional["asyncio.Future[str]"] = None
+        self._error: Optional[str] = None
+        super().__init__(text=self._get_text)
+
+    def _get_text(self) -> "AnyFormattedText":
+        """Get the preview of the highlighted choice, start generating it if not cached.
+
+        Returns:
+            FormattedText in list of tuple format, empty while the preview is generated.
+        """
+        choice = self._get_choice()
+        if choice is None:
+            self.cancel()
+            return []
+        key = choice["index"]
+        text = self._cache.get(key)
+        if text is not None:
+            self.cancel()
+            return [("class:fuzzy_preview", text)]
+        if key != self._pending:
+            self.cancel()
+            self._pending = key
+            self._error = None
+            self._task = asyncio.ensure_future(self._generate(choice["value"]))
+            self._task.add_done_callback(partial(self._on_generated, key))
+        if self._error is not None:
+            return [("class:fuzzy_preview", self._error)]
+        return []
+
+    async def _generate(self, value: Any) -> str:
+        """Run the preview callable without blocking the event loop.
+
+        Args:
+            value: Value of the highlighted choice.
+
+        Returns:
+            The preview text.
+        """
+        if inspect.iscoroutinefunction(self._preview):
+            result = await self._preview(value)
+        else:
+            result = await asyncio.get_event_loop().run_in_executor(
+                None, self._preview, value
+            )
+            if inspect.isawaitable(result):
+                result = await result
+        return str(result)
+
+    def _on_generated(self, key: int, task: "asyncio.Future[str]") -> None:
+        """Cache the generated preview of the choice at `key` and redraw the application."""
+        if task.cancelled() or key != self._pending:
+            return
+        self._task = None
+        exception = task.exception()
+        if exception is not None:
+            self._error = str(exception)
+        else:
+            self._pending = None
+            self._cache.set(key, task.result())
+        get_app().invalidate()
+
+    def cancel(self) -> None:
+        """Cancel generating the pending preview."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._pending = None
+        self._error = None
+
+
+class PreviewWindow(Window):
+    """`prompt_toolkit` :class:`~prompt_toolkit.layout.Window` that displays the preview of the highlighted choice.
+
+    Style the preview with the `fuzzy_preview` class.
+
+    Args:
+        preview: Callable to generate the preview text with the value of the highlighted choice.
+        get_choice: Callable to get the highlighted choice, None if no choice is highlighted.
+        cache_size: Number of previews to keep in memory.
+    """
+
+    def __init__(
+        self,
+        preview: InquirerPyPreview,
+        get_choice: Callable[[], Optional[Dict[str, Any]]],
+        cache_size: int = PREVIEW_CACHE_SIZE,
+        **kwargs
+    ) -> None:
+        self.control = PreviewControl(
+            preview=preview, get_choice=get_choice, cache_size=cache_size
+        )
+        super().__init__(content=self.control, **kwargs)
@@ -0,0 +1,214 @@
+"""Module contains the class :class:`.FrecencyHistory` which remembers the selected choices."""
+import json
+import os
+import time
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+__all__ = ["FrecencyHistory", "PromotedChoices"]
+
+HALF_LIFE = 7 * 24 * 60 * 60
+
+
+class FrecencyHistory:
+    """Selections of a prompt kept in an append-only log file.
+
+    Each selected choice name appends a line to the file, the file is shared by prompts
+    with different `key`. The frecency of a name is the sum of its selections, each
+    decaying by half every `half_life` seconds, so both recent and frequent selections
+    rank high.
+
+    The file is only read when the frecency is first requested. Once the file holds
+    more than twice `max_entries` selections of each key on average, it is compacted
+    to the newest `max_entries` selections of each key.
+
+    Args:
+        path: Path to the history file, created on the first selection.
+        key: Identifier of the prompt whose selections are recorded.
+        max_entries: Maximum number of selections of each key kept when compacting.
+        half_life: Number of seconds for a selection to lose half of its weight.
+
+    Examples:
+        >>> history = FrecencyHistory("~/.cache/mytool/history", key="deploy-target")
+        >>> prompt = FuzzyPrompt(message="Target:", choices=targets, history=history)  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        path: str,
+        key: str,
+        max_entries: int = 1000,
+        half_life: float = HALF_LIFE,
+    ) -> None:
+        self._path = os.path.expanduser(path)
+        self._key = key
+        self._max_entries = max_entries if max_entries > 0 else 1
+        self._half_life = half_life if half_life > 0 else HALF_LIFE
+        self._entries: Optional[List[Tuple[float, str]]] = None
+        self._counts: Counter = Counter()
+        self._frecency: Optional[Dict[str, float]] = None
+
+    def _load(self) -> List[Tuple[float, str]]:
+        """Read the selections of `key` from the history file."""
+        if self._entries is not None:
+            return self._entries
+        self._entries = []
+        self._counts = Counter()
+        try:
+            with open(self._path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        timestamp, key, name = json.loads(line)
+                    except ValueError:
+                        continue
+                    self._counts[key] += 1
+                    if key == self._key:
+                        self._entries.append((float(timestamp), str(name)))
+        except OSError:
+            pass
+        return self._entries
+
+    def get_frecency(self) -> Dict[str, float]:
+        """Get the frecency of the choice names selected before.
+
+        Returns:
+            Frecency of each previously selected name, names never selected are absent.
+        """
+        if self._frecency is None:
+            now = time.time()
+            frecency: DefaultDict[str, float] = defaultdict(float)
+            for timestamp, name in self._load():
+                frecency[name] += 0.5 ** (max(now - timestamp, 0) / self._half_life)
+            self._frecency = dict(frecency)
+        return self._frecency
+
+    def record(self, names: Iterable[str]) -> None:
+        """Append the selected choice names to the history file.
+
+        The history is best effort, the selections are not recorded in the file when
+        it cannot be written.
+
+        Args:
+            names: Names of the selected choices.
+        """
+        entries = self._load()
+        timestamp = time.time()
+        lines = []
+        for name in names:
+            entries.append((timestamp, name))
+            lines.append(json.dumps([timestamp, self._key, name]) + "\n")
+        if not lines:
+            return
+        self._counts[self._key] += len(lines)
+        self._frecency = None
+        try:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self._path, "a", encoding="utf-8") as file:
+                file.write("".join(lines))
+        except OSError:
+            return
+        if sum(self._counts.values()) > 2 * self._max_entries * len(self._counts):
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the history file with the newest `max_entries` selections of each key.
+
+        The history file is left unchanged when it cannot be rewritten.
+        """
+        try:
+            with open(self._path, encoding="utf-8") as file:
+                lines = file.readlines()
+        except OSError:
+            return
+        kept: DefaultDict[str, List[str]] = defaultdict(list)
+        for line in reversed(lines):
+            try:
+                _, key, _ = json.loads(line)
+            except ValueError:
+                continue
+            if len(kept[key]) < self._max_entries:
+                kept[key].append(line)
+        compacted = sorted(
+            (line for key_lines in kept.values() for line in key_lines),
+            key=lambda line: json.loads(line)[0],
+        )
+        temporary = "%s.%d.tmp" % (self._path, os.getpid())
+        try:
+            with open(temporary, "w", encoding="utf-8") as file:
+                file.writelines(compacted)
+            os.replace(temporary, self._path)
+        except OSError:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            return
+        self._counts = Counter({key: len(key_lines) for key, key_lines in kept.items()})
+        self._entries = None
+        self._frecency = None
+
+
+class PromotedChoices(Sequence):
+    """A view of the choices with the promoted choices moved to the front.
+
+    The remaining choices keep their order and are located by their position without
+    copying or sorting the choices. Choices appended to `choices` later are visible
+    at the end.
+
+    Args:
+        choices: All processed choices.
+        promoted: Index of the choices to move to the front, in the order to display.
+
+    Examples:
+        >>> list(PromotedChoices(["a", "b", "c", "d"], [2, 0]))
+        ['c', 'a', 'b', 'd']
+    """
+
+    def __init__(self, choices: Sequence[Any], promoted: List[int]) -> None:
+        self._choices = choices
+        self._promoted = promoted
+        self._sorted = sorted(promoted)
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        """Get the choice displayed at `index`."""
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]:
+        """Get the choices displayed within the `index` slice."""
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Any, List[Any]]:
+        """Get the choice displayed at `index`."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("choice index out of range")
+        if index < len(self._promoted):
+            return self._choices[self._promoted[index]]
+        position = index - len(self._promoted)
+        actual = position
+        while True:
+            skipped = bisect_right(self._sorted, actual)
+            if position + skipped == actual:
+                return self._choices[actual]
+            actual = position + skipped
+
+    def __len__(self) -> int:
+        """Get the number of choices."""
+        return len(self._choices)
@@ -4,7 +4,10 @@ See Also:
     :ref:`index:Alternate Syntax`.
 
 `inquirer` directly interact with individual prompt classes. It’s more flexible, easier to customise and also provides IDE type hintings/completions.
+
+The prompt modules are imported on first use, e.g. `inquirer.confirm` does not import the fuzzy prompt.
 """
+from typing import TYPE_CHECKING, Any, List
 
 __all__ = [
     "checkbox",
@@ -19,13 +22,43 @@ __all__ = [
     "secret",
 ]
 
-from InquirerPy.prompts import CheckboxPrompt as checkbox
-from InquirerPy.prompts import ConfirmPrompt as confirm
-from InquirerPy.prompts import ExpandPrompt as expand
-from InquirerPy.prompts import FilePathPrompt as filepath
-from InquirerPy.prompts import FuzzyPrompt as fuzzy
-from InquirerPy.prompts import InputPrompt as text
-from InquirerPy.prompts import ListPrompt as select
-from InquirerPy.prompts import NumberPrompt as number
-from InquirerPy.prompts import RawlistPrompt as rawlist
-from InquirerPy.prompts import SecretPrompt as secret
+if TYPE_CHECKING:
+    from InquirerPy.prompts import CheckboxPrompt as checkbox
+    from InquirerPy.prompts import ConfirmPrompt as confirm
+    from InquirerPy.prompts import ExpandPrompt as expand
+    from InquirerPy.prompts import FilePathPrompt as filepath
+    from InquirerPy.prompts import FuzzyPrompt as fuzzy
+    from InquirerPy.prompts import InputPrompt as text
+    from InquirerPy.prompts import ListPrompt as select
+    from InquirerPy.prompts import NumberPrompt as number
+    from InquirerPy.prompts import RawlistPrompt as rawlist
+    from InquirerPy.prompts import SecretPrompt as secret
+
+_PROMPT_CLASSES = {
+    "checkbox": "CheckboxPrompt",
+    "confirm": "ConfirmPrompt",
+    "expand": "ExpandPrompt",
+    "filepath": "FilePathPrompt",
+    "fuzzy": "FuzzyPrompt",
+    "text": "InputPrompt",
+    "select": "ListPrompt",
+    "number": "NumberPrompt",
+    "rawlist": "RawlistPrompt",
+    "secret": "SecretPrompt",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the prompt class of `name` on first access."""
+    if name not in _PROMPT_CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from InquirerPy import prompts
+
+    value = getattr(prompts, _PROMPT_CLASSES[name])
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the prompts including the ones not imported yet."""
+    return sorted(set(globals()) | set(__all__))
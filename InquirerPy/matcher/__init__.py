@@ -0,0 +1,41 @@
+"""Module contains the matchers used to score choices for :class:`~InquirerPy.prompts.fuzzy.FuzzyPrompt`.
+
+:class:`~InquirerPy.matcher.vectorized.VectorizedMatcher` is imported on first access so that :mod:`numpy`
+is only imported when the numpy backend is used.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+__all__ = [
+    "Matcher",
+    "ExecutorMatcher",
+    "VectorizedMatcher",
+    "RankedChoices",
+    "score_chunk",
+    "heap_chunk",
+    "fzy_score",
+    "substr_score",
+    "get_score_only",
+]
+
+from .base import Matcher
+from .executor import ExecutorMatcher
+from .ranked import RankedChoices
+from .score import fzy_score, get_score_only, heap_chunk, score_chunk, substr_score
+
+if TYPE_CHECKING:
+    from .vectorized import VectorizedMatcher
+
+
+def __getattr__(name: str) -> Any:
+    """Import :class:`~InquirerPy.matcher.vectorized.VectorizedMatcher` on first access."""
+    if name != "VectorizedMatcher":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.vectorized"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the matchers including the ones not imported yet."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,148 @@
+"""Module contains the base class :class:`.Matcher` which scores choices on the event loop."""
+import asyncio
+from typing import Callable, List, Optional, Sequence, Union
+
+from pfzy.score import substr_scorer
+from pfzy.types import SCORE_INDICES
+
+from InquirerPy.matcher.ngram import TrigramIndex
+from InquirerPy.matcher.prefilter import CharacterIndex
+from InquirerPy.matcher.score import MATCHES, heap_chunk
+
+__all__ = ["Matcher"]
+
+
+class Matcher:
+    """Score choice names chunk by chunk on the running event loop.
+
+    The event loop is given a chance to process other events between chunks, which
+    is also where a cancelled query stops.
+
+    Candidates missing any character of the needle are rejected before scoring once
+    the names are indexed, refer to :meth:`.Matcher.build_index`.
+
+    Args:
+        names: All choice names. Names appended to the sequence later are scored as well,
+            refer to :meth:`.Matcher.on_extend`.
+        chunk_size: Number of names to score in each chunk.
+        exact_index: Build a :class:`~InquirerPy.matcher.ngram.TrigramIndex` in the background
+            on the first match using :func:`~pfzy.score.substr_scorer`. Exact matches only
+            score the candidates found in the index once the names are indexed.
+    """
+
+    def __init__(
+        self, names: Sequence[str], chunk_size: int = 10000, exact_index: bool = False
+    ) -> None:
+        self._names = names
+        self._chunk_size = chunk_size if chunk_size > 0 else 1
+        self._index = CharacterIndex()
+        self._trigrams = TrigramIndex() if exact_index else None
+        self._trigram_task: Optional["asyncio.Future[None]"] = None
+
+    async def match(
+        self,
+        needle: str,
+        scorer: Callable[[str, str], SCORE_INDICES],
+        candidates: Optional[Sequence[int]] = None,
+        on_chunk: Optional[Callable[[MATCHES, int], None]] = None,
+    ) -> List[MATCHES]:
+        """Score the `needle` against the names of `candidates`.
+
+        Args:
+            needle: The query to match.
+            scorer: Scorer used to calculate the score.
+            candidates: Index of the names to score. Score all names if not provided.
+            on_chunk: Callback to run after each chunk is scored with the heap of the chunk
+                and the number of candidates scored in the chunk.
+
+        Returns:
+            List of heaps, one for each chunk. Refer to :func:`~InquirerPy.matcher.score.heap_chunk`.
+        """
+        candidates = self._prune(needle, scorer, candidates, on_chunk)
+        if candidates is None:
+            candidates = range(len(self._names))
+        result = []
+        for offset in range(0, len(candidates), self._chunk_size):
+            if offset:
+                await asyncio.sleep(0)
+            chunk = candidates[offset : offset + self._chunk_size]
+            heap = self._heap_chunk(scorer, needle, chunk)
+            result.append(heap)
+            if on_chunk is not None:
+                on_chunk(heap, len(chunk))
+        return result
+
+    def _heap_chunk(
+        self,
+        scorer: Callable[[str, str], SCORE_INDICES],
+        needle: str,
+        candidates: Sequence[int],
+    ) -> MATCHES:
+        """Score a single chunk of candidates, refer to :func:`~InquirerPy.matcher.score.heap_chunk`."""
+        return heap_chunk(
+            scorer, needle, self._names, self._index.filter(needle, scorer, candidates)
+        )
+
+    def _prune(
+        self,
+        needle: str,
+        scorer: Callable[[str, str], SCORE_INDICES],
+        candidates: Optional[Sequence[int]],
+        on_chunk: Optional[Callable[[MATCHES, int], None]],
+    ) -> Optional[Sequence[int]]:
+        """Remove the candidates of an exact match which are not found in the trigram index.
+
+        The index is built in the background on first use, a tenth of a chunk at a time
+        since indexing a name costs several times more than scoring it. The removed
+        candidates are reported to `on_chunk` as scanned without any match.
+        """
+        if self._trigrams is None or scorer is not substr_scorer:
+            return candidates
+        if len(self._trigrams) < len(self._names) and (
+            self._trigram_task is None or self._trigram_task.done()
+        ):
+            self._trigram_task = asyncio.ensure_future(
+                self._index_names(self._trigrams, max(self._chunk_size // 10, 1))
+            )
+        if candidates is None:
+            candidates = range(len(self._names))
+        pruned = self._trigrams.filter(needle, candidates)
+        if on_chunk is not None and len(pruned) < len(candidates):
+            on_chunk([], len(candidates) - len(pruned))
+        return pruned
+
+    async def _index_names(
+        self, index: Union[CharacterIndex, TrigramIndex], step: int
+    ) -> None:
+        """Add the names which are not indexed yet to the `index`, `step` names at a time."""
+        while len(index) < len(self._names):
+            start = len(index)
+            index.extend(self._names[start : start + step])
+            await asyncio.sleep(0)
+
+    async def build_index(self) -> None:
+        """Index the names which are not indexed yet chunk by chunk.
+
+        Refer to :class:`~InquirerPy.matcher.prefilter.CharacterIndex`. The names are
+        scored without the index until they are indexed.
+        """
+        await self._index_names(self._index, self._chunk_size)
+
+    def on_extend(self, names: Sequence[str]) -> None:
+        """Handle the names appended to the end of the names sequence.
+
+        The names sequence is shared with the caller, which appends the names of the
+        newly added choices to it directly. The appended names are indexed right away
+        if all previous names are indexed.
+
+        Args:
+            names: The appended names.
+        """
+        for index in (self._index, self._trigrams):
+            if index is not None and len(index) == len(self._names) - len(names):
+                index.extend(names)
+
+    def close(self) -> None:
+        """Release the resources held by the matcher."""
+        if self._trigram_task is not None:
+            self._trigram_task.cancel()
@@ -0,0 +1,238 @@
+"""Module contains the class :class:`.ExecutorMatcher` to score choices off the event loop."""
+import asyncio
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List, Optional, Sequence
+
+from pfzy.types import SCORE_INDICES
+
+from InquirerPy.exceptions import InvalidArgument
+from InquirerPy.matcher.base import Matcher
+from InquirerPy.matcher.prefilter import CharacterIndex
+from InquirerPy.matcher.score import MATCHES, heap_chunk
+
+__all__ = ["ExecutorMatcher"]
+
+_RESIDENT_NAMES: List[str] = []
+_RESIDENT_OFFSET: int = 0
+_RESIDENT_INDEX = CharacterIndex()
+
+
+def _load_names(names: List[str], offset: int) -> None:
+    """Keep a resident copy of the choice names shard and its index in the worker process."""
+    global _RESIDENT_NAMES, _RESIDENT_OFFSET, _RESIDENT_INDEX
+    _RESIDENT_NAMES = names
+    _RESIDENT_OFFSET = offset
+    _RESIDENT_INDEX = CharacterIndex()
+    _RESIDENT_INDEX.extend(names)
+
+
+def _extend_names(names: List[str]) -> None:
+    """Append names to the resident copy of the worker process."""
+    _RESIDENT_NAMES.extend(names)
+    _RESIDENT_INDEX.extend(names)
+
+
+def _heap_resident_chunk(
+    scorer: Callable[[str, str], SCORE_INDICES],
+    needle: str,
+    candidates: Sequence[int],
+) -> MATCHES:
+    """Score the candidates against the resident names of the worker process."""
+    return heap_chunk(
+        scorer,
+        needle,
+        _RESIDENT_NAMES,
+        _RESIDENT_INDEX.filter(needle, scorer, candidates, _RESIDENT_OFFSET),
+        _RESIDENT_OFFSET,
+    )
+
+
+class ExecutorMatcher(Matcher):
+    """Score choice names in chunks using a thread or process pool.
+
+    The choice names are sent to the pool once, each query then only sends the
+    needle and the candidate indices. Chunks are submitted one at a time so that
+    cancelling the awaiting task stops the scoring after the current chunk.
+
+    When using "process" with more than 1 worker, the names are partitioned into
+    shards and each worker process only keeps its own shard. The matches of each
+    chunk are arranged into a heap within the worker, the final ordering is identical
+    to scoring with a single worker. Names appended after the pools are started
+    belong to the last shard.
+
+    Args:
+        names: All choice names.
+        executor: Type of the pool, either "thread" or "process".
+        chunk_size: Number of names to score in each chunk.
+        workers: Number of worker processes to shard the names across.
+        exact_index: Build a trigram index for exact matches, refer to :class:`~InquirerPy.matcher.Matcher`.
+
+    Raises:
+        InvalidArgument: When the `executor` is not "thread" nor "process" or requesting
+            multiple workers for "thread".
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        executor: str = "thread",
+        chunk_size: int = 10000,
+        workers: int = 1,
+        exact_index: bool = False,
+    ) -> None:
+        if executor not in {"thread", "process"}:
+            raise InvalidArgument(
+                "argument executor should be either 'thread' or 'process'"
+            )
+        if executor == "thread" and workers > 1:
+            raise InvalidArgument(
+                "argument workers requires executor to be 'process' to use multiple cores"
+            )
+        super().__init__(names=names, chunk_size=chunk_size, exact_index=exact_index)
+        self._kind = executor
+        self._max_workers = max(workers, 1)
+        self._shard_size = 1
+        self._executors: List[Optional[Executor]] = [None]
+        self._partition()
+
+    def _partition(self) -> None:
+        """Split the names into evenly sized shards, one for each worker."""
+        self._shard_size = max(math.ceil(len(self._names) / self._max_workers), 1)
+        self._executors = [None] * max(
+            math.ceil(len(self._names) / self._shard_size), 1
+        )
+
+    @property
+    def workers(self) -> int:
+        """int: Number of shards, each scored by its own worker."""
+        return len(self._executors)
+
+    def _get_shard_range(self, shard: int) -> range:
+        """Get the index range of the names in the `shard`."""
+        start = shard * self._shard_size
+        if shard == self.workers - 1:
+            return range(start, len(self._names))
+        return range(start, min(start + self._shard_size, len(self._names)))
+
+    def _get_executor(self, shard: int) -> Executor:
+        """Get the pool of the `shard`, created on first use."""
+        executor = self._executors[shard]
+        if executor is None:
+            if self._kind == "thread":
+                executor = ThreadPoolExecutor(max_workers=1)
+            else:
+                shard_range = self._get_shard_range(shard)
+                executor = ProcessPoolExecutor(
+                    max_workers=1,
+                    initializer=_load_names,
+                    initargs=(
+                        self._names[shard_range.start : shard_range.stop],
+                        shard_range.start,
+                    ),
+                )
+            self._executors[shard] = executor
+        return executor
+
+    def _get_shard_candidates(
+        self, candidates: Optional[Sequence[int]]
+    ) -> List[Sequence[int]]:
+        """Partition the candidates by the shard they belong to."""
+        if candidates is None:
+            return [self._get_shard_range(shard) for shard in range(self.workers)]
+        if self.workers == 1:
+            return [candidates]
+        last = self.workers - 1
+        shard_candidates: List[List[int]] = [[] for _ in range(self.workers)]
+        for index in candidates:
+            shard_candidates[min(index // self._shard_size, last)].append(index)
+        return shard_candidates
+
+    async def _match_shard(
+        self,
+        shard: int,
+        needle: str,
+        scorer: Callable[[str, str], SCORE_INDICES],
+        candidates: Sequence[int],
+        on_chunk: Optional[Callable[[MATCHES, int], None]],
+    ) -> List[MATCHES]:
+        """Score the candidates of a single shard chunk by chunk."""
+        loop = asyncio.get_event_loop()
+        executor = self._get_executor(shard)
+        result = []
+        for offset in range(0, len(candidates), self._chunk_size):
+            chunk = candidates[offset : offset + self._chunk_size]
+            if self._kind == "thread":
+                func = partial(self._heap_chunk, scorer, needle, chunk)
+            else:
+                func = partial(_heap_resident_chunk, scorer, needle, chunk)
+            heap = await loop.run_in_executor(executor, func)
+            result.append(heap)
+            if on_chunk is not None:
+                on_chunk(heap, len(chunk))
+        return result
+
+    async def match(
+        self,
+        needle: str,
+        scorer: Callable[[str, str], SCORE_INDICES],
+        candidates: Optional[Sequence[int]] = None,
+        on_chunk: Optional[Callable[[MATCHES, int], None]] = None,
+    ) -> List[MATCHES]:
+        """Score the `needle` against the names of `candidates` in the pools.
+
+        Shards are scored concurrently by their own worker.
+
+        Args:
+            needle: The query to match.
+            scorer: Scorer used to calculate the score.
+            candidates: Index of the names to score. Score all names if not provided.
+            on_chunk: Callback to run after each chunk is scored with the heap of the chunk
+                and the number of candidates scored in the chunk.
+
+        Returns:
+            List of heaps, one for each chunk. Refer to :func:`~InquirerPy.matcher.score.heap_chunk`.
+        """
+        candidates = self._prune(needle, scorer, candidates, on_chunk)
+        results = await asyncio.gather(
+            *(
+                self._match_shard(shard, needle, scorer, shard_candidates, on_chunk)
+                for shard, shard_candidates in enumerate(
+                    self._get_shard_candidates(candidates)
+                )
+                if shard_candidates
+            )
+        )
+        return [heap for result in results for heap in result]
+
+    def on_extend(self, names: Sequence[str]) -> None:
+        """Handle the names appended to the end of the names sequence.
+
+        The shards are re-partitioned if no pool is started yet. Otherwise the names
+        are appended to the last shard, including the resident copy of its worker process.
+
+        Args:
+            names: The appended names.
+        """
+        if self._kind == "thread":
+            super().on_extend(names)
+        if all(executor is None for executor in self._executors):
+            self._partition()
+            return
+        executor = self._executors[-1]
+        if self._kind == "process" and executor is not None:
+            executor.submit(_extend_names, list(names))
+
+    async def build_index(self) -> None:
+        """Index the names for "thread", worker processes index their own shard when started."""
+        if self._kind == "thread":
+            await super().build_index()
+
+    def close(self) -> None:
+        """Shutdown the pools without waiting for the running chunks."""
+        super().close()
+        for shard, executor in enumerate(self._executors):
+            if executor is not None:
+                executor.shutdown(wait=False)
+                self._executors[shard] = None
@@ -0,0 +1,101 @@
+"""Module contains the class :class:`.TrigramIndex` which finds the candidates of an exact match."""
+from array import array
+from collections import defaultdict
+from functools import partial
+from typing import DefaultDict, List, Optional, Sequence, Set
+
+__all__ = ["TrigramIndex"]
+
+
+class TrigramIndex:
+    """Inverted index from the trigrams of the lower cased choice names to their index.
+
+    A name can only contain a word of the needle when it contains every trigram of
+    the word, so an exact sub-string match only has to score the names found in the
+    posting lists of all trigrams. Words shorter than 3 characters do not narrow the
+    candidates.
+
+    The names are appended in order, candidates beyond the indexed names are never
+    rejected.
+
+    Examples:
+        >>> index = TrigramIndex()
+        >>> index.extend(["weather", "whatever", "wheat"])
+        >>> index.filter("eat", range(3))
+        [0, 2]
+    """
+
+    def __init__(self) -> None:
+        self._postings: DefaultDict[str, array] = defaultdict(partial(array, "I"))
+        self._count = 0
+
+    def extend(self, names: Sequence[str]) -> None:
+        """Append the trigrams of `names`.
+
+        Args:
+            names: Names following the indexed names.
+        """
+        postings = self._postings
+        for index, name in enumerate(names, self._count):
+            name = name.lower()
+            for trigram in {name[i : i + 3] for i in range(len(name) - 2)}:
+                postings[trigram].append(index)
+        self._count += len(names)
+
+    def search(self, needle: str) -> Optional[Set[int]]:
+        """Find the indexed names containing every trigram of the `needle`.
+
+        Args:
+            needle: The query to match, words are separated by space.
+
+        Returns:
+            Index of the names, `None` if no word of `needle` has 3 or more characters.
+        """
+        trigrams = {
+            word[i : i + 3]
+            for word in needle.lower().split(" ")
+            for i in range(len(word) - 2)
+        }
+        if not trigrams:
+            return None
+        postings = sorted(
+            (self._postings.get(trigram, ()) for trigram in trigrams), key=len
+        )
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result.intersection_update(posting)
+        return result
+
+    def filter(self, needle: str, candidates: Sequence[int]) -> Sequence[int]:
+        """Remove the candidates which cannot contain the `needle`.
+
+        Args:
+            needle: The query to match.
+            candidates: Index of the names to filter.
+
+        Returns:
+            Index of the candidates which may match, in the order of `candidates`.
+        """
+        matched = self.search(needle)
+        if matched is None:
+            return candidates
+        count = self._count
+        if not isinstance(candidates, range) or candidates.step != 1:
+            return [index for index in candidates if index >= count or index in matched]
+        start, stop = candidates.start, min(candidates.stop, count)
+        if start >= stop:
+            return candidates
+        result: List[int] = sorted(
+            matched
+            if start == 0 and stop == count
+            else (index for index in matched if start <= index < stop)
+        )
+        if stop < candidates.stop:
+            result.extend(range(stop, candidates.stop))
+        return result
+
+    def __len__(self) -> int:
+        """Get the number of indexed names."""
+        return self._count
@@ -0,0 +1,203 @@
+"""Module contains the class :class:`.CharacterIndex` which rejects candidates before scoring."""
+import sys
+from array import array
+from functools import reduce
+from operator import or_
+from typing import Any, Callable, List, Optional, Sequence
+
+from pfzy.score import fzy_scorer, substr_scorer
+from pfzy.types import SCORE_INDICES
+
+__all__ = ["CharacterIndex", "get_signature"]
+
+NUMPY_THRESHOLD = 50000
+
+_ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789"
+_BUCKETS = 64 - len(_ALPHABET)
+
+_UNAVAILABLE = object()
+_numpy: Any = None
+
+
+class _Bits(dict):
+    """Bit of each character in a signature.
+
+    Letters and digits have their own bit, other characters share the remaining bits
+    by their code point.
+    """
+
+    def __missing__(self, char: str) -> int:
+        bit = 1 << (len(_ALPHABET) + ord(char) % _BUCKETS)
+        if len(self) < 4096:
+            self[char] = bit
+        return bit
+
+
+_BITS = _Bits((char, 1 << bit) for bit, char in enumerate(_ALPHABET))
+
+
+def get_signature(text: str) -> int:
+    """Get the character signature of the lower cased `text`.
+
+    A name cannot match a needle when the signature of the needle has a bit which
+    is missing from the signature of the name.
+
+    Args:
+        text: Text to get the signature of.
+
+    Returns:
+        A 64 bit integer with a bit set for each character of `text`.
+
+    Examples:
+        >>> get_signature("ab") == get_signature("Ba")
+        True
+        >>> get_signature("ab") & get_signature("ac") == get_signature("ab")
+        False
+    """
+    return reduce(or_, map(_BITS.__getitem__, set(text.lower())), 0)
+
+
+def _get_numpy(load: bool) -> Optional[Any]:
+    """Get :mod:`numpy` if it is installed.
+
+    Importing numpy takes longer than calculating the signatures of tens of thousands
+    of names, so it is only imported when it was already imported elsewhere or `load`.
+
+    Args:
+        load: Import numpy even when it was not imported yet.
+
+    Returns:
+        The numpy module, None when it is not imported or not installed.
+    """
+    global _numpy, _ASCII_BITS
+    if _numpy is None and (load or "numpy" in sys.modules):
+        try:
+            import numpy
+        except ImportError:
+            _numpy = _UNAVAILABLE
+        else:
+            _ASCII_BITS = numpy.array(
+                [_BITS[chr(code)] for code in range(128)], dtype=numpy.uint64
+            )
+            _numpy = numpy
+    return None if _numpy is None or _numpy is _UNAVAILABLE else _numpy
+
+
+def _get_signatures(np: Any, names: Sequence[str]) -> Any:
+    """Get the signatures of all `names` at once with numpy."""
+    lowered = list(map(str.lower, names))
+    lengths = np.fromiter(map(len, lowered), dtype=np.intp, count=len(lowered))
+    codes = np.frombuffer(
+        "".join(lowered).encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+    )
+    bits = np.left_shift(
+        np.uint64(1), (codes % _BUCKETS + len(_ALPHABET)).astype(np.uint64)
+    )
+    ascii = codes < 128
+    bits[ascii] = _ASCII_BITS[codes[ascii]]
+    signatures = np.bitwise_or.reduceat(
+        np.append(bits, np.uint64(0)), np.cumsum(lengths) - lengths
+    )
+    signatures[lengths == 0] = 0
+    return signatures
+
+
+_ASCII_BITS: Any = None
+
+
+def _get_required(needle: str, scorer: Callable[[str, str], SCORE_INDICES]) -> int:
+    """Get the signature of the characters a name requires to match `needle`."""
+    if scorer is fzy_scorer:
+        return get_signature(needle)
+    if scorer is substr_scorer:
+        return get_signature(needle.replace(" ", ""))
+    return 0
+
+
+class CharacterIndex:
+    """Character signatures of the choice names.
+
+    The signature of each name is kept in an :class:`array.array` of 64 bit integers,
+    candidates missing any character of the needle are rejected with a single integer
+    AND instead of being scored. Only :func:`~pfzy.score.fzy_scorer` and
+    :func:`~pfzy.score.substr_scorer` are filtered.
+
+    The signatures are appended in order, candidates beyond the indexed names are
+    never rejected.
+
+    When :mod:`numpy` is installed, it calculates the signatures of batches of at least
+    `NUMPY_THRESHOLD` names, or any batch once numpy is imported.
+
+    Examples:
+        >>> from pfzy.score import fzy_scorer
+        >>> index = CharacterIndex()
+        >>> index.extend(["what", "meat", "whoa"])
+        >>> index.filter("wh", fzy_scorer, range(3))
+        [0, 2]
+    """
+
+    def __init__(self) -> None:
+        self._signatures = array("Q")
+
+    def extend(self, names: Sequence[str]) -> None:
+        """Append the signatures of `names`.
+
+        Args:
+            names: Names following the indexed names.
+        """
+        np = _get_numpy(len(names) >= NUMPY_THRESHOLD)
+        if np is not None and len(names) > 1:
+            self._signatures.frombytes(_get_signatures(np, names).tobytes())
+        else:
+            self._signatures.extend(map(get_signature, names))
+
+    def filter(
+        self,
+        needle: str,
+        scorer: Callable[[str, str], SCORE_INDICES],
+        candidates: Sequence[int],
+        offset: int = 0,
+    ) -> Sequence[int]:
+        """Remove the candidates which cannot match the `needle`.
+
+        Args:
+            needle: The query to match.
+            scorer: Scorer used to score the candidates.
+            candidates: Index of the names to filter.
+            offset: Index of the first indexed name.
+
+        Returns:
+            Index of the candidates which may match, in the order of `candidates`.
+        """
+        required = _get_required(needle, scorer)
+        if not required:
+            return candidates
+        signatures = self._signatures
+        count = len(signatures) + offset
+        if not isinstance(candidates, range) or candidates.step != 1:
+            return [
+                index
+                for index in candidates
+                if index >= count or signatures[index - offset] & required == required
+            ]
+        start, stop = candidates.start, min(candidates.stop, count)
+        if start >= stop:
+            return candidates
+        covered = signatures[start - offset : stop - offset]
+        np = _get_numpy(False)
+        if np is not None:
+            matched = np.frombuffer(covered, dtype=np.uint64) & np.uint64(required)
+            result: List[int] = (np.flatnonzero(matched == required) + start).tolist()
+        else:
+            result = [
+                index
+                for index, signature in zip(range(start, stop), covered)
+                if signature & required == required
+            ]
+        if stop < candidates.stop:
+            result.extend(range(stop, candidates.stop))
+        return result
+
+    def __len__(self) -> int:
+        """Get the number of indexed names."""
+        return len(self._signatures)
@@ -0,0 +1,143 @@
+"""Module contains the lazily sorted sequence :class:`.RankedChoices`."""
+from heapq import heapify, heappop, heapreplace
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+from pfzy.types import SCORE_INDICES
+
+from InquirerPy.matcher.score import MATCHES
+
+__all__ = ["RankedChoices"]
+
+
+class RankedChoices(Sequence):
+    """A sequence of matched choices which is only sorted as far as it is accessed.
+
+    The matches are kept in heaps and the best matches are popped when a position is
+    first accessed, extending the sorted prefix by at least `step` choices. Displaying
+    the first page of a query matching most of the choices no longer requires sorting
+    all of the matches.
+
+    The matching indices are not part of the result, use :attr:`.needle` and
+    :attr:`.scorer` to calculate them for the choices being displayed.
+
+    Args:
+        choices: All processed choices.
+        heaps: Heaps of matches obtained from :func:`~InquirerPy.matcher.score.heap_chunk`.
+        step: Minimum number of choices to sort when extending the sorted prefix.
+        needle: The query matched against the choices.
+        scorer: Scorer used to score the choices.
+    """
+
+    def __init__(
+        self,
+        choices: List[Dict[str, Any]],
+        heaps: List[MATCHES],
+        step: int = 100,
+        needle: str = "",
+        scorer: Optional[Callable[[str, str], SCORE_INDICES]] = None,
+    ) -> None:
+        self.needle = needle
+        self.scorer = scorer
+        self._choices = choices
+        self._step = step if step > 0 else 1
+        self._ranked: MATCHES = []
+        self._heaps: List[MATCHES] = []
+        self._length = 0
+        self._heads: List[Tuple[Tuple[float, int], int]] = []
+        self.extend(heaps)
+
+    def extend(self, heaps: List[MATCHES]) -> None:
+        """Add the matches of newly scored choices.
+
+        The sorted prefix is merged back as a heap since the new matches may rank
+        before the choices already sorted.
+
+        Args:
+            heaps: Heaps of matches obtained from :func:`~InquirerPy.matcher.score.heap_chunk`.
+        """
+        heaps = [heap for heap in heaps if heap]
+        if not heaps:
+            return
+        if self._ranked:
+            heaps.append(self._ranked)
+            self._ranked = []
+        self._heaps = [heap for heap in self._heaps if heap] + heaps
+        self._length = sum(len(heap) for heap in self._heaps)
+        self._heads = [
+            (heap[0], heap_index) for heap_index, heap in enumerate(self._heaps)
+        ]
+        heapify(self._heads)
+
+    def _rank(self, count: int) -> None:
+        """Pop the next `count` best matches into the sorted prefix."""
+        heads = self._heads
+        heaps = self._heaps
+        ranked = self._ranked
+        for _ in range(count):
+            if not heads:
+                break
+            match, heap_index = heads[0]
+            heap = heaps[heap_index]
+            heappop(heap)
+            if heap:
+                heapreplace(heads, (heap[0], heap_index))
+            else:
+                heappop(heads)
+            ranked.append(match)
+
+    @overload
+    def __getitem__(self, position: int) -> Dict[str, Any]:
+        """Get the choice ranked at `position`."""
+
+    @overload
+    def __getitem__(self, position: slice) -> List[Dict[str, Any]]:
+        """Get the choices ranked within the `position` slice."""
+
+    def __getitem__(
+        self, position: Union[int, slice]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Get the choice ranked at `position`, sorting more matches if required."""
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(self._length))]
+        if position < 0:
+            position += self._length
+        if position < 0 or position >= self._length:
+            raise IndexError("ranked choice index out of range")
+        if position >= len(self._ranked):
+            self._rank(
+                max(position + 1, len(self._ranked) + self._step) - len(self._ranked)
+            )
+        return self._choices[self._ranked[position][1]]
+
+    def __len__(self) -> int:
+        """Get the total number of matched choices."""
+        return self._length
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the sorted choices with another sequence."""
+        if isinstance(other, (list, RankedChoices)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def unordered(self) -> Iterator[Dict[str, Any]]:
+        """Iterate all matched choices without sorting them.
+
+        Yields:
+            Matched choices in no particular order.
+        """
+        for _, index in self._ranked:
+            yield self._choices[index]
+        for heap in self._heaps:
+            for _, index in heap:
+                yield self._choices[index]
@@ -0,0 +1,251 @@
+"""Module contains the synchronous scoring primitives shared by the matchers."""
+from functools import partial
+from heapq import heapify
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from pfzy.score import (
+    SCORE_GAP_INNER,
+    SCORE_GAP_LEADING,
+    SCORE_GAP_TRAILING,
+    SCORE_MATCH_CONSECUTIVE,
+    SCORE_MAX,
+    SCORE_MIN,
+    _bonus,
+    _subsequence,
+    fzy_scorer,
+    substr_scorer,
+)
+from pfzy.types import SCORE_INDICES
+
+__all__ = [
+    "fzy_score",
+    "substr_score",
+    "get_score_only",
+    "get_haystacks",
+    "score_chunk",
+    "heap_chunk",
+    "MATCHES",
+]
+
+MATCHES = List[Tuple[float, int]]
+
+
+def fzy_score(needle: str, haystack: str) -> Optional[float]:
+    """Calculate the score of :func:`~pfzy.score.fzy_scorer` without the matching indices.
+
+    Only the previous row of the score matrices is kept since the indices are not
+    backtracked, the calculation is otherwise identical so the scores are equal.
+
+    Note:
+        A mixed case `needle` matching `haystack` only case insensitively is still a
+        match with a score of `-inf`, the same as :func:`~pfzy.score.fzy_scorer`.
+
+    Args:
+        needle: Substring to find in haystack.
+        haystack: String to be searched and scored against.
+
+    Returns:
+        The matching score, None if `needle` is not a subsequence of `haystack`.
+
+    Examples:
+        >>> fzy_score("ab", "acb")
+        0.89
+        >>> fzy_score("Ab", "xab")
+        -inf
+        >>> fzy_score("ab", "wc") is None
+        True
+    """
+    if not _subsequence(needle, haystack):
+        return None
+    needle_len, haystack_len = len(needle), len(haystack)
+    bonus_score = _bonus(haystack)
+
+    if needle.islower():
+        haystack = haystack.lower()
+
+    if needle_len == 0 or needle_len == haystack_len:
+        return SCORE_MAX
+
+    prev_running: List[float] = []
+    prev_result: List[float] = []
+    for i in range(needle_len):
+        running = [SCORE_MIN] * haystack_len
+        result = [SCORE_MIN] * haystack_len
+        prev_score = SCORE_MIN
+        gap_score = SCORE_GAP_TRAILING if i == needle_len - 1 else SCORE_GAP_INNER
+        char = needle[i]
+
+        for j in range(haystack_len):
+            if char == haystack[j]:
+                score = SCORE_MIN
+                if i == 0:
+                    score = j * SCORE_GAP_LEADING + bonus_score[j]
+                elif j != 0:
+                    score = max(
+                        prev_result[j - 1] + bonus_score[j],
+                        prev_running[j - 1] + SCORE_MATCH_CONSECUTIVE,
+                    )
+                running[j] = score
+                result[j] = prev_score = max(score, prev_score + gap_score)
+            else:
+                result[j] = prev_score = prev_score + gap_score
+        prev_running, prev_result = running, result
+
+    return prev_result[-1]
+
+
+def substr_score(needle: str, haystack: str) -> Optional[float]:
+    """Calculate the score of :func:`~pfzy.score.substr_scorer` without the matching indices.
+
+    Args:
+        needle: Substring to find in haystack.
+        haystack: String to be searched and scored against.
+
+    Returns:
+        The matching score, None if any word of `needle` is not found in `haystack`.
+
+    Examples:
+        >>> substr_score("ab", "abc")
+        0.5
+        >>> substr_score("ab", "iop") is None
+        True
+    """
+    first = last = -1
+    offset = 0
+    needle, haystack = needle.lower(), haystack.lower()
+
+    for word in needle.split(" "):
+        if not word:
+            continue
+        offset = haystack.find(word, offset)
+        if offset < 0:
+            return None
+        if first < 0:
+            first = offset
+        offset += len(word)
+        last = offset - 1
+
+    if first < 0:
+        return 0
+
+    return -(last + 1 - first) + 2 / (first + 1) + 1 / (last + 1)
+
+
+def _score_of(
+    scorer: Callable[[str, str], SCORE_INDICES], needle: str, haystack: str
+) -> Optional[float]:
+    """Get the score of a custom scorer, None if there is no match."""
+    score, indices = scorer(needle, haystack)
+    return None if indices is None else score
+
+
+_SCORE_ONLY: Dict[
+    Callable[[str, str], SCORE_INDICES], Callable[[str, str], Optional[float]]
+] = {
+    fzy_scorer: fzy_score,
+    substr_scorer: substr_score,
+}
+
+
+def get_score_only(
+    scorer: Callable[[str, str], SCORE_INDICES]
+) -> Callable[[str, str], Optional[float]]:
+    """Get the function to only calculate the score of `scorer`.
+
+    The returned function returns None when there is no match, a match may still
+    have a score of `-inf`, the same as a match of `scorer` without None indices.
+
+    Args:
+        scorer: Scorer which calculates both the score and the matching indices.
+
+    Returns:
+        The score only version of the builtin scorers, otherwise a wrapper discarding
+        the matching indices of `scorer`.
+    """
+    return _SCORE_ONLY.get(scorer) or partial(_score_of, scorer)
+
+
+def get_haystacks(
+    names: Sequence[str], candidates: Sequence[int], offset: int = 0
+) -> Sequence[str]:
+    """Get the names of the given `candidates`.
+
+    The names of a contiguous `range` of candidates are obtained with a single slice.
+
+    Args:
+        names: All available choice names, or a shard of them starting at `offset`.
+        candidates: Index of the names to get.
+        offset: Index of the first name in `names`.
+
+    Returns:
+        Names in the order of `candidates`.
+    """
+    if isinstance(candidates, range) and candidates.step == 1:
+        return names[candidates.start - offset : candidates.stop - offset]
+    return [names[index - offset] for index in candidates]
+
+
+def score_chunk(
+    scorer: Callable[[str, str], SCORE_INDICES],
+    needle: str,
+    names: Sequence[str],
+    candidates: Sequence[int],
+    offset: int = 0,
+) -> MATCHES:
+    """Score the `needle` against the `names` of the given `candidates`.
+
+    The matching indices are not calculated, refer to :func:`.get_score_only`.
+
+    Args:
+        scorer: Scorer used to calculate the score, e.g. :func:`~pfzy.score.fzy_scorer`.
+        needle: The query to match.
+        names: All available choice names, or a shard of them starting at `offset`.
+        candidates: Index of the names to score.
+        offset: Index of the first name in `names`.
+
+    Returns:
+        List of matches in the order of `candidates`. Each match is a tuple of
+        score and index of the name.
+
+    Examples:
+        >>> from pfzy.score import fzy_scorer
+        >>> score_chunk(fzy_scorer, "ab", ["acb", "wc"], range(2))
+        [(0.89, 0)]
+    """
+    score_only = get_score_only(scorer)
+    result = []
+    for index, haystack in zip(candidates, get_haystacks(names, candidates, offset)):
+        score = score_only(needle, haystack)
+        if score is not None:
+            result.append((score, index))
+    return result
+
+
+def heap_chunk(
+    scorer: Callable[[str, str], SCORE_INDICES],
+    needle: str,
+    names: Sequence[str],
+    candidates: Sequence[int],
+    offset: int = 0,
+) -> MATCHES:
+    """Score the candidates and arrange the matches into a min heap.
+
+    The score of each match is negated so that the best match is at the top of
+    the heap, ties are ordered by the index of the name.
+
+    Refer to :func:`.score_chunk` for the arguments.
+
+    Returns:
+        A heap of matches with negated scores.
+
+    Examples:
+        >>> from pfzy.score import fzy_scorer
+        >>> heap_chunk(fzy_scorer, "ab", ["acb", "wc"], range(2))
+        [(-0.89, 0)]
+    """
+    heap = [
+        (-score, index)
+        for score, index in score_chunk(scorer, needle, names, candidates, offset)
+    ]
+    heapify(heap)
+    return heap
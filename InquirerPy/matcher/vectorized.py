@@ -0,0 +1,284 @@
+"""Module contains the class :class:`.VectorizedMatcher` which scores choices with numpy.
+
+numpy is an optional dependency, install it with `pip install InquirerPy[numpy]`.
+"""
+from heapq import heapify
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from pfzy.score import (
+    BONUS_INDEX,
+    BONUS_STATES,
+    SCORE_GAP_INNER,
+    SCORE_GAP_LEADING,
+    SCORE_GAP_TRAILING,
+    SCORE_MATCH_CONSECUTIVE,
+    SCORE_MAX,
+    SCORE_MIN,
+    fzy_scorer,
+    substr_scorer,
+)
+from pfzy.types import SCORE_INDICES
+
+from InquirerPy.exceptions import InvalidArgument
+from InquirerPy.matcher.base import Matcher
+from InquirerPy.matcher.score import MATCHES, fzy_score, get_haystacks, substr_score
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+__all__ = ["VectorizedMatcher", "fzy_score_batch", "substr_score_batch"]
+
+MAX_LENGTH = 256
+
+_PAD = 0x110000
+_END = 0x110001
+
+
+def _pack(haystacks: Sequence[str], lengths: Any, length: int) -> Any:
+    """Pack the code points of `haystacks` into a `length` by `len(haystacks)` array.
+
+    Each column holds a haystack padded with a value that is not a code point, so
+    that the padding never matches any character of the needle.
+    """
+    codes = np.full((length, len(haystacks)), _PAD, dtype=np.uint32)
+    codes.T[np.arange(length) < lengths[:, None]] = np.frombuffer(
+        "".join(haystacks).encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+    )
+    return codes
+
+
+def _encode(needle: str) -> Any:
+    """Get the code points of `needle`."""
+    return np.frombuffer(needle.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+
+
+def _get_bonus_tables() -> Any:
+    """Get the lookup tables of :func:`pfzy.score._bonus` for ascii characters."""
+    states = np.zeros(128, dtype=np.intp)
+    for char, state in BONUS_INDEX.items():
+        states[ord(char)] = state
+    bonus = np.zeros((len(BONUS_STATES), 128))
+    for state, previous in enumerate(BONUS_STATES):
+        for char, value in previous.items():
+            bonus[state, ord(char)] = value
+    return states, bonus
+
+
+_BONUS_TABLES = _get_bonus_tables() if np is not None else None
+
+
+def _bonus(codes: Any) -> Any:
+    """Calculate the bonus of :func:`pfzy.score._bonus` for each column of `codes`."""
+    states, bonus = _BONUS_TABLES
+    codes = np.where(codes < 128, codes, 0)
+    previous = np.empty_like(codes)
+    previous[0] = ord("/")
+    previous[1:] = codes[:-1]
+    return bonus[states[codes], previous]
+
+
+def _score_fallback(
+    scores: Any,
+    score_only: Callable[[str, str], Optional[float]],
+    needle: str,
+    haystacks: Sequence[str],
+    regular: Any,
+) -> None:
+    """Score the haystacks which are not `regular` one by one."""
+    for index in np.flatnonzero(~regular).tolist():
+        score = score_only(needle, haystacks[index])
+        scores[index] = np.nan if score is None else score
+
+
+def _select(haystacks: Sequence[str], index: Any) -> Sequence[str]:
+    """Get the haystacks at `index`."""
+    if index.size == len(haystacks):
+        return haystacks
+    return [haystacks[i] for i in index.tolist()]
+
+
+def fzy_score_batch(needle: str, haystacks: Sequence[str]) -> Any:
+    """Calculate the :func:`~InquirerPy.matcher.score.fzy_score` of all `haystacks` at once.
+
+    The haystacks are packed into an array of code points and the score matrices are
+    calculated column by column for all haystacks together. The floating point operations
+    are performed in the same order as :func:`~pfzy.score.fzy_scorer` so the scores are
+    equal.
+
+    Haystacks longer than `MAX_LENGTH` or changing length when lower cased are scored
+    individually.
+
+    Args:
+        needle: Substring to find in haystacks.
+        haystacks: Strings to be searched and scored against.
+
+    Returns:
+        A :class:`numpy.ndarray` of the matching scores, `nan` if `needle` is not a
+        subsequence of the haystack. A match may have a score of `-inf`, refer to
+        :func:`~InquirerPy.matcher.score.fzy_score`.
+
+    Examples:
+        >>> fzy_score_batch("ab", ["acb", "wc"]).tolist()
+        [0.89, nan]
+    """
+    scores = np.full(len(haystacks), np.nan)
+    lowered = list(map(str.lower, haystacks))
+    lengths = np.fromiter(map(len, haystacks), dtype=np.intp, count=len(haystacks))
+    regular = (lengths == np.fromiter(map(len, lowered), np.intp, len(lowered))) & (
+        lengths <= MAX_LENGTH
+    )
+    if len(needle.lower()) != len(needle):
+        regular[:] = False
+    _score_fallback(scores, fzy_score, needle, haystacks, regular)
+    index = np.flatnonzero(regular)
+    if not index.size:
+        return scores
+    lengths = lengths[index]
+    codes = _pack(_select(lowered, index), lengths, int(lengths.max()))
+
+    needle_len = len(needle)
+    pending = np.zeros(index.size, dtype=np.intp)
+    expected = np.append(_encode(needle.lower()), np.uint32(_END))
+    for row in codes:
+        pending += row == expected[pending]
+    matched = pending == needle_len
+    if needle_len == 0:
+        scores[index] = SCORE_MAX
+        return scores
+    scores[index[matched & (lengths == needle_len)]] = SCORE_MAX
+    matched &= lengths != needle_len
+    if not matched.any():
+        return scores
+    index, lengths = index[matched], lengths[matched]
+    original = _pack(_select(haystacks, index), lengths, int(lengths.max()))
+    bonus = _bonus(original)
+    codes = codes[: len(original), matched] if needle.islower() else original
+
+    result = running = None
+    for i, char in enumerate(_encode(needle).tolist()):
+        gap_score = SCORE_GAP_TRAILING if i == needle_len - 1 else SCORE_GAP_INNER
+        if i == 0:
+            score = np.arange(len(codes))[:, None] * SCORE_GAP_LEADING + bonus
+        else:
+            score = np.full_like(bonus, SCORE_MIN)
+            np.maximum(
+                result[:-1] + bonus[1:],
+                running[:-1] + SCORE_MATCH_CONSECUTIVE,
+                out=score[1:],
+            )
+        running = np.where(codes == char, score, SCORE_MIN)
+        result = running.copy()
+        for j in range(1, len(result)):
+            np.maximum(result[j], result[j - 1] + gap_score, out=result[j])
+    scores[index] = result[lengths - 1, np.arange(index.size)]
+    return scores
+
+
+def substr_score_batch(needle: str, haystacks: Sequence[str]) -> Any:
+    """Calculate the :func:`~InquirerPy.matcher.score.substr_score` of all `haystacks` at once.
+
+    Each word of the needle is searched in all haystacks together by comparing the
+    packed code points at every offset.
+
+    Haystacks longer than `MAX_LENGTH` are scored individually.
+
+    Args:
+        needle: Substring to find in haystacks.
+        haystacks: Strings to be searched and scored against.
+
+    Returns:
+        A :class:`numpy.ndarray` of the matching scores, `nan` if any word of `needle`
+        is not found in the haystack.
+
+    Examples:
+        >>> substr_score_batch("ab", ["abc", "iop"]).tolist()
+        [0.5, nan]
+    """
+    words = [word for word in needle.lower().split(" ") if word]
+    if not words:
+        return np.zeros(len(haystacks))
+    scores = np.full(len(haystacks), np.nan)
+    lowered = list(map(str.lower, haystacks))
+    lengths = np.fromiter(map(len, lowered), dtype=np.intp, count=len(lowered))
+    regular = lengths <= MAX_LENGTH
+    _score_fallback(scores, substr_score, needle, haystacks, regular)
+    index = np.flatnonzero(regular)
+    if not index.size:
+        return scores
+    lengths = lengths[index]
+    codes = _pack(_select(lowered, index), lengths, int(lengths.max()))
+
+    found = np.ones(index.size, dtype=bool)
+    first = offset = np.zeros(index.size, dtype=np.intp)
+    for position, word in enumerate(words):
+        width = len(codes) - len(word) + 1
+        if width <= 0:
+            return scores
+        hits = np.arange(width)[:, None] >= offset
+        for char_index, char in enumerate(_encode(word).tolist()):
+            hits &= codes[char_index : char_index + width] == char
+        found &= hits.any(axis=0)
+        start = hits.argmax(axis=0)
+        if position == 0:
+            first = start
+        offset = start + len(word)
+    last = offset - 1
+    scores[index[found]] = (-(last + 1 - first) + 2 / (first + 1) + 1 / (last + 1))[
+        found
+    ]
+    return scores
+
+
+_SCORE_BATCH: Dict[Callable[[str, str], SCORE_INDICES], Callable[[str, Any], Any]] = {
+    fzy_scorer: fzy_score_batch,
+    substr_scorer: substr_score_batch,
+}
+
+
+class VectorizedMatcher(Matcher):
+    """Score choice names chunk by chunk with numpy on the running event loop.
+
+    Every chunk is scored at once by :func:`.fzy_score_batch` or :func:`.substr_score_batch`,
+    the matches and their ordering are identical to :class:`~InquirerPy.matcher.Matcher`.
+    Custom scorers are scored one name at a time.
+
+    Args:
+        names: All choice names.
+        chunk_size: Number of names to score in each chunk.
+        exact_index: Build a trigram index for exact matches, refer to :class:`~InquirerPy.matcher.Matcher`.
+
+    Raises:
+        InvalidArgument: When numpy is not installed.
+    """
+
+    def __init__(
+        self, names: Sequence[str], chunk_size: int = 10000, exact_index: bool = False
+    ) -> None:
+        if np is None:
+            raise InvalidArgument(
+                "numpy is required to use the vectorized matcher, install it with `pip install InquirerPy[numpy]`"
+            )
+        super().__init__(names=names, chunk_size=chunk_size, exact_index=exact_index)
+
+    def _heap_chunk(
+        self,
+        scorer: Callable[[str, str], SCORE_INDICES],
+        needle: str,
+        candidates: Sequence[int],
+    ) -> MATCHES:
+        """Score a single chunk of candidates with numpy."""
+        score_batch = _SCORE_BATCH.get(scorer)
+        if score_batch is None:
+            return super()._heap_chunk(scorer, needle, candidates)
+        candidates = self._index.filter(needle, scorer, candidates)
+        scores = score_batch(needle, get_haystacks(self._names, candidates))
+        matched = np.flatnonzero(~np.isnan(scores))
+        if isinstance(candidates, range):
+            indices: List[int] = (matched * candidates.step + candidates.start).tolist()
+        else:
+            indices = [candidates[position] for position in matched.tolist()]
+        heap = list(zip((-scores[matched]).tolist(), indices))
+        heapify(heap)
+        return heap
@@ -0,0 +1,206 @@
+"""Module contains the class :class:`.Profiler` which times the work done by the prompts."""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from prompt_toolkit.document import Document
+from prompt_toolkit.validation import Validator
+
+__all__ = ["Profiler", "ProfileMetric", "get_profiler"]
+
+MAX_TRACE_EVENTS = 100000
+
+T = TypeVar("T")
+
+_env_profiler: Optional["Profiler"] = None
+
+
+@dataclass
+class ProfileMetric:
+    """Aggregated timing of a profiled operation.
+
+    Args:
+        count: Number of times the operation ran.
+        total: Total time spent in seconds.
+        max: Longest single run in seconds.
+    """
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        """float: Average time of a single run in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+
+class Profiler:
+    """Time the operations of the prompts, e.g. filtering, formatting choices and rendering.
+
+    Each operation is aggregated into :attr:`.Profiler.metrics` and reported to `callback`.
+    When `trace_file` is provided, every operation is also kept as a complete event of the
+    Chrome trace event format, which can be loaded in `chrome://tracing`, Perfetto or speedscope.
+    The same profiler can be shared by multiple prompts.
+
+    Args:
+        callback: Function called with the name and the duration in seconds of each operation.
+        trace_file: Path to write the trace events to when a prompt finishes.
+        max_events: Maximum number of trace events to keep, later events are dropped.
+
+    Examples:
+        >>> profiler = Profiler(callback=lambda name, duration: print(name))
+        >>> with profiler.span("render"):
+        ...     pass
+        render
+        >>> profiler.metrics["render"].count
+        1
+    """
+
+    def __init__(
+        self,
+        callback: Optional[Callable[[str, float], None]] = None,
+        trace_file: Optional[str] = None,
+        max_events: int = MAX_TRACE_EVENTS,
+    ) -> None:
+        self._callback = callback
+        self._trace_file = trace_file
+        self._max_events = max_events
+        self._origin = time.perf_counter()
+        self._events: List[Dict[str, Any]] = []
+        self.metrics: Dict[str, ProfileMetric] = {}
+
+    def record(self, name: str, start: float, duration: float) -> None:
+        """Record an operation measured with :func:`time.perf_counter`.
+
+        Args:
+            name: Name of the operation.
+            start: Time the operation started.
+            duration: Time spent in seconds.
+        """
+        metric = self.metrics.setdefault(name, ProfileMetric())
+        metric.count += 1
+        metric.total += duration
+        metric.max = max(metric.max, duration)
+        if self._trace_file is not None and len(self._events) < self._max_events:
+            self._events.append(
+                {
+                    "name": name,
+                    "cat": "InquirerPy",
+                    "ph": "X",
+                    "ts": (start - self._origin) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                }
+            )
+        if self._callback is not None:
+            self._callback(name, duration)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the body of the `with` statement as operation `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter() - start)
+
+    def wrap(self, name: str, func: Callable[..., T]) -> Callable[..., T]:
+        """Time each call of `func` as operation `name`.
+
+        Args:
+            name: Name of the operation.
+            func: Function to time.
+
+        Returns:
+            The wrapped function.
+        """
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def wrap_async(
+        self, name: str, func: Callable[..., Awaitable[T]]
+    ) -> Callable[..., Awaitable[T]]:
+        """Time each call of the coroutine function `func` as operation `name`.
+
+        Cancelled calls are not recorded.
+
+        Args:
+            name: Name of the operation.
+            func: Coroutine function to time.
+
+        Returns:
+            The wrapped coroutine function.
+        """
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = await func(*args, **kwargs)
+            self.record(name, start, time.perf_counter() - start)
+            return result
+
+        return wrapper
+
+    def wrap_validator(self, validator: Validator) -> Validator:
+        """Time the validation of `validator` as operation `validate`.
+
+        Args:
+            validator: Validator of the prompt.
+
+        Returns:
+            A validator delegating to `validator`.
+        """
+        profiler = self
+
+        class ProfiledValidator(Validator):
+            def validate(self, document: Document) -> None:
+                with profiler.span("validate"):
+                    validator.validate(document)
+
+        return ProfiledValidator()
+
+    def write(self) -> None:
+        """Write the trace events to `trace_file` if provided."""
+        if self._trace_file is None:
+            return
+        with open(self._trace_file, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": self._events, "displayTimeUnit": "ms"}, file)
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Get the profiler enabled by the environment variable `INQUIRERPY_PROFILE`.
+
+    The value of the variable is the path of the trace file. The same profiler is shared
+    by all prompts so the trace file contains every prompt of the process.
+
+    Returns:
+        The shared profiler, None if the environment variable is not set.
+    """
+    global _env_profiler
+    trace_file = os.getenv("INQUIRERPY_PROFILE")
+    if not trace_file:
+        return None
+    if _env_profiler is None or _env_profiler._trace_file != trace_file:
+        _env_profiler = Profiler(trace_file=trace_file)
+    return _env_profiler
@@ -1,4 +1,10 @@
-"""Module contains import of all prompts classes."""
+"""Module contains import of all prompts classes.
+
+The prompt modules are imported on first access of the prompt classes, so importing a single prompt
+does not import the dependencies of the other prompts (e.g. :mod:`pfzy` of the fuzzy prompt).
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
 
 __all__ = [
     "CheckboxPrompt",
@@ -13,13 +19,41 @@ __all__ = [
     "SecretPrompt",
 ]
 
-from InquirerPy.prompts.checkbox import CheckboxPrompt
-from InquirerPy.prompts.confirm import ConfirmPrompt
-from InquirerPy.prompts.expand import ExpandPrompt
-from InquirerPy.prompts.filepath import FilePathPrompt
-from InquirerPy.prompts.fuzzy import FuzzyPrompt
-from InquirerPy.prompts.input import InputPrompt
-from InquirerPy.prompts.list import ListPrompt
-from InquirerPy.prompts.number import NumberPrompt
-from InquirerPy.prompts.rawlist import RawlistPrompt
-from InquirerPy.prompts.secret import SecretPrompt
+if TYPE_CHECKING:
+    from InquirerPy.prompts.checkbox import CheckboxPrompt
+    from InquirerPy.prompts.confirm import ConfirmPrompt
+    from InquirerPy.prompts.expand import ExpandPrompt
+    from InquirerPy.prompts.filepath import FilePathPrompt
+    from InquirerPy.prompts.fuzzy import FuzzyPrompt
+    from InquirerPy.prompts.input import InputPrompt
+    from InquirerPy.prompts.list import ListPrompt
+    from InquirerPy.prompts.number import NumberPrompt
+    from InquirerPy.prompts.rawlist import RawlistPrompt
+    from InquirerPy.prompts.secret import SecretPrompt
+
+_PROMPT_MODULES = {
+    "CheckboxPrompt": "checkbox",
+    "ConfirmPrompt": "confirm",
+    "ExpandPrompt": "expand",
+    "FilePathPrompt": "filepath",
+    "FuzzyPrompt": "fuzzy",
+    "InputPrompt": "input",
+    "ListPrompt": "list",
+    "NumberPrompt": "number",
+    "RawlistPrompt": "rawlist",
+    "SecretPrompt": "secret",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module of the prompt class `name` on first access."""
+    if name not in _PROMPT_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{_PROMPT_MODULES[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the prompt classes including the ones not imported yet."""
+    return sorted(set(globals()) | set(__all__))
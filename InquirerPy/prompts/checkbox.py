@@ -9,6 +9,7 @@ from InquirerPy.enum import (
     INQUIRERPY_FILL_CIRCLE_SEQUENCE,
     INQUIRERPY_POINTER_SEQUENCE,
 )
+from InquirerPy.profiler import Profiler
 from InquirerPy.prompts.list import ListPrompt
 from InquirerPy.separator import Separator
 from InquirerPy.utils import (
@@ -37,6 +38,7 @@ class InquirerPyCheckboxControl(InquirerPyUIListControl):
         enabled_symbol: str,
         disabled_symbol: str,
         session_result: Optional[InquirerPySessionResult],
+        compact: bool = False,
     ) -> None:
         """Initialise required attributes and call base class."""
         self._pointer = pointer
@@ -47,6 +49,7 @@ class InquirerPyCheckboxControl(InquirerPyUIListControl):
             default=default,
             session_result=session_result,
             multiselect=True,
+            compact=compact,
         )
 
     def _format_choices(self) -> None:
@@ -156,6 +159,10 @@ class CheckboxPrompt(ListPrompt):
         mandatory: Indicate if the prompt is mandatory. If True, then the question cannot be skipped.
         mandatory_message: Error message to show when user attempts to skip mandatory prompt.
         session_result: Used internally for :ref:`index:Classic Syntax (PyInquirer)`.
+        profiler: Time the keybinding handlers, validation, choice formatting and render passes of the prompt.
+            Refer to :class:`~InquirerPy.profiler.Profiler` documentation for more details.
+        compact: Store the choices in a :class:`~InquirerPy.base.store.ChoiceStore` instead of a list of dictionaries.
+            Reduces the memory usage for large data set at the cost of slightly slower access to each choice.
 
     Examples:
         >>> from InquirerPy import inquirer
@@ -193,6 +200,8 @@ class CheckboxPrompt(ListPrompt):
         mandatory: bool = True,
         mandatory_message: str = "Mandatory prompt",
         session_result: Optional[InquirerPySessionResult] = None,
+        profiler: Optional[Profiler] = None,
+        compact: bool = False,
     ) -> None:
         self.content_control = InquirerPyCheckboxControl(
             choices=choices,
@@ -201,6 +210,7 @@ class CheckboxPrompt(ListPrompt):
             enabled_symbol=enabled_symbol,
             disabled_symbol=disabled_symbol,
             session_result=session_result,
+            compact=compact,
         )
         super().__init__(
             message=message,
@@ -227,6 +237,8 @@ class CheckboxPrompt(ListPrompt):
             mandatory=mandatory,
             mandatory_message=mandatory_message,
             session_result=session_result,
+            profiler=profiler,
+            compact=compact,
         )
 
     def _handle_enter(self, event) -> None:
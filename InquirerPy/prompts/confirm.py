@@ -8,6 +8,7 @@ from prompt_toolkit.validation import ValidationError
 
 from InquirerPy.base import BaseSimplePrompt
 from InquirerPy.exceptions import InvalidArgument
+from InquirerPy.session import get_session
 from InquirerPy.utils import (
     InquirerPyDefault,
     InquirerPyKeybindings,
@@ -193,4 +194,7 @@ class ConfirmPrompt(BaseSimplePrompt):
         return self._session.prompt()
 
     async def _run_async(self) -> Any:
+        session = get_session()
+        if session is not None:
+            return await session.run_prompt_session(self._session)
         return await self._session.prompt_async()
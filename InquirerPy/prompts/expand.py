@@ -6,6 +6,7 @@ from InquirerPy.base import BaseListPrompt, InquirerPyUIListControl
 from InquirerPy.base.control import Choice
 from InquirerPy.enum import INQUIRERPY_POINTER_SEQUENCE
 from InquirerPy.exceptions import InvalidArgument, RequiredKeyNotFound
+from InquirerPy.profiler import Profiler
 from InquirerPy.prompts.list import ListPrompt
 from InquirerPy.separator import Separator
 from InquirerPy.utils import (
@@ -78,6 +79,7 @@ class InquirerPyExpandControl(InquirerPyUIListControl):
         session_result: Optional[InquirerPySessionResult],
         multiselect: bool,
         marker_pl: str,
+        compact: bool = False,
     ) -> None:
         self._pointer = pointer
         self._separator = separator
@@ -91,6 +93,7 @@ class InquirerPyExpandControl(InquirerPyUIListControl):
             default=default,
             session_result=session_result,
             multiselect=multiselect,
+            compact=compact,
         )
 
     def _format_choices(self) -> None:
@@ -122,13 +125,18 @@ class InquirerPyExpandControl(InquirerPyUIListControl):
                 "expand prompt choice requires a key 'key' to exists"
             )
 
-        self.choices.append(
+        help_choices = [
             {
                 "key": self._expand_help.key,
                 "value": self._expand_help,
                 "name": self._expand_help.message,
                 "enabled": False,
             }
+        ]
+        self.choices.extend(
+            help_choices
+            if self._compact
+            else self._track_choices(help_choices, len(self.choices))
         )
         self._key_maps[self._expand_help.key] = len(self.choices) - 1
 
@@ -265,6 +273,10 @@ class ExpandPrompt(ListPrompt):
         mandatory: Indicate if the prompt is mandatory. If True, then the question cannot be skipped.
         mandatory_message: Error message to show when user attempts to skip mandatory prompt.
         session_result: Used internally for :ref:`index:Classic Syntax (PyInquirer)`.
+        profiler: Time the keybinding handlers, validation, choice formatting and render passes of the prompt.
+            Refer to :class:`~InquirerPy.profiler.Profiler` documentation for more details.
+        compact: Store the choices in a :class:`~InquirerPy.base.store.ChoiceStore` instead of a list of dictionaries.
+            Reduces the memory usage for large data set at the cost of slightly slower access to each choice.
 
     Examples:
         >>> from InquirerPy import inquirer
@@ -307,6 +319,8 @@ class ExpandPrompt(ListPrompt):
         mandatory: bool = True,
         mandatory_message: str = "Mandatory prompt",
         session_result: Optional[InquirerPySessionResult] = None,
+        profiler: Optional[Profiler] = None,
+        compact: bool = False,
     ) -> None:
         if expand_help is None:
             expand_help = ExpandHelp(message=help_msg)
@@ -322,6 +336,7 @@ class ExpandPrompt(ListPrompt):
             marker_pl=marker_pl,
             session_result=session_result,
             multiselect=multiselect,
+            compact=compact,
         )
         super().__init__(
             message=message,
@@ -348,6 +363,8 @@ class ExpandPrompt(ListPrompt):
             mandatory=mandatory,
             mandatory_message=mandatory_message,
             session_result=session_result,
+            profiler=profiler,
+            compact=compact,
         )
 
     def _on_rendered(self, _) -> None:
@@ -1,21 +1,23 @@
 """Module contains the class to create a fuzzy prompt."""
 import asyncio
-import math
+import heapq
+import time
+from itertools import chain, groupby
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Hashable,
     List,
     Optional,
+    Sequence,
     Tuple,
     Union,
     cast,
 )
 
-from pfzy import fuzzy_match
 from pfzy.score import fzy_scorer, substr_scorer
-from pfzy.types import HAYSTACKS
 from prompt_toolkit.application.application import Application
 from prompt_toolkit.buffer import Buffer
 from prompt_toolkit.filters.cli import IsDone
@@ -23,6 +25,7 @@ from prompt_toolkit.layout.containers import (
     ConditionalContainer,
     FloatContainer,
     HSplit,
+    VSplit,
     Window,
 )
 from prompt_toolkit.layout.controls import BufferControl, DummyControl
@@ -35,12 +38,24 @@ from prompt_toolkit.widgets.base import Frame
 
 from InquirerPy.base import FakeDocument, InquirerPyUIListControl
 from InquirerPy.base.list import BaseListPrompt
+from InquirerPy.base.store import ChoiceStore
+from InquirerPy.cache import LRUCache
 from InquirerPy.containers.instruction import InstructionWindow
 from InquirerPy.containers.message import MessageWindow
+from InquirerPy.containers.preview import (
+    PREVIEW_CACHE_SIZE,
+    InquirerPyPreview,
+    PreviewWindow,
+)
 from InquirerPy.containers.validation import ValidationFloat
 from InquirerPy.enum import INQUIRERPY_POINTER_SEQUENCE
 from InquirerPy.exceptions import InvalidArgument
+from InquirerPy.history import FrecencyHistory, PromotedChoices
+from InquirerPy.matcher import ExecutorMatcher, Matcher, RankedChoices
+from InquirerPy.matcher.score import MATCHES
+from InquirerPy.profiler import Profiler
 from InquirerPy.separator import Separator
+from InquirerPy.stream import is_stream, iter_batches
 from InquirerPy.utils import (
     InquirerPyDefault,
     InquirerPyKeybindings,
@@ -57,6 +72,15 @@ if TYPE_CHECKING:
 
 __all__ = ["FuzzyPrompt"]
 
+PROGRESS_INTERVAL = 0.05
+INDICES_CACHE_SIZE = 1000
+FRECENCY_BOOST = 1.0
+FRAME_BUDGET = 1 / 60
+MAX_WAIT_TIME = 0.3
+LATENCY_SMOOTHING = 0.3
+
+_NO_DEFAULT = object()
+
 
 class InquirerPyFuzzyControl(InquirerPyUIListControl):
     """An :class:`~prompt_toolkit.layout.UIControl` class that displays a list of choices.
@@ -78,28 +102,198 @@ class InquirerPyFuzzyControl(InquirerPyUIListControl):
         multiselect: bool,
         marker_pl: str,
         match_exact: bool,
+        cache_size: int = 32,
+        cache_budget: Optional[int] = 1000000,
+        executor: Optional[str] = None,
+        workers: int = 1,
+        backend: str = "python",
+        exact_index: bool = False,
+        chunk_size: int = 10000,
+        history: Optional[FrecencyHistory] = None,
+        on_progress: Optional[Callable[[RankedChoices], None]] = None,
+        compact: bool = False,
     ) -> None:
         self._pointer = pointer
         self._marker = marker
         self._marker_pl = marker_pl
         self._current_text = current_text
-        self._max_lines = max_lines if max_lines > 0 else 1
         self._scorer = fzy_scorer if not match_exact else substr_scorer
+        self._previous_query = ""
+        self._previous_scorer = None
+        self._previous_haystacks: List[Dict[str, Any]] = []
+        self._previous_count = 0
+        self._source: Any = None
+        self._loading = False
+        self._on_progress = on_progress
+        self._progress: Optional[Tuple[int, int, int]] = None
+        self._cost: Optional[float] = None
+        self._cache = LRUCache(
+            max_entries=cache_size,
+            max_size=cache_budget,
+            sizeof=len,
+        )
+        self._indices_cache = LRUCache(max_entries=INDICES_CACHE_SIZE)
+        self._history = history
+        self._boosts: Dict[int, float] = {}
+        self._promoted: List[int] = []
         super().__init__(
             choices=choices,
             default=None,
             session_result=session_result,
             multiselect=multiselect,
+            compact=compact,
+            max_lines=max_lines,
+        )
+        self._names = (
+            self.choices.names
+            if isinstance(self.choices, ChoiceStore)
+            else [choice["name"] for choice in self.choices]
         )
+        if backend not in {"python", "numpy"}:
+            raise InvalidArgument(
+                "argument backend should be either 'python' or 'numpy'"
+            )
+        if backend == "numpy" and executor:
+            raise InvalidArgument(
+                "argument backend 'numpy' cannot be used together with executor"
+            )
+        if chunk_size < 1:
+            raise InvalidArgument("argument chunk_size should be a positive integer")
+        if backend == "numpy":
+            from InquirerPy.matcher.vectorized import VectorizedMatcher
 
-    def _format_choices(self) -> None:
-        for index, choice in enumerate(self.choices):
+            self._matcher: Matcher = VectorizedMatcher(
+                self._names, chunk_size=chunk_size, exact_index=exact_index
+            )
+        elif executor:
+            self._matcher = ExecutorMatcher(
+                self._names,
+                executor=executor,
+                chunk_size=chunk_size,
+                workers=workers,
+                exact_index=exact_index,
+            )
+        else:
+            self._matcher = Matcher(
+                self._names, chunk_size=chunk_size, exact_index=exact_index
+            )
+        if history is not None:
+            self._add_boosts(0)
+            self._filtered_choices = self._get_unfiltered()
+
+    def _get_choices(
+        self, choices: Any, default: Any
+    ) -> Union[List[Dict[str, Any]], ChoiceStore]:
+        """Defer the processing of streamed choices to :meth:`.InquirerPyFuzzyControl._append_choices`."""
+        if is_stream(choices):
+            self._source = choices
+            return ChoiceStore() if self._compact else []
+        return super()._get_choices(choices, default)
+
+    def _safety_check(self) -> None:
+        """Skip the validation when streaming since the choices are not received yet."""
+        if self._source is None:
+            super()._safety_check()
+
+    def _append_choices(self, choices: List[Any]) -> None:
+        """Process and append choices received from the stream.
+
+        Cached results are dropped as they don't contain the new choices. Without a query,
+        the displayed choices are refreshed when the new choices are selected before.
+
+        Args:
+            choices: Raw choices to append.
+
+        Raises:
+            InvalidArgument: When the choices contain :class:`~InquirerPy.separator.Separator`.
+        """
+        start = len(self.choices)
+        processed_choices = list(self._iter_choices(choices, _NO_DEFAULT, start))
+        for index, choice in enumerate(processed_choices, start=start):
             if isinstance(choice["value"], Separator):
                 raise InvalidArgument(
                     "fuzzy prompt argument choices should not contain Separator"
                 )
-            choice["index"] = index
-            choice["indices"] = []
+            if not self._compact:
+                choice["index"] = index
+        names = [choice["name"] for choice in processed_choices]
+        if not self._compact:
+            processed_choices = self._track_choices(processed_choices, start)
+        self.choices.extend(processed_choices)
+        if not self._compact:
+            cast(List[str], self._names).extend(names)
+        self._matcher.on_extend(names)
+        if self._history is not None:
+            promoted = self._promoted
+            self._add_boosts(start)
+            if self._promoted is not promoted and not self._current_text():
+                self._filtered_choices = self._get_unfiltered()
+        self._cache.clear()
+        self._height = min(self._max_lines, self.choice_count)
+
+    def _add_boosts(self, start: int) -> None:
+        """Boost the choices from `start` which were selected before.
+
+        The boost of the most frecent choice is `FRECENCY_BOOST` and the others are
+        proportional to their frecency, refer to :class:`~InquirerPy.history.FrecencyHistory`.
+
+        Args:
+            start: Index of the first choice to look up in the history.
+        """
+        frecency = cast(FrecencyHistory, self._history).get_frecency()
+        if not frecency:
+            return
+        top = max(frecency.values())
+        added = False
+        for index, name in enumerate(self._names[start:], start):
+            if name in frecency:
+                self._boosts[index] = FRECENCY_BOOST * frecency[name] / top
+                added = True
+        if added:
+            self._promoted = sorted(
+                self._boosts, key=lambda index: (-self._boosts[index], index)
+            )
+
+    def _boost(self, heap: MATCHES) -> MATCHES:
+        """Add the boost of the choices selected before to their score.
+
+        Args:
+            heap: Heap of matches with negated scores.
+
+        Returns:
+            The heap with boosted scores, the same heap if no choice is boosted.
+        """
+        boosts = self._boosts
+        if not boosts or not any(index in boosts for _, index in heap):
+            return heap
+        boosted = [(score - boosts.get(index, 0.0), index) for score, index in heap]
+        heapq.heapify(boosted)
+        return boosted
+
+    def _get_unfiltered(self) -> Sequence[Dict[str, Any]]:
+        """Get the choices to display without a query.
+
+        Returns:
+            All choices, with the choices selected before moved to the front.
+        """
+        if not self._promoted:
+            return self.choices
+        return PromotedChoices(self.choices, self._promoted)
+
+    def _format_choices(self) -> None:
+        if isinstance(self.choices, ChoiceStore):
+            if self.choices.separator_count:
+                raise InvalidArgument(
+                    "fuzzy prompt argument choices should not contain Separator"
+                )
+            self.choices.indexed = True
+        else:
+            for index, choice in enumerate(self.choices):
+                if isinstance(choice["value"], Separator):
+                    raise InvalidArgument(
+                        "fuzzy prompt argument choices should not contain Separator"
+                    )
+                choice["index"] = index
         self._filtered_choices = self.choices
         self._first_line = 0
         self._last_line = min(self._max_lines, self.choice_count)
@@ -125,15 +319,9 @@ class InquirerPyFuzzyControl(InquirerPyUIListControl):
             )
         )
         display_choices.append(("[SetCursorPosition]", ""))
-        if not choice["indices"]:
-            display_choices.append(("class:pointer", choice["name"]))
-        else:
-            indices = set(choice["indices"])
-            for index, char in enumerate(choice["name"]):
-                if index in indices:
-                    display_choices.append(("class:fuzzy_match", char))
-                else:
-                    display_choices.append(("class:pointer", char))
+        display_choices += self._get_highlighted_text(
+            choice["name"], self._get_indices(choice), "class:pointer"
+        )
         if "instruction" in choice and choice["instruction"]:
             display_choices.append(
                 ("class:choice_instruction", " " + choice["instruction"])
@@ -161,23 +349,68 @@ class InquirerPyFuzzyControl(InquirerPyUIListControl):
                 else self._marker_pl,
             )
         )
-        if not choice["indices"]:
-            display_choices.append(("", choice["name"]))
-        else:
-            indices = set(choice["indices"])
-            for index, char in enumerate(choice["name"]):
-                if index in indices:
-                    display_choices.append(("class:fuzzy_match", char))
-                else:
-                    display_choices.append(("", char))
+        display_choices += self._get_highlighted_text(
+            choice["name"], self._get_indices(choice), ""
+        )
         return display_choices
 
+    @staticmethod
+    def _get_highlighted_text(
+        name: str, indices: List[int], style: str
+    ) -> List[Tuple[str, str]]:
+        """Split the `name` into runs of matched and unmatched chars.
+
+        Each run is a single fragment, matched runs are styled with `class:fuzzy_match`.
+
+        Args:
+            name: Name of the choice.
+            indices: Sorted indices of the matched chars in `name`.
+            style: Style of the unmatched chars.
+
+        Returns:
+            FormattedText in list of tuple format.
+
+        Examples:
+            >>> InquirerPyFuzzyControl._get_highlighted_text("abcd", [1, 2], "")
+            [('', 'a'), ('class:fuzzy_match', 'bc'), ('', 'd')]
+        """
+        fragments = []
+        start = 0
+        for _, run in groupby(enumerate(indices), lambda pair: pair[1] - pair[0]):
+            matched = [index for _, index in run]
+            end = matched[-1] + 1
+            if matched[0] > start:
+                fragments.append((style, name[start : matched[0]]))
+            fragments.append(("class:fuzzy_match", name[matched[0] : end]))
+            start = end
+        if start < len(name) or not fragments:
+            fragments.append((style, name[start:]))
+        return fragments
+
+    def _get_fragment_key(self, choice: Dict[str, Any]) -> Hashable:
+        """Get the state of the `choice` which its formatted text depends on.
+
+        The highlighted indices only depend on the filtered query and scorer, refer to
+        :meth:`.InquirerPyFuzzyControl._get_indices`.
+        """
+        filtered_choices = self._filtered_choices
+        if isinstance(filtered_choices, RankedChoices):
+            query = (filtered_choices.needle, filtered_choices.scorer)
+        else:
+            query = None
+        return (
+            choice["name"],
+            self.choices[choice["index"]]["enabled"],
+            choice.get("instruction"),
+            query,
+        )
+
     def _get_formatted_choices(self) -> List[Tuple[str, str]]:
         """Get all available choices in formatted text format.
 
         Overriding this method because `self.choice` will be the
         full choice list. Using `self.filtered_choice` to get
-        a list of choice based on current_text.
+        a list of choice based on current_text, refer to :meth:`.InquirerPyUIListControl._get_viewport`.
 
         Returns:
             FormattedText in list of tuple format.
@@ -192,35 +425,66 @@ class InquirerPyFuzzyControl(InquirerPyUIListControl):
         elif self._selected_choice_index >= self.choice_count:
             self._selected_choice_index = self.choice_count - 1
 
-        if (self._last_line - self._first_line) < min(self.choice_count, self._height):
-            self._last_line = min(self.choice_count, self._height)
-            self._first_line = self._last_line - min(self.choice_count, self._height)
-
-        if self._selected_choice_index <= self._first_line:
-            self._first_line = self._selected_choice_index
-            self._last_line = self._first_line + min(self._height, self.choice_count)
-        elif self._selected_choice_index >= self._last_line:
-            self._last_line = self._selected_choice_index + 1
-            self._first_line = self._last_line - min(self._height, self.choice_count)
-
-        if self._last_line > self.choice_count:
-            self._last_line = self.choice_count
-            self._first_line = self._last_line - min(self._height, self.choice_count)
-        if self._first_line < 0:
-            self._first_line = 0
-            self._last_line = self._first_line + min(self._height, self.choice_count)
-
-        for index in range(self._first_line, self._last_line):
-            if index == self.selected_choice_index:
-                display_choices += self._get_hover_text(self._filtered_choices[index])
-            else:
-                display_choices += self._get_normal_text(self._filtered_choices[index])
+        for index in self._get_viewport():
+            choice = self._filtered_choices[index]
+            display_choices += self._get_choice_text(
+                choice["index"], choice, index == self.selected_choice_index
+            )
             display_choices.append(("", "\n"))
         if display_choices:
             display_choices.pop()
         return display_choices
 
-    async def _filter_choices(self, wait_time: float) -> List[Dict[str, Any]]:
+    def _get_haystacks(self, query: str) -> List[Dict[str, Any]]:
+        """Get the choices that needs to be scored against the `query`.
+
+        When the `query` extends the previous query with the same scorer, only the
+        choices matched by the previous query and the choices streamed afterwards
+        can match the new query. Otherwise fallback to the full choice list.
+
+        Args:
+            query: The current query to match.
+
+        Returns:
+            Choices to be scored.
+        """
+        if self._is_narrowing(query):
+            if self._previous_count < len(self.choices):
+                return self._previous_haystacks + self.choices[self._previous_count :]
+            return self._previous_haystacks
+        return self.choices
+
+    def _get_haystack_count(self, query: str) -> int:
+        """Get the number of choices :meth:`.InquirerPyFuzzyControl._get_haystacks` returns without copying them.
+
+        Args:
+            query: The current query to match.
+
+        Returns:
+            Number of choices to be scored.
+        """
+        if self._is_narrowing(query):
+            return len(self._previous_haystacks) + max(
+                len(self.choices) - self._previous_count, 0
+            )
+        return len(self.choices)
+
+    def _is_narrowing(self, query: str) -> bool:
+        """Check if the `query` extends the previous query with the same scorer.
+
+        Args:
+            query: The current query to match.
+
+        Returns:
+            Boolean indicating if only the previous matches and the newly streamed choices need to be scored.
+        """
+        return bool(
+            self._previous_query
+            and self._previous_scorer == self._scorer
+            and query.startswith(self._previous_query)
+        )
+
+    async def _filter_choices(self, wait_time: float) -> Sequence[Dict[str, Any]]:
         """Call to filter choices using fzy fuzzy match.
 
         Args:
@@ -230,19 +494,203 @@ class InquirerPyFuzzyControl(InquirerPyUIListControl):
             Filtered choices.
         """
         if not self._current_text():
-            for choice in self.choices:
-                choice["indices"] = []
-            choices = self.choices
+            self._previous_query = ""
+            self._previous_haystacks = []
+            self._previous_count = 0
+            return self._get_unfiltered()
+        await asyncio.sleep(wait_time)
+        query = self._current_text()
+        scorer = self._scorer
+        haystacks = self._get_haystacks(query)
+        count = len(self.choices)
+        start = time.perf_counter()
+        on_chunk = None
+        if self._on_progress is not None:
+            self._progress = (0, 0, len(haystacks))
+            on_chunk = self._get_chunk_handler(query, scorer, len(haystacks))
+        heaps = await self._matcher.match(
+            query,
+            scorer,
+            None
+            if haystacks is self.choices
+            else [choice["index"] for choice in haystacks],
+            on_chunk=on_chunk,
+        )
+        self._progress = None
+        self._record_latency(time.perf_counter() - start, len(haystacks))
+        while count < len(self.choices):
+            start, count = count, len(self.choices)
+            heaps += await self._matcher.match(query, scorer, range(start, count))
+        heaps = [self._boost(heap) for heap in heaps]
+        choices = RankedChoices(
+            self.choices, heaps, step=self._max_lines, needle=query, scorer=scorer
+        )
+        self._cache.set((query, scorer), choices)
+        self._remember(query, scorer, choices)
+        return choices
+
+    async def _filter_appended(self) -> None:
+        """Score the streamed choices that are not in the current filtered choices yet.
+
+        The new matches are added to the current filtered choices instead of filtering
+        all choices again. When the filtered choices are cached, their size is accounted
+        again in the cache budget.
+        """
+        choices = self._filtered_choices
+        if not isinstance(choices, RankedChoices):
+            return
+        while self._previous_count < len(self.choices):
+            start, count = self._previous_count, len(self.choices)
+            if (
+                self._previous_query != choices.needle
+                or self._previous_scorer != choices.scorer
+            ):
+                return
+            heaps = await self._matcher.match(
+                choices.needle, cast(Callable, choices.scorer), range(start, count)
+            )
+            if self._filtered_choices is not choices or self._previous_count != start:
+                return
+            heaps = [self._boost(heap) for heap in heaps]
+            choices.extend(heaps)
+            self._previous_haystacks.extend(
+                self.choices[index] for heap in heaps for _, index in heap
+            )
+            self._previous_count = count
+        key = (choices.needle, choices.scorer)
+        if key in self._cache and self._cache.get(key) is choices:
+            self._cache.pop(key)
+            self._cache.set(key, choices)
+
+    def _record_latency(self, elapsed: float, count: int) -> None:
+        """Update the average time to score a single choice.
+
+        Args:
+            elapsed: Time spent to filter the choices in seconds.
+            count: Number of choices scored.
+        """
+        if count <= 0:
+            return
+        cost = elapsed / count
+        if self._cost is None:
+            self._cost = cost
         else:
-            await asyncio.sleep(wait_time)
-            choices = await fuzzy_match(
-                self._current_text(),
-                cast(HAYSTACKS, self.choices),
-                key="name",
-                scorer=self._scorer,
+            self._cost += LATENCY_SMOOTHING * (cost - self._cost)
+
+    def _estimate_latency(self, query: str) -> float:
+        """Estimate the time required to filter the choices with `query`.
+
+        Args:
+            query: The query to filter.
+
+        Returns:
+            Estimated time in seconds based on the recent filters, 0 if nothing is filtered yet.
+        """
+        if not query or self._cost is None:
+            return 0.0
+        return self._cost * self._get_haystack_count(query)
+
+    def _get_indices(self, choice: Dict[str, Any]) -> List[int]:
+        """Get the matching indices of the `choice` to highlight.
+
+        Filtering only calculates the score of the choices, the indices are calculated
+        when the choice is displayed and cached by the query, scorer and choice.
+
+        Args:
+            choice: The choice being displayed.
+
+        Returns:
+            Indices of the matched chars in the choice name, empty if not filtering.
+        """
+        filtered_choices = self._filtered_choices
+        if (
+            not isinstance(filtered_choices, RankedChoices)
+            or filtered_choices.scorer is None
+        ):
+            return []
+        key = (filtered_choices.needle, filtered_choices.scorer, choice["index"])
+        indices = self._indices_cache.get(key)
+        if indices is None:
+            _, indices = filtered_choices.scorer(
+                filtered_choices.needle, choice["name"]
+            )
+            indices = indices or []
+            self._indices_cache.set(key, indices)
+        return indices
+
+    def _get_chunk_handler(
+        self, query: str, scorer: Callable, total: int
+    ) -> Callable[[MATCHES, int], None]:
+        """Get the callback to publish partial results after each scored chunk.
+
+        Only the best `self._max_lines` matches of the scored chunks are kept, the
+        full ranking is published once all chunks are scored.
+
+        Args:
+            query: The query being filtered.
+            scorer: The scorer used to filter the choices.
+            total: Total number of choices to be scored.
+
+        Returns:
+            Callback for :meth:`~InquirerPy.matcher.Matcher.match`.
+        """
+        top: MATCHES = []
+        published = 0.0
+
+        def handler(heap: MATCHES, scanned: int) -> None:
+            nonlocal top, published
+            matched, scanned_total, _ = cast(Tuple[int, int, int], self._progress)
+            self._progress = (matched + len(heap), scanned_total + scanned, total)
+            top = heapq.nsmallest(self._max_lines, chain(top, self._boost(heap)))
+            now = time.monotonic()
+            if now - published < PROGRESS_INTERVAL:
+                return
+            published = now
+            cast(Callable, self._on_progress)(
+                RankedChoices(
+                    self.choices,
+                    [top.copy()],
+                    step=self._max_lines,
+                    needle=query,
+                    scorer=scorer,
+                )
             )
+
+        return handler
+
+    def _get_cached_choices(self, query: str) -> Optional[RankedChoices]:
+        """Get the filtered choices of `query` from the result cache.
+
+        Args:
+            query: The query to lookup.
+
+        Returns:
+            Filtered choices if `query` has been filtered recently, otherwise None.
+        """
+        if not query:
+            return None
+        choices = self._cache.get((query, self._scorer))
+        if choices is not None:
+            self._remember(query, self._scorer, choices)
         return choices
 
+    def _remember(self, query: str, scorer: Callable, choices: RankedChoices) -> None:
+        """Store the matches of `query` for narrowing the next query.
+
+        Args:
+            query: The filtered query.
+            scorer: The scorer used to filter the choices.
+            choices: Filtered choices of `query`.
+        """
+        self._previous_query = query
+        self._previous_scorer = scorer
+        self._previous_haystacks = list(choices.unordered())
+        self._previous_count = len(self.choices)
+
+    def _close(self) -> None:
+        """Release the resources held by `self._matcher`."""
+        self._matcher.close()
+
     @property
     def selection(self) -> Dict[str, Any]:
         """Override this value since `self.choice` does not indicate the choice displayed.
@@ -265,7 +713,8 @@ class FuzzyPrompt(BaseListPrompt):
 
     A wrapper class around :class:`~prompt_toolkit.application.Application`.
 
-    Fuzzy search using :func:`pfzy.match.fuzzy_match` function.
+    Fuzzy search using :func:`pfzy.score.fzy_scorer` function. Only the visible matches are sorted,
+    the rest of the matches are sorted lazily when scrolling through them.
 
     Override the default keybindings for up/down as j/k cannot be bind even if `editing_mode` is vim
     due to the input buffer.
@@ -275,6 +724,8 @@ class FuzzyPrompt(BaseListPrompt):
             Refer to :ref:`pages/dynamic:message` documentation for more details.
         choices: List of choices to display and select.
             Refer to :ref:`pages/dynamic:choices` documentation for more details.
+            Can also be an iterator, async iterator or readable file object (e.g. :data:`sys.stdin`), the prompt
+            is displayed immediately and the choices are appended and filtered as they are received.
         style: An :class:`InquirerPyStyle` instance.
             Refer to :ref:`Style <pages/style:Alternate Syntax>` documentation for more details.
         vi_mode: Use vim keybinding for the prompt.
@@ -311,6 +762,35 @@ class FuzzyPrompt(BaseListPrompt):
         info: Display choice information similar to fzf --info=inline next to the prompt.
         match_exact: Use exact sub-string match instead of using fzy fuzzy match algorithm.
         exact_symbol: Custom symbol to display in the info section when `info=True`.
+        cache_size: Number of recent queries to keep the filtered result in memory.
+            Revisited queries (e.g. backspace) are displayed immediately without filtering again.
+            Set to 0 to disable the cache.
+        cache_budget: Maximum total number of matched choices kept across all cached queries.
+            Set to None to only bound the cache by `cache_size`.
+        executor: Score the choices in a "thread" or "process" pool instead of the event loop.
+            The pool keeps its own copy of the choice names and scores them in chunks, outdated
+            queries stop after the current chunk. Recommended for large data set.
+        workers: Number of processes to shard the choices across when `executor` is "process".
+            Each process scores its own shard so the filtering can use multiple cores.
+        backend: Score the choices one by one with "python" or all choices of a chunk at once with "numpy".
+            The "numpy" backend requires numpy to be installed and cannot be used together with `executor`.
+        exact_index: Build a trigram index of the choices in the background when exact sub-string match is first used.
+            Queries containing words of 3 or more characters then only score the choices containing all of their trigrams.
+            Recommended for exact match on millions of choices, the index requires additional memory.
+        chunk_size: Number of choices to score in one go. The event loop or the pool only gets a chance
+            to process keystrokes and cancel outdated queries between chunks, smaller chunks respond faster
+            while larger chunks have less scheduling overhead.
+        history: Record the selected choices in a :class:`~InquirerPy.history.FrecencyHistory`. Choices selected
+            before are displayed first when there is no query and their scores are boosted by their frecency.
+        preview: A function which generates the preview of the highlighted choice, displayed next to the choices.
+            The function receives the value of the choice and returns the preview text, it can also be a coroutine function.
+            Previews are generated in the background and cancelled when another choice is highlighted.
+        preview_cache_size: Number of previews to keep in memory so that revisited choices are displayed immediately.
+        progressive: Display the best matches of the scored choices while the remaining choices
+            are still being scored. The info section displays the matched/scanned/total count until
+            the filtering is finished.
+        compact: Store the choices in a :class:`~InquirerPy.base.store.ChoiceStore` instead of a list of dictionaries.
+            Reduces the memory usage for large data set at the cost of slightly slower access to each choice.
         marker: Marker Symbol. Custom symbol to indicate if a choice is selected.
             This will take effects when `multiselect` is True.
         marker_pl: Marker place holder when the choice is not selected.
@@ -324,6 +804,8 @@ class FuzzyPrompt(BaseListPrompt):
         mandatory: Indicate if the prompt is mandatory. If True, then the question cannot be skipped.
         mandatory_message: Error message to show when user attempts to skip mandatory prompt.
         session_result: Used internally for :ref:`index:Classic Syntax (PyInquirer)`.
+        profiler: Time the keybinding handlers, validation, choice formatting and render passes of the prompt.
+            Refer to :class:`~InquirerPy.profiler.Profiler` documentation for more details.
 
     Examples:
         >>> from InquirerPy import inquirer
@@ -354,6 +836,18 @@ class FuzzyPrompt(BaseListPrompt):
         info: bool = True,
         match_exact: bool = False,
         exact_symbol: str = " E",
+        cache_size: int = 32,
+        cache_budget: Optional[int] = 1000000,
+        executor: Optional[str] = None,
+        workers: int = 1,
+        backend: str = "python",
+        exact_index: bool = False,
+        chunk_size: int = 10000,
+        history: Optional[FrecencyHistory] = None,
+        preview: Optional[InquirerPyPreview] = None,
+        preview_cache_size: int = PREVIEW_CACHE_SIZE,
+        progressive: bool = False,
+        compact: bool = False,
         height: Optional[Union[str, int]] = None,
         max_height: Optional[Union[str, int]] = None,
         validate: Optional[InquirerPyValidate] = None,
@@ -365,6 +859,7 @@ class FuzzyPrompt(BaseListPrompt):
         mandatory: bool = True,
         mandatory_message: str = "Mandatory prompt",
         session_result: Optional[InquirerPySessionResult] = None,
+        profiler: Optional[Profiler] = None,
     ) -> None:
         if not keybindings:
             keybindings = {}
@@ -402,6 +897,8 @@ class FuzzyPrompt(BaseListPrompt):
             mandatory=mandatory,
             mandatory_message=mandatory_message,
             session_result=session_result,
+            profiler=profiler,
+            history=history,
         )
         self.kb_func_lookup = {"toggle-exact": [{"func": self._toggle_exact}]}
         self._default = (
@@ -424,6 +921,16 @@ class FuzzyPrompt(BaseListPrompt):
             multiselect=multiselect,
             marker_pl=marker_pl,
             match_exact=match_exact,
+            cache_size=cache_size,
+            cache_budget=cache_budget,
+            executor=executor,
+            workers=workers,
+            backend=backend,
+            exact_index=exact_index,
+            chunk_size=chunk_size,
+            history=history,
+            on_progress=self._on_progress if progressive else None,
+            compact=compact,
         )
 
         self._buffer = Buffer(on_text_changed=self._on_text_changed)
@@ -449,8 +956,26 @@ class FuzzyPrompt(BaseListPrompt):
             height=choice_height_dimmension,
             dont_extend_height=True,
         )
+        choice_content = self.choice_window
+        self._preview_window: Optional[PreviewWindow] = None
+        if preview is not None:
+            self._preview_window = PreviewWindow(
+                preview=preview,
+                get_choice=self._get_highlighted_choice,
+                cache_size=preview_cache_size,
+                height=choice_height_dimmension,
+                dont_extend_height=True,
+                wrap_lines=False,
+            )
+            choice_content = VSplit(
+                [
+                    self.choice_window,
+                    Window(width=1, char="│", style="class:frame.border"),
+                    self._preview_window,
+                ]
+            )
 
-        main_content_window = HSplit([input_window, self.choice_window])
+        main_content_window = HSplit([input_window, choice_content])
         if self._border:
             main_content_window = Frame(main_content_window)
         self._layout = Layout(
@@ -522,11 +1047,33 @@ class FuzzyPrompt(BaseListPrompt):
         Setting buffer default text has to be after application is rendered and choice are loaded,
         because `self._filter_choices` will use the event loop from `Application`.
         """
+        self._application.create_background_task(
+            self.content_control._matcher.build_index()
+        )
+        if self.content_control._source is not None:
+            self._application.create_background_task(self._stream_choices())
         if self._default:
             default_text = str(self._default)
             self._buffer.text = default_text
             self._buffer.cursor_position = len(default_text)
 
+    async def _stream_choices(self) -> None:
+        """Append the choices received from the stream and filter them with the current query.
+
+        A running filter task includes the received choices once it is finished, otherwise only the received
+        choices are scored and added to the current result.
+        """
+        self.content_control.loading = True
+        try:
+            async for choices in iter_batches(self.content_control._source):
+                self.content_control._append_choices(choices)
+                if not self._task or self._task.done():
+                    await self.content_control._filter_appended()
+                self._redraw()
+        finally:
+            self.content_control.loading = False
+            self._redraw()
+
     def _handle_toggle_all(self, _, value: Optional[bool] = None) -> None:
         """Toggle all choice `enabled` status.
 
@@ -535,7 +1082,10 @@ class FuzzyPrompt(BaseListPrompt):
         """
         if not self._multiselect:
             return
-        for choice in self.content_control._filtered_choices:
+        filtered_choices = self.content_control._filtered_choices
+        if isinstance(filtered_choices, RankedChoices):
+            filtered_choices = filtered_choices.unordered()
+        for choice in filtered_choices:
             raw_choice = self.content_control.choices[choice["index"]]
             if isinstance(raw_choice["value"], Separator):
                 continue
@@ -546,18 +1096,29 @@ class FuzzyPrompt(BaseListPrompt):
         display_message = []
         if self._info:
             display_message.append(("", "  "))
-            display_message.append(
-                (
-                    "class:fuzzy_info",
-                    f"{self.content_control.choice_count}/{len(self.content_control.choices)}",
+            if self.content_control._progress is not None:
+                matched, scanned, total = self.content_control._progress
+                display_message.append(
+                    ("class:fuzzy_info", f"{matched}/{scanned}/{total}")
+                )
+            else:
+                display_message.append(
+                    (
+                        "class:fuzzy_info",
+                        f"{self.content_control.choice_count}/{len(self.content_control.choices)}",
+                    )
                 )
-            )
             if self._multiselect:
                 display_message.append(
-                    ("class:fuzzy_info", f" ({len(self.selected_choices)})")
+                    (
+                        "class:fuzzy_info",
+                        f" ({self.content_control.selected_count})",
+                    )
                 )
             if self.content_control._scorer == substr_scorer:
                 display_message.append(("class:fuzzy_info", self._exact_symbol))
+            if self.content_control.loading:
+                display_message.append(("class:fuzzy_info", " (loading)"))
         return display_message
 
     def _generate_before_input(self) -> List[Tuple[str, str]]:
@@ -573,38 +1134,34 @@ class FuzzyPrompt(BaseListPrompt):
         self.content_control._filtered_choices = task.result()
         self._application.invalidate()
 
+    def _on_progress(self, choices: RankedChoices) -> None:
+        """Redraw `self._application` with the partial result of the filter task."""
+        self.content_control._filtered_choices = choices
+        self._application.invalidate()
+
     def _calculate_wait_time(self) -> float:
         """Calculate wait time to smoother the application on big data set.
 
-        Using digit of the choices lengeth to get wait time.
-        For digit greater than 6, using formula 2^(digit - 5) * 0.3 to increase the wait_time.
+        The filter runs immediately when the recently measured scoring time indicates it
+        finishes within a frame. Otherwise wait for the estimated scoring time, capped at
+        `MAX_WAIT_TIME`, so that fast typing doesn't start filters to be cancelled anyway.
 
         Returns:
             Desired wait time before running the filter.
         """
-        wait_table = {
-            2: 0.05,
-            3: 0.1,
-            4: 0.2,
-            5: 0.3,
-        }
-        digit = 1
-        if len(self.content_control.choices) > 0:
-            digit = int(math.log10(len(self.content_control.choices))) + 1
-
-        if digit < 2:
+        latency = self.content_control._estimate_latency(self._buffer.text)
+        if latency <= FRAME_BUDGET:
             return 0.0
-        if digit in wait_table:
-            return wait_table[digit]
-        return wait_table[5] * (2 ** (digit - 5))
+        return min(latency, MAX_WAIT_TIME)
 
     def _on_text_changed(self, _) -> None:
         """Handle buffer text change event.
 
         1. Check if there is current task running.
         2. Cancel if already has task, increase wait_time
-        3. Create a filtered_choice task in asyncio event loop
-        4. Add callback
+        3. Use the cached result if the query is filtered recently
+        4. Create a filtered_choice task in asyncio event loop
+        5. Add callback
 
         1. Run a new filter on all choices.
         2. Re-calculate current selected_choice_index
@@ -618,9 +1175,14 @@ class FuzzyPrompt(BaseListPrompt):
         """
         if self._invalid:
             self._invalid = False
-        wait_time = self._calculate_wait_time()
         if self._task and not self._task.done():
             self._task.cancel()
+        self.content_control._progress = None
+        cached_choices = self.content_control._get_cached_choices(self._buffer.text)
+        if cached_choices is not None:
+            self.content_control._filtered_choices = cached_choices
+            return
+        wait_time = self._calculate_wait_time()
         self._task = asyncio.create_task(
             self.content_control._filter_choices(wait_time)
         )
@@ -653,7 +1215,7 @@ class FuzzyPrompt(BaseListPrompt):
             self._validator.validate(fake_document)  # type: ignore
             if self._multiselect:
                 self.status["answered"] = True
-                if not self.selected_choices:
+                if not self.content_control.selected_count:
                     self.status["result"] = [self.content_control.selection["name"]]
                     event.app.exit(result=[self.content_control.selection["value"]])
                 else:
@@ -682,3 +1244,47 @@ class FuzzyPrompt(BaseListPrompt):
     def _get_current_text(self) -> str:
         """Get current input buffer text."""
         return self._buffer.text
+
+    def _instrument(self, profiler: Profiler) -> None:
+        """Time the filtering and the scoring of the choices in addition to the other operations.
+
+        The filter time includes the wait time before filtering, refer to :meth:`.FuzzyPrompt._calculate_wait_time`.
+
+        Args:
+            profiler: Profiler to record the timings.
+        """
+        super()._instrument(profiler)
+        control = self.content_control
+        control._filter_choices = profiler.wrap_async(  # type: ignore
+            "filter_choices", control._filter_choices
+        )
+        control._matcher.match = profiler.wrap_async(  # type: ignore
+            "match", control._matcher.match
+        )
+
+    def _get_highlighted_choice(self) -> Optional[Dict[str, Any]]:
+        """Get the highlighted choice to preview, None if no choice matches the query."""
+        try:
+            return self.content_control.selection
+        except IndexError:
+            return None
+
+    def _close(self) -> None:
+        """Shutdown the scoring pool and cancel the pending preview."""
+        self.content_control._close()
+        if self._preview_window is not None:
+            self._preview_window.control.cancel()
+
+    def _run(self) -> Any:
+        """Run the application and shutdown the scoring pool."""
+        try:
+            return super()._run()
+        finally:
+            self._close()
+
+    async def _run_async(self) -> Any:
+        """Run the application asynchronously and shutdown the scoring pool."""
+        try:
+            return await super()._run_async()
+        finally:
+            self._close()
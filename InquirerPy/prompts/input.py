@@ -13,6 +13,7 @@ from prompt_toolkit.validation import ValidationError
 from InquirerPy.base import BaseSimplePrompt
 from InquirerPy.enum import INQUIRERPY_POINTER_SEQUENCE
 from InquirerPy.exceptions import InvalidArgument
+from InquirerPy.session import get_session
 from InquirerPy.utils import (
     InquirerPyDefault,
     InquirerPyKeybindings,
@@ -250,4 +251,7 @@ class InputPrompt(BaseSimplePrompt):
         return self._session.prompt(default=self._default)
 
     async def _run_async(self) -> Any:
+        session = get_session()
+        if session is not None:
+            return await session.run_prompt_session(self._session, self._default)
         return await self._session.prompt_async(default=self._default)
@@ -23,6 +23,8 @@ from InquirerPy.containers.instruction import InstructionWindow
 from InquirerPy.containers.message import MessageWindow
 from InquirerPy.containers.validation import ValidationFloat
 from InquirerPy.enum import INQUIRERPY_POINTER_SEQUENCE
+from InquirerPy.history import FrecencyHistory
+from InquirerPy.profiler import Profiler
 from InquirerPy.separator import Separator
 from InquirerPy.utils import (
     InquirerPyDefault,
@@ -56,6 +58,7 @@ class InquirerPyListControl(InquirerPyUIListControl):
         session_result: Optional[InquirerPySessionResult],
         multiselect: bool,
         marker_pl: str,
+        compact: bool = False,
     ) -> None:
         self._pointer: str = pointer
         self._marker: str = marker
@@ -65,6 +68,7 @@ class InquirerPyListControl(InquirerPyUIListControl):
             default=default,
             session_result=session_result,
             multiselect=multiselect,
+            compact=compact,
         )
 
     def _get_hover_text(self, choice) -> List[Tuple[str, str]]:
@@ -157,6 +161,12 @@ class ListPrompt(BaseListPrompt):
         mandatory: Indicate if the prompt is mandatory. If True, then the question cannot be skipped.
         mandatory_message: Error message to show when user attempts to skip mandatory prompt.
         session_result: Used internally for :ref:`index:Classic Syntax (PyInquirer)`.
+        profiler: Time the keybinding handlers, validation, choice formatting and render passes of the prompt.
+            Refer to :class:`~InquirerPy.profiler.Profiler` documentation for more details.
+        history: Record the selected choices in a :class:`~InquirerPy.history.FrecencyHistory`.
+            When `default` is not provided, the most frecent choice is highlighted initially.
+        compact: Store the choices in a :class:`~InquirerPy.base.store.ChoiceStore` instead of a list of dictionaries.
+            Reduces the memory usage for large data set at the cost of slightly slower access to each choice.
 
     Examples:
         >>> from InquirerPy import inquirer
@@ -195,6 +205,9 @@ class ListPrompt(BaseListPrompt):
         mandatory: bool = True,
         mandatory_message: str = "Mandatory prompt",
         session_result: Optional[InquirerPySessionResult] = None,
+        profiler: Optional[Profiler] = None,
+        history: Optional[FrecencyHistory] = None,
+        compact: bool = False,
     ) -> None:
         if not hasattr(self, "_content_control"):
             self.content_control = InquirerPyListControl(
@@ -205,6 +218,7 @@ class ListPrompt(BaseListPrompt):
                 session_result=session_result,
                 multiselect=multiselect,
                 marker_pl=marker_pl,
+                compact=compact,
             )
         super().__init__(
             message=message,
@@ -227,11 +241,24 @@ class ListPrompt(BaseListPrompt):
             mandatory=mandatory,
             mandatory_message=mandatory_message,
             session_result=session_result,
+            profiler=profiler,
+            history=history,
         )
+        if history is not None and default is None:
+            frecency = history.get_frecency()
+            best = 0.0
+            for index, choice in enumerate(
+                self.content_control.choices if frecency else []
+            ):
+                score = frecency.get(choice["name"], 0.0)
+                if score > best and not isinstance(choice["value"], Separator):
+                    best = score
+                    self.content_control.selected_choice_index = index
         self._show_cursor = show_cursor
         self._dimmension_height, self._dimmension_max_height = calculate_height(
             height, max_height, height_offset=self.height_offset
         )
+        self.content_control.max_lines = self._dimmension_max_height
         main_content_window = Window(
             content=self.content_control,
             height=Dimension(
@@ -354,7 +381,7 @@ class ListPrompt(BaseListPrompt):
             self._set_error(str(e))
         else:
             self.status["answered"] = True
-            if self._multiselect and not self.selected_choices:
+            if self._multiselect and not self.content_control.selected_count:
                 self.status["result"] = [self.content_control.selection["name"]]
                 event.app.exit(result=[self.content_control.selection["value"]])
             else:
@@ -30,6 +30,7 @@ from InquirerPy.containers.instruction import InstructionWindow
 from InquirerPy.containers.validation import ValidationWindow
 from InquirerPy.enum import INQUIRERPY_QMARK_SEQUENCE
 from InquirerPy.exceptions import InvalidArgument
+from InquirerPy.profiler import Profiler
 from InquirerPy.utils import (
     InquirerPyDefault,
     InquirerPyKeybindings,
@@ -94,6 +95,8 @@ class NumberPrompt(BaseComplexPrompt):
         mandatory: Indicate if the prompt is mandatory. If True, then the question cannot be skipped.
         mandatory_message: Error message to show when user attempts to skip mandatory prompt.
         session_result: Used internally for :ref:`index:Classic Syntax (PyInquirer)`.
+        profiler: Time the keybinding handlers, validation and render passes of the prompt.
+            Refer to :class:`~InquirerPy.profiler.Profiler` documentation for more details.
 
     Examples:
         >>> from InquirerPy import inquirer
@@ -127,6 +130,7 @@ class NumberPrompt(BaseComplexPrompt):
         mandatory: bool = True,
         mandatory_message: str = "Mandatory prompt",
         session_result: Optional[InquirerPySessionResult] = None,
+        profiler: Optional[Profiler] = None,
     ) -> None:
         super().__init__(
             message=message,
@@ -145,6 +149,7 @@ class NumberPrompt(BaseComplexPrompt):
             mandatory=mandatory,
             mandatory_message=mandatory_message,
             session_result=session_result,
+            profiler=profiler,
         )
 
         self._float = float_allowed
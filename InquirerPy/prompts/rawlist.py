@@ -4,6 +4,7 @@ from typing import Any, Callable, List, Optional, Tuple, Union
 from InquirerPy.base import InquirerPyUIListControl
 from InquirerPy.enum import INQUIRERPY_POINTER_SEQUENCE
 from InquirerPy.exceptions import InvalidArgument
+from InquirerPy.profiler import Profiler
 from InquirerPy.prompts.list import ListPrompt
 from InquirerPy.separator import Separator
 from InquirerPy.utils import (
@@ -35,6 +36,7 @@ class InquirerPyRawlistControl(InquirerPyUIListControl):
         session_result: Optional[InquirerPySessionResult],
         multiselect: bool,
         marker_pl: str,
+        compact: bool = False,
     ) -> None:
         self._pointer = pointer
         self._separator = separator
@@ -45,6 +47,7 @@ class InquirerPyRawlistControl(InquirerPyUIListControl):
             default=default,
             session_result=session_result,
             multiselect=multiselect,
+            compact=compact,
         )
 
     def _format_choices(self) -> None:
@@ -175,6 +178,10 @@ class RawlistPrompt(ListPrompt):
         mandatory: Indicate if the prompt is mandatory. If True, then the question cannot be skipped.
         mandatory_message: Error message to show when user attempts to skip mandatory prompt.
         session_result: Used internally for :ref:`index:Classic Syntax (PyInquirer)`.
+        profiler: Time the keybinding handlers, validation, choice formatting and render passes of the prompt.
+            Refer to :class:`~InquirerPy.profiler.Profiler` documentation for more details.
+        compact: Store the choices in a :class:`~InquirerPy.base.store.ChoiceStore` instead of a list of dictionaries.
+            Reduces the memory usage for large data set at the cost of slightly slower access to each choice.
 
     Examples:
         >>> from InquirerPy import inquirer
@@ -214,6 +221,8 @@ class RawlistPrompt(ListPrompt):
         mandatory: bool = True,
         mandatory_message: str = "Mandatory prompt",
         session_result: Optional[InquirerPySessionResult] = None,
+        profiler: Optional[Profiler] = None,
+        compact: bool = False,
     ) -> None:
         self.content_control = InquirerPyRawlistControl(
             choices=choices,
@@ -224,6 +233,7 @@ class RawlistPrompt(ListPrompt):
             session_result=session_result,
             multiselect=multiselect,
             marker_pl=marker_pl,
+            compact=compact,
         )
         super().__init__(
             message=message,
@@ -250,6 +260,8 @@ class RawlistPrompt(ListPrompt):
             mandatory=mandatory,
             mandatory_message=mandatory_message,
             session_result=session_result,
+            profiler=profiler,
+            compact=compact,
         )
 
     def _on_rendered(self, _) -> None:
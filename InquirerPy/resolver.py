@@ -2,19 +2,21 @@
 
 A `PyInquirer <https://github.com/CITGuru/PyInquirer>`_ compatible entrypoint :func:`.prompt`.
 """
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
+from InquirerPy import prompts
 from InquirerPy.exceptions import InvalidArgument, RequiredKeyNotFound
-from InquirerPy.prompts.checkbox import CheckboxPrompt
-from InquirerPy.prompts.confirm import ConfirmPrompt
-from InquirerPy.prompts.expand import ExpandPrompt
-from InquirerPy.prompts.filepath import FilePathPrompt
-from InquirerPy.prompts.fuzzy import FuzzyPrompt
-from InquirerPy.prompts.input import InputPrompt
-from InquirerPy.prompts.list import ListPrompt
-from InquirerPy.prompts.number import NumberPrompt
-from InquirerPy.prompts.rawlist import RawlistPrompt
-from InquirerPy.prompts.secret import SecretPrompt
 from InquirerPy.utils import (
     InquirerPyKeybindings,
     InquirerPyQuestions,
@@ -22,20 +24,56 @@ from InquirerPy.utils import (
     get_style,
 )
 
+if TYPE_CHECKING:
+    from InquirerPy.base.simple import BaseSimplePrompt
+
 __all__ = ["prompt", "prompt_async"]
 
-question_mapping = {
-    "confirm": ConfirmPrompt,
-    "filepath": FilePathPrompt,
-    "password": SecretPrompt,
-    "input": InputPrompt,
-    "list": ListPrompt,
-    "checkbox": CheckboxPrompt,
-    "rawlist": RawlistPrompt,
-    "expand": ExpandPrompt,
-    "fuzzy": FuzzyPrompt,
-    "number": NumberPrompt,
-}
+
+class _QuestionMapping(Mapping):
+    """Mapping of the question types to the prompt classes, imported on first lookup.
+
+    Args:
+        classes: Name of the prompt class of each question type.
+    """
+
+    def __init__(self, classes: Dict[str, str]) -> None:
+        self._classes = classes
+
+    def __getitem__(self, question_type: str) -> Type["BaseSimplePrompt"]:
+        """Get the prompt class of `question_type`."""
+        return getattr(prompts, self._classes[question_type])
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate the question types."""
+        return iter(self._classes)
+
+    def __len__(self) -> int:
+        """Get the number of question types."""
+        return len(self._classes)
+
+
+question_mapping = _QuestionMapping(
+    {
+        "confirm": "ConfirmPrompt",
+        "filepath": "FilePathPrompt",
+        "password": "SecretPrompt",
+        "input": "InputPrompt",
+        "list": "ListPrompt",
+        "checkbox": "CheckboxPrompt",
+        "rawlist": "RawlistPrompt",
+        "expand": "ExpandPrompt",
+        "fuzzy": "FuzzyPrompt",
+        "number": "NumberPrompt",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Get the prompt classes previously imported by this module, imported on first access."""
+    if name not in prompts.__all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(prompts, name)
 
 
 def _get_questions(questions: InquirerPyQuestions) -> List[Dict[str, Any]]:
@@ -88,11 +126,27 @@ async def prompt_async(
     raise_keyboard_interrupt: bool = True,
     keybindings: Optional[InquirerPyKeybindings] = None,
     style_override: bool = True,
+    single_application: bool = False,
 ) -> InquirerPySessionResult:
     """Classic syntax entrypoint to create a prompt session via asynchronous method.
 
     Refer to :func:`InquirerPy.resolver.prompt` for detailed documentations.
     """
+    if single_application:
+        from InquirerPy.session import SessionApplication, get_session
+
+        if get_session() is None:
+            return await SessionApplication().run_session_async(
+                prompt_async(
+                    questions=questions,
+                    style=style,
+                    vi_mode=vi_mode,
+                    raise_keyboard_interrupt=raise_keyboard_interrupt,
+                    keybindings=keybindings,
+                    style_override=style_override,
+                )
+            )
+
     result: InquirerPySessionResult = {}
     if not keybindings:
         keybindings = {}
@@ -131,6 +185,7 @@ def prompt(
     raise_keyboard_interrupt: bool = True,
     keybindings: Optional[InquirerPyKeybindings] = None,
     style_override: bool = True,
+    single_application: bool = False,
 ) -> InquirerPySessionResult:
     """Classic syntax entrypoint to create a prompt session.
 
@@ -145,6 +200,9 @@ def prompt(
             will be `None` and the question is skiped.
         keybindings: List of custom :ref:`pages/kb:Keybindings` to apply. Refer to documentation for more info.
         style_override: Override all default styles. When providing any style customisation, all default styles are removed when this is True.
+        single_application: Display all questions in a single :class:`~prompt_toolkit.application.Application` instead of
+            creating one for each question. The terminal is set up once and answered questions are kept above the current one.
+            Refer to :class:`~InquirerPy.session.SessionApplication` for more info.
 
     Returns:
         A dictionary containing all of the question answers. The key is the name of the question and the value is the
@@ -188,6 +246,20 @@ def prompt(
         ... ]
         >>> result = prompt(questions=questions)
     """
+    if single_application:
+        from InquirerPy.session import SessionApplication
+
+        return SessionApplication().run_session(
+            prompt_async(
+                questions=questions,
+                style=style,
+                vi_mode=vi_mode,
+                raise_keyboard_interrupt=raise_keyboard_interrupt,
+                keybindings=keybindings,
+                style_override=style_override,
+            )
+        )
+
     result: InquirerPySessionResult = {}
     if not keybindings:
         keybindings = {}
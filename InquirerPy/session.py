@@ -0,0 +1,230 @@
+"""Module contains the class :class:`.SessionApplication` which runs multiple prompts in one application."""
+import asyncio
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Awaitable, Optional, TypeVar
+
+from prompt_toolkit.application import Application
+from prompt_toolkit.document import Document
+from prompt_toolkit.layout.containers import Window
+from prompt_toolkit.layout.layout import Layout
+
+if TYPE_CHECKING:
+    from prompt_toolkit.shortcuts import PromptSession
+
+__all__ = ["SessionApplication", "get_session"]
+
+T = TypeVar("T")
+
+_GUEST_ATTRIBUTES = ("invalidate", "create_background_task", "exit")
+
+_current_session: ContextVar[Optional["SessionApplication"]] = ContextVar(
+    "_current_session", default=None
+)
+
+
+def get_session() -> Optional["SessionApplication"]:
+    """Get the :class:`.SessionApplication` running the prompts of the current context.
+
+    Returns:
+        The running session, None if the prompts run their own application.
+    """
+    return _current_session.get()
+
+
+class SessionApplication(Application):
+    """An :class:`~prompt_toolkit.application.Application` hosting the applications of multiple prompts.
+
+    The terminal is set up once and a single renderer is kept alive across all prompts.
+    Each prompt still creates its own :class:`~prompt_toolkit.application.Application`, which
+    is never run. Its layout, key bindings and style are swapped into the session instead and
+    its `exit`, `invalidate` and `create_background_task` are forwarded to the session while it
+    is displayed. Answered prompts are rendered in their done state and kept above the next prompt.
+
+    Prompts executed while :meth:`.SessionApplication.run_session` is running use the session
+    automatically, refer to :func:`.get_session`.
+
+    Examples:
+        >>> from InquirerPy import inquirer
+        >>> async def ask():
+        ...     name = await inquirer.text(message="Name:").execute_async()
+        ...     return await inquirer.confirm(message=f"Confirm {name}?").execute_async()
+        >>> confirmed = SessionApplication().run_session(ask())  # doctest: +SKIP
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(layout=self._get_idle_layout(), **kwargs)
+        self._guest: Optional[Application] = None
+        self._guest_future: Optional["asyncio.Future[Any]"] = None
+        self._typeahead = False
+        self.before_render += self._forward_before_render
+        self.after_render += self._forward_after_render
+
+    @staticmethod
+    def _get_idle_layout() -> Layout:
+        """Get the empty layout displayed between prompts."""
+        return Layout(Window(height=0))
+
+    def _forward_before_render(self, _) -> None:
+        """Fire the `before_render` event of the displayed prompt application."""
+        if self._guest is not None:
+            self._guest.before_render.fire()
+
+    def _forward_after_render(self, _) -> None:
+        """Fire the `after_render` event of the displayed prompt application.
+
+        Keys received before the prompt is displayed are processed after its first render
+        since the prompts only register some of their keybindings once rendered.
+        """
+        if self._guest is not None:
+            self._guest.after_render.fire()
+            if self._typeahead:
+                self._typeahead = False
+                self.key_processor.feed_multiple(self.input.flush_keys())
+                self.key_processor.process_keys()
+
+    @property
+    def is_done(self) -> bool:
+        """bool: True when no prompt is waiting for an answer or the session is finished.
+
+        Keys received while no prompt is waiting are kept in the queue for the next prompt.
+        """
+        if self.future is None or self.future.done():
+            return super().is_done
+        return self._guest_future is None or self._guest_future.done()
+
+    def exit(
+        self,
+        result: Any = None,
+        exception: Optional[BaseException] = None,
+        style: str = "",
+    ) -> None:
+        """Answer the displayed prompt, exit the session if no prompt is displayed.
+
+        Args:
+            result: Result of the prompt.
+            exception: Exception to raise from the prompt instead of returning `result`.
+            style: Style of the session when exiting, ignored when answering a prompt.
+        """
+        future = self._guest_future
+        if future is None:
+            super().exit(result=result, exception=exception, style=style)
+        elif not future.done():
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+
+    async def run_guest(self, app: Application) -> Any:
+        """Display the prompt application `app` in the session until it exits.
+
+        Args:
+            app: The application created by the prompt.
+
+        Returns:
+            The result of the prompt.
+        """
+        self._attach(app)
+        self._guest_future = asyncio.get_event_loop().create_future()
+        try:
+            for pre_run in app.pre_run_callables:
+                pre_run()
+            del app.pre_run_callables[:]
+            self._request_absolute_cursor_position()
+            self._typeahead = True
+            self._redraw()
+            return await self._guest_future
+        finally:
+            self._guest_future = None
+            try:
+                self._redraw(render_as_done=True)
+            finally:
+                self.renderer.reset()
+                self._detach(app)
+
+    async def run_prompt_session(
+        self, session: "PromptSession", default: str = ""
+    ) -> Any:
+        """Display the application of the `session` created by the simple prompts.
+
+        Args:
+            session: The :class:`~prompt_toolkit.shortcuts.PromptSession` of the prompt.
+            default: Default text of the input buffer.
+
+        Returns:
+            The result of the prompt.
+        """
+        session.default_buffer.reset(Document(default))
+        return await self.run_guest(session.app)
+
+    def _attach(self, app: Application) -> None:
+        """Display the layout of `app` and forward the methods of `app` to the session."""
+        self._guest = app
+        self.layout = app.layout
+        self.key_bindings = app.key_bindings
+        self.style = app.style
+        self.editing_mode = app.editing_mode
+        for name in _GUEST_ATTRIBUTES:
+            setattr(app, name, getattr(self, name))
+        self.layout.reset()
+        self.vi_state.reset()
+        self.emacs_state.reset()
+        app.on_reset.fire()
+        if not self.layout.current_control.is_focusable():
+            for window in self.layout.find_all_windows():
+                if window.content.is_focusable():
+                    self.layout.current_window = window
+                    break
+
+    def _detach(self, app: Application) -> None:
+        """Restore the methods of `app` and display the empty layout."""
+        for name in _GUEST_ATTRIBUTES:
+            vars(app).pop(name, None)
+        self._guest = None
+        self.layout = self._get_idle_layout()
+        self.key_bindings = None
+        self.style = None
+
+    async def _run_main(self, coroutine: Awaitable[T]) -> None:
+        """Await `coroutine` and exit the session with its result or exception."""
+        try:
+            result = await coroutine
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            super().exit(exception=e)
+        else:
+            super().exit(result=result)
+
+    def _start_session(self, coroutine: Awaitable[T]) -> None:
+        """Start `coroutine` once the session is running."""
+        self.create_background_task(self._run_main(coroutine))
+
+    def run_session(self, coroutine: Awaitable[T]) -> T:
+        """Run the session until `coroutine` finishes.
+
+        Args:
+            coroutine: Coroutine executing the prompts asynchronously.
+
+        Returns:
+            The result of `coroutine`.
+        """
+        token = _current_session.set(self)
+        try:
+            return self.run(pre_run=lambda: self._start_session(coroutine))
+        finally:
+            _current_session.reset(token)
+
+    async def run_session_async(self, coroutine: Awaitable[T]) -> T:
+        """Run the session asynchronously until `coroutine` finishes.
+
+        Args:
+            coroutine: Coroutine executing the prompts asynchronously.
+
+        Returns:
+            The result of `coroutine`.
+        """
+        token = _current_session.set(self)
+        try:
+            return await self.run_async(pre_run=lambda: self._start_session(coroutine))
+        finally:
+            _current_session.reset(token)
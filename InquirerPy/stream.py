@@ -0,0 +1,120 @@
+"""Module contains the helpers to consume choices from a stream."""
+import asyncio
+import threading
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Iterable, Iterator, List
+
+__all__ = ["is_stream", "iter_batches"]
+
+
+def is_stream(choices: Any) -> bool:
+    """Check if the `choices` should be consumed as a stream.
+
+    Async iterators and readable file objects such as :data:`sys.stdin` are streams.
+    Use :func:`os.fdopen` to stream from a file descriptor. Other iterators, including
+    generators, are not streams and are processed at once like a list.
+
+    Args:
+        choices: Choices provided to the prompt.
+
+    Returns:
+        Boolean indicating if `choices` is a stream.
+
+    Examples:
+        >>> is_stream([1, 2, 3])
+        False
+        >>> is_stream(iter([1, 2, 3]))
+        False
+        >>> import io
+        >>> is_stream(io.StringIO("1"))
+        True
+    """
+    return hasattr(choices, "__aiter__") or hasattr(choices, "readline")
+
+
+def _iter_lines(stream: Iterable[Any]) -> Iterator[str]:
+    """Iterate the lines of a file object without the line breaks."""
+    for line in stream:
+        if isinstance(line, bytes):
+            line = line.decode(errors="replace")
+        yield line.rstrip("\r\n")
+
+
+def _read_sync(
+    source: Iterable[Any],
+    pending: Deque[Any],
+    stop: threading.Event,
+    loop: asyncio.AbstractEventLoop,
+    future: "asyncio.Future[None]",
+) -> None:
+    """Read the blocking `source` into `pending` until exhausted or stopped."""
+
+    def resolve(exception: Any = None) -> None:
+        if future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(None)
+
+    try:
+        for item in source:
+            if stop.is_set():
+                break
+            pending.append(item)
+    except Exception as e:
+        exception = e
+    else:
+        exception = None
+    try:
+        loop.call_soon_threadsafe(resolve, exception)
+    except RuntimeError:
+        pass  # event loop already closed
+
+
+async def _read_async(source: AsyncIterator[Any], pending: Deque[Any]) -> None:
+    """Read the async `source` into `pending` until exhausted."""
+    async for item in source:
+        pending.append(item)
+
+
+async def iter_batches(source: Any, interval: float = 0.05) -> AsyncIterator[List[Any]]:
+    """Consume the `source` in the background and yield the received items in batches.
+
+    Blocking sources are read in a daemon thread so that the event loop is never
+    blocked while waiting for the next item. Items received within the `interval`
+    are yielded together.
+
+    Args:
+        source: A stream, refer to :func:`.is_stream`.
+        interval: Time in seconds to wait for more items before yielding a batch.
+
+    Yields:
+        List of items received since the previous batch.
+    """
+    pending: Deque[Any] = deque()
+    stop = threading.Event()
+    if hasattr(source, "__aiter__"):
+        reader = asyncio.ensure_future(_read_async(source, pending))
+    else:
+        if hasattr(source, "readline"):
+            source = _iter_lines(source)
+        loop = asyncio.get_running_loop()
+        reader = loop.create_future()
+        threading.Thread(
+            target=_read_sync,
+            args=(source, pending, stop, loop, reader),
+            daemon=True,
+        ).start()
+    try:
+        while True:
+            done = reader.done()
+            if pending:
+                yield [pending.popleft() for _ in range(len(pending))]
+            if done:
+                reader.result()
+                return
+            await asyncio.wait({reader}, timeout=interval)
+    finally:
+        stop.set()
+        reader.cancel()
@@ -21,6 +21,7 @@ from prompt_toolkit.formatted_text import FormattedText
 from prompt_toolkit.styles import Style
 from prompt_toolkit.validation import Validator
 
+from InquirerPy.cache import LRUCache
 from InquirerPy.exceptions import InvalidArgument
 
 if TYPE_CHECKING:
@@ -30,6 +31,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     "get_style",
+    "get_compiled_style",
     "calculate_height",
     "InquirerPyStyle",
     "patched_print",
@@ -68,6 +70,40 @@ InquirerPyKeybindings = Dict[
     str, List[Dict[str, Union[str, "FilterOrBool", List[str]]]]
 ]
 
+STYLE_CACHE_SIZE = 32
+
+# style class, ENV variable and value in the default theme of each style
+_STYLE_ENV = [
+    (style_class, "INQUIRERPY_STYLE_%s" % style_class.upper(), default)
+    for style_class, default in [
+        ("questionmark", "#e5c07b"),
+        ("answermark", "#e5c07b"),
+        ("answer", "#61afef"),
+        ("input", "#98c379"),
+        ("question", ""),
+        ("answered_question", ""),
+        ("instruction", "#abb2bf"),
+        ("long_instruction", "#abb2bf"),
+        ("choice_instruction", "grey italic"),
+        ("pointer", "#61afef"),
+        ("checkbox", "#98c379"),
+        ("separator", ""),
+        ("skipped", "#5c6370"),
+        ("validator", ""),
+        ("marker", "#e5c07b"),
+        ("fuzzy_prompt", "#c678dd"),
+        ("fuzzy_info", "#abb2bf"),
+        ("fuzzy_border", "#4b5263"),
+        ("fuzzy_match", "#c678dd"),
+        ("fuzzy_preview", ""),
+        ("spinner_pattern", "#e5c07b"),
+        ("spinner_text", ""),
+    ]
+]
+
+_style_cache = LRUCache(max_entries=STYLE_CACHE_SIZE)
+_compiled_style_cache = LRUCache(max_entries=STYLE_CACHE_SIZE)
+
 
 def get_style(
     style: Optional[Dict[str, str]] = None, style_override: bool = True
@@ -100,69 +136,45 @@ def get_style(
         >>> style = get_style({"questionmark": "#ffffff", "answer": "#000000"}, style_override=False)
         >>> result = inquirer.confirm(message="Confirm?", style=style).execute()
     """
-    if not style_override or style is None:
-        if not style:
-            style = {}
-        result = {
-            "questionmark": os.getenv("INQUIRERPY_STYLE_QUESTIONMARK", "#e5c07b"),
-            "answermark": os.getenv("INQUIRERPY_STYLE_ANSWERMARK", "#e5c07b"),
-            "answer": os.getenv("INQUIRERPY_STYLE_ANSWER", "#61afef"),
-            "input": os.getenv("INQUIRERPY_STYLE_INPUT", "#98c379"),
-            "question": os.getenv("INQUIRERPY_STYLE_QUESTION", ""),
-            "answered_question": os.getenv("INQUIRERPY_STYLE_ANSWERED_QUESTION", ""),
-            "instruction": os.getenv("INQUIRERPY_STYLE_INSTRUCTION", "#abb2bf"),
-            "long_instruction": os.getenv(
-                "INQUIRERPY_STYLE_LONG_INSTRUCTION", "#abb2bf"
-            ),
-            "choice_instruction": os.getenv(
-                "INQUIRERPY_STYLE_CHOICE_INSTRUCTION", "grey italic"
-            ),
-            "pointer": os.getenv("INQUIRERPY_STYLE_POINTER", "#61afef"),
-            "checkbox": os.getenv("INQUIRERPY_STYLE_CHECKBOX", "#98c379"),
-            "separator": os.getenv("INQUIRERPY_STYLE_SEPARATOR", ""),
-            "skipped": os.getenv("INQUIRERPY_STYLE_SKIPPED", "#5c6370"),
-            "validator": os.getenv("INQUIRERPY_STYLE_VALIDATOR", ""),
-            "marker": os.getenv("INQUIRERPY_STYLE_MARKER", "#e5c07b"),
-            "fuzzy_prompt": os.getenv("INQUIRERPY_STYLE_FUZZY_PROMPT", "#c678dd"),
-            "fuzzy_info": os.getenv("INQUIRERPY_STYLE_FUZZY_INFO", "#abb2bf"),
-            "fuzzy_border": os.getenv("INQUIRERPY_STYLE_FUZZY_BORDER", "#4b5263"),
-            "fuzzy_match": os.getenv("INQUIRERPY_STYLE_FUZZY_MATCH", "#c678dd"),
-            "spinner_pattern": os.getenv("INQUIRERPY_STYLE_SPINNER_PATTERN", "#e5c07b"),
-            "spinner_text": os.getenv("INQUIRERPY_STYLE_SPINNER_TEXT", ""),
-            **style,
-        }
-    else:
-        result = {
-            "questionmark": os.getenv("INQUIRERPY_STYLE_QUESTIONMARK", ""),
-            "answermark": os.getenv("INQUIRERPY_STYLE_ANSWERMARK", ""),
-            "answer": os.getenv("INQUIRERPY_STYLE_ANSWER", ""),
-            "input": os.getenv("INQUIRERPY_STYLE_INPUT", ""),
-            "question": os.getenv("INQUIRERPY_STYLE_QUESTION", ""),
-            "answered_question": os.getenv("INQUIRERPY_STYLE_ANSWERED_QUESTION", ""),
-            "instruction": os.getenv("INQUIRERPY_STYLE_INSTRUCTION", ""),
-            "long_instruction": os.getenv("INQUIRERPY_STYLE_LONG_INSTRUCTION", ""),
-            "choice_instruction": os.getenv("INQUIRERPY_STYLE_CHOICE_INSTRUCTION", ""),
-            "pointer": os.getenv("INQUIRERPY_STYLE_POINTER", ""),
-            "checkbox": os.getenv("INQUIRERPY_STYLE_CHECKBOX", ""),
-            "separator": os.getenv("INQUIRERPY_STYLE_SEPARATOR", ""),
-            "skipped": os.getenv("INQUIRERPY_STYLE_SKIPPED", ""),
-            "validator": os.getenv("INQUIRERPY_STYLE_VALIDATOR", ""),
-            "marker": os.getenv("INQUIRERPY_STYLE_MARKER", ""),
-            "fuzzy_prompt": os.getenv("INQUIRERPY_STYLE_FUZZY_PROMPT", ""),
-            "fuzzy_info": os.getenv("INQUIRERPY_STYLE_FUZZY_INFO", ""),
-            "fuzzy_border": os.getenv("INQUIRERPY_STYLE_FUZZY_BORDER", ""),
-            "fuzzy_match": os.getenv("INQUIRERPY_STYLE_FUZZY_MATCH", ""),
-            "spinner_pattern": os.getenv("INQUIRERPY_STYLE_SPINNER_PATTERN", ""),
-            "spinner_text": os.getenv("INQUIRERPY_STYLE_SPINNER_TEXT", ""),
-            **style,
-        }
-
-    if result.get("fuzzy_border"):
-        result["frame.border"] = result.pop("fuzzy_border")
-    if result.get("validator"):
-        result["validation-toolbar"] = result.pop("validator")
-    result["bottom-toolbar"] = "noreverse"
-    return InquirerPyStyle(result)
+    use_default = not style_override or style is None
+    style = style or {}
+    env = tuple(os.environ.get(name) for _, name, _ in _STYLE_ENV)
+    key = (use_default, tuple(style.items()), env)
+    result = _style_cache.get(key)
+    if result is None:
+        result = {}
+        for (style_class, _, default), value in zip(_STYLE_ENV, env):
+            if value is None:
+                value = default if use_default else ""
+            result[style_class] = value
+        result.update(style)
+        if result.get("fuzzy_border"):
+            result["frame.border"] = result.pop("fuzzy_border")
+        if result.get("validator"):
+            result["validation-toolbar"] = result.pop("validator")
+        result["bottom-toolbar"] = "noreverse"
+        _style_cache.set(key, result)
+    return InquirerPyStyle(dict(result))
+
+
+def get_compiled_style(style: InquirerPyStyle) -> Style:
+    """Obtain the :class:`~prompt_toolkit.styles.Style` of an :class:`.InquirerPyStyle` instance.
+
+    The compiled style is cached by the content of `style`, prompts created with the same
+    style share the same :class:`~prompt_toolkit.styles.Style` instance.
+
+    Args:
+        style: An instance of :class:`.InquirerPyStyle` obtained from :func:`.get_style`.
+
+    Returns:
+        The compiled style.
+    """
+    key = tuple(style.dict.items())
+    compiled = _compiled_style_cache.get(key)
+    if compiled is None:
+        compiled = Style.from_dict(style.dict)
+        _compiled_style_cache.set(key, compiled)
+    return compiled
 
 
 def calculate_height(
@@ -0,0 +1,86 @@
+"""Benchmark chunked batch scoring against one coroutine per choice.
+
+`pfzy.fuzzy_match` schedules a coroutine for every haystack, the matcher scores
+each chunk synchronously and only yields to the event loop between chunks. The
+longest time between two yields is the worst delay of a keystroke.
+
+Usage:
+    python benchmarks/batch_matcher.py --sizes 10000 100000 1000000 --chunk-sizes 1000 10000 100000
+"""
+import argparse
+import asyncio
+import random
+import string
+import time
+
+from pfzy import fuzzy_match
+from pfzy.score import fzy_scorer, substr_scorer
+
+from InquirerPy.matcher import Matcher
+
+
+def generate_names(size: int, seed: int = 0):
+    """Generate `size` of random path like names."""
+    rng = random.Random(seed)
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+        for _ in range(2000)
+    ]
+    return ["/".join(rng.choices(words, k=rng.randint(2, 5))) for _ in range(size)]
+
+
+def run_pfzy(names, query, scorer):
+    """Time `pfzy.fuzzy_match`, which also calculates the matching indices."""
+    haystacks = [{"name": name} for name in names]
+    start = time.perf_counter()
+    result = asyncio.run(fuzzy_match(query, haystacks, key="name", scorer=scorer))
+    return time.perf_counter() - start, len(result)
+
+
+def run_matcher(names, query, scorer, chunk_size):
+    """Time the matcher and the longest chunk scored without yielding."""
+    matcher = Matcher(names, chunk_size=chunk_size)
+    chunks = []
+    last = start = time.perf_counter()
+
+    def on_chunk(heap, count):
+        nonlocal last
+        now = time.perf_counter()
+        chunks.append(now - last)
+        last = now
+
+    heaps = asyncio.run(matcher.match(query, scorer, on_chunk=on_chunk))
+    elapsed = time.perf_counter() - start
+    return elapsed, max(chunks, default=0.0), sum(map(len, heaps))
+
+
+def main():
+    """Parse arguments and print the timing of each size and chunk size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument(
+        "--chunk-sizes", type=int, nargs="+", default=[1000, 10000, 100000]
+    )
+    parser.add_argument("--query", default="abc")
+    parser.add_argument("--exact", action="store_true")
+    args = parser.parse_args()
+    scorer = substr_scorer if args.exact else fzy_scorer
+
+    print(
+        f"{'size':>10} {'matches':>10} {'pfzy':>9} {'chunk':>8}"
+        f" {'batch':>9} {'max block':>10}  speedup"
+    )
+    for size in args.sizes:
+        names = generate_names(size)
+        baseline, expected = run_pfzy(names, args.query, scorer)
+        for chunk_size in args.chunk_sizes:
+            elapsed, block, matches = run_matcher(names, args.query, scorer, chunk_size)
+            assert matches == expected, "batch matches differ from pfzy"
+            print(
+                f"{size:>10} {matches:>10} {baseline:>8.2f}s {chunk_size:>8}"
+                f" {elapsed:>8.2f}s {block * 1000:>8.1f}ms {baseline / elapsed:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
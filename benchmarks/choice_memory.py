@@ -0,0 +1,59 @@
+"""Benchmark the memory used per choice by the list and the compact choice storage.
+
+Usage:
+    python benchmarks/choice_memory.py --sizes 100000 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from InquirerPy.prompts.fuzzy import InquirerPyFuzzyControl
+
+from fuzzy_workers import generate_names
+
+
+def measure(names, compact):
+    """Measure the memory allocated to process `names` into a fuzzy control."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    control = InquirerPyFuzzyControl(
+        choices=names,
+        pointer=">",
+        marker=">",
+        current_text=lambda: "",
+        max_lines=10,
+        session_result=None,
+        multiselect=False,
+        marker_pl=" ",
+        match_exact=False,
+        compact=compact,
+    )
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del control
+    return current, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100000, 1000000])
+    args = parser.parse_args()
+
+    print(
+        f"{'size':>10} {'storage':>8} {'bytes/choice':>13} {'peak/choice':>12} {'build (s)':>10}"
+    )
+    for size in args.sizes:
+        names = generate_names(size)
+        for compact in (False, True):
+            current, peak, elapsed = measure(names, compact)
+            print(
+                f"{size:>10} {'compact' if compact else 'list':>8} "
+                f"{current / size:>13.1f} {peak / size:>12.1f} {elapsed:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark rendering highlighted fuzzy matches as merged runs against one fragment per char.
+
+Usage:
+    python benchmarks/fuzzy_render.py --length 120 --rows 40 --query srcmainpy
+"""
+import argparse
+import asyncio
+import random
+import string
+import time
+
+from prompt_toolkit.layout.containers import Window
+from prompt_toolkit.layout.mouse_handlers import MouseHandlers
+from prompt_toolkit.layout.screen import Screen, WritePosition
+
+from InquirerPy.prompts.fuzzy import InquirerPyFuzzyControl
+
+
+class PerCharControl(InquirerPyFuzzyControl):
+    """Fuzzy control emitting a fragment for every char of the highlighted names."""
+
+    @staticmethod
+    def _get_highlighted_text(name, indices, style):
+        matched = set(indices)
+        return [
+            ("class:fuzzy_match" if index in matched else style, char)
+            for index, char in enumerate(name)
+        ]
+
+
+def generate_names(size: int, length: int, seed: int = 0):
+    """Generate `size` of random path and url like names around `length` chars."""
+    rng = random.Random(seed)
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10)))
+        for _ in range(500)
+    ]
+    names = []
+    for index in range(size):
+        name = "https://" if index % 2 else "/"
+        while len(name) < length:
+            name += rng.choice(words) + "/"
+        names.append(name + "main.py")
+    return names
+
+
+def run(control_class, names, query, rows, width, frames):
+    """Time the render of `frames` frames with the cursor moving through the rows."""
+    control = control_class(
+        choices=names,
+        pointer=">",
+        marker="*",
+        current_text=lambda: query,
+        max_lines=rows,
+        session_result=None,
+        multiselect=False,
+        marker_pl=" ",
+        match_exact=False,
+    )
+    control._filtered_choices = asyncio.run(control._filter_choices(0.0))
+    window = Window(content=control)
+    fragments = len(control._get_formatted_choices())
+    start = time.perf_counter()
+    for frame in range(frames):
+        control.selected_choice_index = frame % rows
+        window.write_to_screen(
+            Screen(),
+            MouseHandlers(),
+            WritePosition(xpos=0, ypos=0, width=width, height=rows),
+            parent_style="",
+            erase_bg=False,
+            z_index=None,
+        )
+    return (time.perf_counter() - start) / frames, fragments
+
+
+def main():
+    """Parse arguments and print the render time of both fragment layouts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--length", type=int, nargs="+", default=[40, 120, 300])
+    parser.add_argument("--rows", type=int, default=40)
+    parser.add_argument("--width", type=int, default=400)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--query", default="srcmainpy")
+    args = parser.parse_args()
+
+    print(
+        f"{'length':>8} {'fragments':>10} {'per char':>10}"
+        f" {'fragments':>10} {'merged':>10}  speedup"
+    )
+    for length in args.length:
+        names = generate_names(args.size, length)
+        per_char, per_char_count = run(
+            PerCharControl, names, args.query, args.rows, args.width, args.frames
+        )
+        merged, merged_count = run(
+            InquirerPyFuzzyControl,
+            names,
+            args.query,
+            args.rows,
+            args.width,
+            args.frames,
+        )
+        print(
+            f"{length:>8} {per_char_count:>10} {per_char * 1000:>8.2f}ms"
+            f" {merged_count:>10} {merged * 1000:>8.2f}ms {per_char / merged:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
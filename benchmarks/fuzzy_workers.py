@@ -0,0 +1,74 @@
+"""Benchmark sharded multi-core fuzzy matching against a single worker.
+
+Usage:
+    python benchmarks/fuzzy_workers.py --sizes 1000000 10000000 --workers 4
+"""
+import argparse
+import asyncio
+import os
+import random
+import string
+import time
+
+from pfzy.score import fzy_scorer, substr_scorer
+
+from InquirerPy.matcher import ExecutorMatcher, RankedChoices
+
+
+def generate_names(size: int, seed: int = 0):
+    """Generate `size` of random path like names."""
+    rng = random.Random(seed)
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+        for _ in range(2000)
+    ]
+    return ["/".join(rng.choices(words, k=rng.randint(2, 5))) for _ in range(size)]
+
+
+def run(names, query, scorer, workers, chunk_size):
+    """Time a single query using `workers` processes, excluding pool startup.
+
+    Returns:
+        The elapsed time in seconds and the ranked matching names.
+    """
+    matcher = ExecutorMatcher(
+        names, executor="process", chunk_size=chunk_size, workers=workers
+    )
+    try:
+        for shard in range(matcher.workers):
+            matcher._get_executor(shard).submit(int).result()
+        start = time.perf_counter()
+        heaps = asyncio.run(matcher.match(query, scorer))
+        elapsed = time.perf_counter() - start
+        return elapsed, list(RankedChoices(names, heaps))
+    finally:
+        matcher.close()
+
+
+def main():
+    """Parse arguments and print the timing of each size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000000, 10000000])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--query", default="abc")
+    parser.add_argument("--exact", action="store_true")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args()
+    scorer = substr_scorer if args.exact else fzy_scorer
+
+    print(
+        f"{'size':>10} {'matches':>10} {'1 worker':>10} {args.workers} workers  speedup"
+    )
+    for size in args.sizes:
+        names = generate_names(size)
+        single, expected = run(names, args.query, scorer, 1, args.chunk_size)
+        sharded, result = run(names, args.query, scorer, args.workers, args.chunk_size)
+        assert result == expected, "sharded ordering differs from single worker"
+        print(
+            f"{size:>10} {len(result):>10} {single:>9.2f}s {sharded:>9.2f}s"
+            f" {single / sharded:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark the import time of the InquirerPy entry points with `python -X importtime`.
+
+Each statement runs in a fresh interpreter and is timed with :func:`time.perf_counter`,
+the modules it imports are collected from the `-X importtime` output. Modules imported
+through :func:`importlib.import_module` are missing from the `-X importtime` tree as
+their own entry, which is why the time is not summed from it. The heavy modules imported
+by the statement are listed so that a change making a prompt import everything again is
+noticed, and the slowest module is displayed to find where the time goes.
+
+Usage:
+    python benchmarks/import_time.py --repeat 10
+    python benchmarks/import_time.py --budget 150
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import InquirerPy",
+    "from InquirerPy import inquirer",
+    "from InquirerPy import inquirer; inquirer.confirm",
+    "from InquirerPy import inquirer; inquirer.text",
+    "from InquirerPy import inquirer; inquirer.select",
+    "from InquirerPy import inquirer; inquirer.fuzzy",
+    "from InquirerPy import prompt",
+]
+
+# modules which should only be imported by the statements which use them
+HEAVY_MODULES = ["pfzy", "InquirerPy.prompts.fuzzy", "InquirerPy.matcher"]
+
+
+TIMER = """
+import time
+start = time.perf_counter()
+exec(%r)
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(statement):
+    """Run `statement` with `-X importtime`.
+
+    Returns:
+        The time to run the statement in seconds and the self import time in
+        microseconds of each imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", TIMER % statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_time, _, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = int(self_time)
+    return float(result.stdout), modules
+
+
+def main():
+    """Parse arguments and print the median import time of each statement."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        help="Exit with status 1 if `import InquirerPy` takes longer than this many ms.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'statement':<52} {'import':>9} {'modules':>8}  {'slowest':<30} heavy")
+    results = {}
+    for statement in STATEMENTS:
+        timings = []
+        for _ in range(args.repeat):
+            elapsed, modules = import_time(statement)
+            timings.append(elapsed)
+        results[statement] = statistics.median(timings)
+        heavy = [
+            module
+            for module in HEAVY_MODULES
+            if any(name.startswith(module) for name in modules)
+        ]
+        slowest = max(modules, key=modules.__getitem__, default="-")
+        print(
+            f"{statement:<52} {results[statement] * 1000:>7.1f}ms {len(modules):>8}"
+            f"  {slowest:<30} {', '.join(heavy) or '-'}"
+        )
+
+    if args.budget is not None and results[STATEMENTS[0]] * 1000 > args.budget:
+        print(f"`{STATEMENTS[0]}` exceeded the budget of {args.budget}ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark the construction time of sequential prompts sharing the same style.
+
+Each prompt type is constructed `--count` times in a row, the same as asking the
+questions of a long :func:`~InquirerPy.resolver.prompt` session. The `(style)` rows
+only resolve and compile the style of each prompt. With `--cold`, the style caches
+are cleared before each construction to measure the cost of resolving and compiling
+the style for every prompt.
+
+Usage:
+    python benchmarks/prompt_construction.py --count 1000
+    python benchmarks/prompt_construction.py --count 1000 --cold
+"""
+import argparse
+import gc
+import time
+
+from prompt_toolkit.application.current import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+from InquirerPy import utils
+from InquirerPy.prompts import (
+    CheckboxPrompt,
+    ConfirmPrompt,
+    FuzzyPrompt,
+    InputPrompt,
+    ListPrompt,
+    NumberPrompt,
+)
+
+CHOICES = ["choice %s" % index for index in range(10)]
+
+STYLES = [("default", None), ("custom", {"answer": "#ffffff"})]
+
+# name: (prompt class, extra keyword arguments)
+PROMPTS = {
+    "input": (InputPrompt, {}),
+    "confirm": (ConfirmPrompt, {}),
+    "number": (NumberPrompt, {}),
+    "list": (ListPrompt, {"choices": CHOICES}),
+    "checkbox": (CheckboxPrompt, {"choices": CHOICES}),
+    "fuzzy": (FuzzyPrompt, {"choices": CHOICES}),
+}
+
+
+def clear_style_cache():
+    """Clear the resolved and compiled styles."""
+    utils._style_cache.clear()
+    utils._compiled_style_cache.clear()
+
+
+def resolve_style(count, style, cold):
+    """Resolve and compile the style of `count` prompts without constructing them.
+
+    Returns:
+        Total time in seconds.
+    """
+    elapsed = 0.0
+    for _ in range(count):
+        if cold:
+            clear_style_cache()
+        start = time.perf_counter()
+        utils.get_compiled_style(utils.get_style(style))
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def construct(prompt_class, kwargs, count, style, cold):
+    """Construct `count` prompts in a row.
+
+    Returns:
+        Total construction time in seconds.
+    """
+    elapsed = 0.0
+    for _ in range(count):
+        if cold:
+            clear_style_cache()
+        start = time.perf_counter()
+        prompt_class(
+            message="Benchmark", style=style and utils.get_style(style), **kwargs
+        )
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def main():
+    """Parse arguments and print the construction time of each prompt."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prompts", nargs="+", choices=PROMPTS, default=list(PROMPTS))
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--cold", action="store_true")
+    args = parser.parse_args()
+
+    print(f"{'prompt':>10} {'style':>8} {'total':>10} {'per prompt':>11}")
+    for label, style in STYLES:
+        clear_style_cache()
+        elapsed = resolve_style(args.count, style, args.cold)
+        print(
+            f"{'(style)':>10} {label:>8} {elapsed * 1000:>8.1f}ms"
+            f" {elapsed / args.count * 1e6:>9.1f}us"
+        )
+    with create_pipe_input() as pipe, create_app_session(
+        input=pipe, output=DummyOutput()
+    ):
+        for name in args.prompts:
+            prompt_class, kwargs = PROMPTS[name]
+            for label, style in STYLES:
+                clear_style_cache()
+                gc.collect()
+                elapsed = construct(prompt_class, kwargs, args.count, style, args.cold)
+                print(
+                    f"{name:>10} {label:>8} {elapsed * 1000:>8.1f}ms"
+                    f" {elapsed / args.count * 1e6:>9.1f}us"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""Benchmark the keystroke to frame latency of every prompt driven headlessly.
+
+Each prompt is constructed with a generated list of choices, rendered into a dummy
+output and fed a scripted keystroke sequence through a pipe input. The latency of a
+keystroke is the time from writing it to the input until the first frame rendered
+after the prompt settled, e.g. the fuzzy prompt finished filtering. Peak memory is
+measured by replaying the script again with :mod:`tracemalloc`.
+
+The results are written as JSON so that runs of different commits can be compared.
+
+Usage:
+    python benchmarks/prompt_latency.py --counts 10 10000 1000000 --output before.json
+    python benchmarks/prompt_latency.py --counts 10 10000 1000000 --compare before.json
+"""
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+from prompt_toolkit.application.current import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+from InquirerPy.prompts import (
+    CheckboxPrompt,
+    ExpandPrompt,
+    FilePathPrompt,
+    FuzzyPrompt,
+    InputPrompt,
+    ListPrompt,
+    NumberPrompt,
+    RawlistPrompt,
+)
+from InquirerPy.prompts.expand import ExpandChoice
+
+from fuzzy_workers import generate_names
+
+DOWN = "\x1b[B"
+UP = "\x1b[A"
+BACKSPACE = "\x7f"
+FRAME_TIMEOUT = 30
+
+EXPAND_KEYS = "abcdefgijklmnopqrstuvwxyz"
+
+
+def expand_choices(names):
+    """Bind a key to each choice of the expand prompt."""
+    return [ExpandChoice(name, key=key) for name, key in zip(names, EXPAND_KEYS)]
+
+
+# name: (prompt class, maximum choice count or None for prompts without choices,
+#        function creating the choices, keystrokes to replay)
+PROMPTS = {
+    "list": (ListPrompt, float("inf"), list, [DOWN] * 20 + [UP] * 10),
+    "checkbox": (CheckboxPrompt, float("inf"), list, [DOWN, " "] * 10),
+    "fuzzy": (
+        FuzzyPrompt,
+        float("inf"),
+        list,
+        [DOWN] * 5 + list("abc") + [BACKSPACE] * 3 + list("de") + [BACKSPACE] * 2,
+    ),
+    "rawlist": (RawlistPrompt, 9, list, [DOWN] * 8 + ["3", "1"]),
+    "expand": (
+        ExpandPrompt,
+        len(EXPAND_KEYS),
+        expand_choices,
+        ["h"] + [DOWN] * 10 + ["c", "a"],
+    ),
+    "number": (NumberPrompt, None, None, list("12345") + [UP] * 5 + [DOWN] * 5),
+    "input": (InputPrompt, None, None, list("hello world")),
+    "filepath": (FilePathPrompt, None, None, list("/usr/lib/") + [BACKSPACE] * 4),
+}
+
+
+def get_application(prompt):
+    """Get the application of both the simple and the complex prompts."""
+    session = getattr(prompt, "_session", None)
+    return session.app if session is not None else prompt._application
+
+
+def is_busy(prompt):
+    """Check if the prompt is still processing the last keystroke in the background."""
+    task = getattr(prompt, "_task", None)
+    return task is not None and not task.done()
+
+
+class FrameWaiter:
+    """Resolve a future on the first frame rendered once the prompt is not busy."""
+
+    def __init__(self, prompt):
+        self._prompt = prompt
+        self._future = None
+        get_application(prompt).after_render += self._on_render
+
+    def _on_render(self, _):
+        if (
+            self._future is not None
+            and not self._future.done()
+            and not is_busy(self._prompt)
+        ):
+            self._future.set_result(time.perf_counter())
+
+    def arm(self):
+        """Create the future of the next settled frame, call before sending the keystroke."""
+        self._future = asyncio.get_event_loop().create_future()
+        return self._future
+
+
+async def replay(prompt_class, choices, keystrokes):
+    """Construct and run the prompt, then replay the keystrokes one frame at a time.
+
+    Returns:
+        Construction time and the latency of each keystroke in seconds.
+    """
+    with create_pipe_input() as pipe, create_app_session(
+        input=pipe, output=DummyOutput()
+    ):
+        kwargs = {"message": "Benchmark"}
+        if choices is not None:
+            kwargs["choices"] = choices
+        start = time.perf_counter()
+        prompt = prompt_class(**kwargs)
+        construction = time.perf_counter() - start
+
+        waiter = FrameWaiter(prompt)
+        frame = waiter.arm()
+        run = asyncio.ensure_future(prompt.execute_async())
+        await asyncio.wait_for(frame, FRAME_TIMEOUT)
+
+        latencies = []
+        for keystroke in keystrokes:
+            frame = waiter.arm()
+            start = time.perf_counter()
+            pipe.send_text(keystroke)
+            latencies.append(await asyncio.wait_for(frame, FRAME_TIMEOUT) - start)
+
+        get_application(prompt).exit(result=None)
+        await run
+    return construction, latencies
+
+
+def percentile(values, percent):
+    """Get the `percent` percentile of `values` using the nearest rank."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def measure(name, count, repeat, trace_memory):
+    """Benchmark prompt `name` with `count` choices."""
+    prompt_class, _, make_choices, keystrokes = PROMPTS[name]
+    choices = None
+    if make_choices is not None:
+        choices = make_choices(generate_names(count))
+
+    constructions = []
+    latencies = []
+    for _ in range(repeat):
+        gc.collect()
+        construction, keystroke_latencies = asyncio.run(
+            replay(prompt_class, choices, keystrokes)
+        )
+        constructions.append(construction)
+        latencies.extend(keystroke_latencies)
+
+    peak = None
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        asyncio.run(replay(prompt_class, choices, keystrokes))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "prompt": name,
+        "choices": count if choices is not None else None,
+        "keystrokes": len(latencies),
+        "construction": statistics.median(constructions),
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "peak_memory": peak,
+    }
+
+
+def get_commit():
+    """Get the commit hash of the working tree, None outside of a git repository."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    """Print the ratio of the p95 latency and construction time against `baseline`."""
+    previous = {
+        (result["prompt"], result["choices"]): result for result in baseline["results"]
+    }
+    print(f"\ncompared to {baseline.get('commit')}")
+    print(f"{'prompt':>10} {'choices':>10} {'p95':>8} {'construct':>10}")
+    for result in results:
+        old = previous.get((result["prompt"], result["choices"]))
+        if old is None:
+            continue
+        print(
+            f"{result['prompt']:>10} {str(result['choices']):>10}"
+            f" {result['p95'] / old['p95']:>7.2f}x"
+            f" {result['construction'] / old['construction']:>9.2f}x"
+        )
+
+
+def main():
+    """Parse arguments, run the benchmarks and print the result table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prompts", nargs="+", choices=PROMPTS, default=list(PROMPTS))
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 1000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare.")
+    args = parser.parse_args()
+
+    print(
+        f"{'prompt':>10} {'choices':>10} {'construct':>10} {'p50':>9}"
+        f" {'p95':>9} {'p99':>9} {'peak':>10}"
+    )
+    results = []
+    for name in args.prompts:
+        limit = PROMPTS[name][1]
+        counts = sorted({min(count, limit) for count in args.counts}) if limit else [0]
+        for count in counts:
+            result = measure(name, count, args.repeat, not args.no_memory)
+            results.append(result)
+            peak = result["peak_memory"]
+            print(
+                f"{name:>10} {str(result['choices']):>10}"
+                f" {result['construction'] * 1000:>8.2f}ms"
+                f" {result['p50'] * 1000:>7.2f}ms {result['p95'] * 1000:>7.2f}ms"
+                f" {result['p99'] * 1000:>7.2f}ms"
+                f" {'-' if peak is None else f'{peak / 1024 / 1024:.1f}MB':>10}"
+            )
+
+    report = {
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            compare(results, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark the numpy vectorized scorer against scoring each name in python.
+
+Usage:
+    python benchmarks/vectorized_scorer.py --sizes 100000 1000000
+"""
+import argparse
+import asyncio
+import time
+
+from pfzy.score import fzy_scorer, substr_scorer
+
+from InquirerPy.matcher import Matcher, VectorizedMatcher
+
+from fuzzy_workers import generate_names
+
+
+def run(matcher, query, scorer):
+    """Time a single query, return the elapsed time and the sorted matches."""
+    start = time.perf_counter()
+    heaps = asyncio.run(matcher.match(query, scorer))
+    elapsed = time.perf_counter() - start
+    return elapsed, sorted(match for heap in heaps for match in heap)
+
+
+def main():
+    """Parse arguments and print the throughput of each size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--queries", nargs="+", default=["a", "abc", "ab/cd"])
+    parser.add_argument("--exact", action="store_true")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args()
+    scorer = substr_scorer if args.exact else fzy_scorer
+
+    print(
+        f"{'size':>10} {'query':>8} {'matches':>10} {'python/s':>12} {'numpy/s':>12}  speedup"
+    )
+    for size in args.sizes:
+        names = generate_names(size)
+        python = Matcher(names, chunk_size=args.chunk_size)
+        numpy = VectorizedMatcher(names, chunk_size=args.chunk_size)
+        for query in args.queries:
+            expected_time, expected = run(python, query, scorer)
+            vectorized_time, result = run(numpy, query, scorer)
+            assert result == expected, "vectorized ranking differs"
+            print(
+                f"{size:>10} {query:>8} {len(result):>10} {size / expected_time:>12.0f} "
+                f"{size / vectorized_time:>12.0f} {expected_time / vectorized_time:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 import unittest
-from unittest.mock import ANY, call, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
+from prompt_toolkit.application.application import Application
 from prompt_toolkit.validation import ValidationError, Validator
 
 from InquirerPy.base.complex import BaseComplexPrompt
+from InquirerPy.profiler import Profiler
 from InquirerPy.prompts.fuzzy import FuzzyPrompt
 
 
@@ -20,11 +22,34 @@ class TestBaseComplex(unittest.TestCase):
         hello("")  # type: ignore
         self.assertFalse(fuzzy_prompt._invalid)
 
+    def test_profiler(self) -> None:
+        profiler = Profiler()
+        prompt = FuzzyPrompt(message="", choices=["1", "2", "3"], profiler=profiler)
+
+        @prompt.register_kb("c-q")
+        def hello(_):
+            pass
+
+        hello("")  # type: ignore
+        prompt._start_profiler()
+        prompt._start_profiler()
+        prompt._rendered = True
+        prompt.application.before_render.fire()
+        prompt.application.after_render.fire()
+        prompt.content_control.text()
+        prompt._handle_enter(MagicMock())
+        self.assertEqual(
+            {name: metric.count for name, metric in profiler.metrics.items()},
+            {"key c-q": 1, "render": 1, "format_choices": 1, "validate": 1},
+        )
+
+    @patch.object(Application, "create_background_task")
     @patch.object(BaseComplexPrompt, "register_kb")
-    def test_after_render(self, mocked_kb):
+    def test_after_render(self, mocked_kb, mocked_task):
         prompt = FuzzyPrompt(message="", choices=lambda _: [1, 2, 3])
         self.assertEqual(prompt._rendered, False)
         prompt._after_render(None)
+        mocked_task.call_args[0][0].close()
 
         self.assertEqual(prompt._rendered, True)
         mocked_kb.assert_has_calls(
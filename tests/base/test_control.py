@@ -1,5 +1,6 @@
 import asyncio
 import unittest
+from unittest.mock import patch
 
 from InquirerPy.base.control import Choice
 from InquirerPy.enum import INQUIRERPY_POINTER_SEQUENCE
@@ -221,6 +222,97 @@ class TestBaseControl(unittest.TestCase):
             ],
         )
 
+    def test_fragment_cache(self):
+        list_control = InquirerPyListControl(
+            ["apple", "pear", "melon"],
+            None,
+            INQUIRERPY_POINTER_SEQUENCE,
+            ">",
+            None,
+            True,
+            " ",
+        )
+        expected = list_control._get_formatted_choices()
+        with patch.object(
+            list_control, "_get_normal_text", wraps=list_control._get_normal_text
+        ) as mocked_normal, patch.object(
+            list_control, "_get_hover_text", wraps=list_control._get_hover_text
+        ) as mocked_hover:
+            self.assertEqual(list_control._get_formatted_choices(), expected)
+            mocked_normal.assert_not_called()
+            mocked_hover.assert_not_called()
+
+            list_control.selected_choice_index = 1
+            list_control._get_formatted_choices()
+            self.assertEqual(mocked_normal.call_count, 1)
+            self.assertEqual(mocked_hover.call_count, 1)
+
+            list_control.choices[2]["enabled"] = True
+            self.assertEqual(list_control._get_formatted_choices()[-1], ("", "melon"))
+            self.assertEqual(
+                list_control._get_formatted_choices()[-2], ("class:marker", ">")
+            )
+            self.assertEqual(mocked_normal.call_count, 2)
+
+            list_control.choices = [{"name": "1", "value": 1, "enabled": False}]
+            self.assertEqual(list_control._get_formatted_choices()[-1], ("", "1"))
+
+    def test_viewport(self):
+        list_control = InquirerPyListControl(
+            list(range(10)),
+            None,
+            INQUIRERPY_POINTER_SEQUENCE,
+            ">",
+            None,
+            True,
+            " ",
+        )
+        self.assertEqual(list_control._get_viewport(), range(10))
+        list_control.max_lines = 3
+        self.assertEqual(list_control._get_viewport(), range(3))
+        list_control.selected_choice_index = 2
+        self.assertEqual(list_control._get_viewport(), range(3))
+        list_control.selected_choice_index = 5
+        self.assertEqual(list_control._get_viewport(), range(3, 6))
+        list_control.selected_choice_index = 4
+        self.assertEqual(list_control._get_viewport(), range(3, 6))
+        list_control.selected_choice_index = 9
+        self.assertEqual(list_control._get_viewport(), range(7, 10))
+        list_control.selected_choice_index = 0
+        self.assertEqual(list_control._get_viewport(), range(3))
+        self.assertEqual(list_control._get_formatted_choices()[-1], ("", "2"))
+        list_control.max_lines = 0
+        self.assertEqual(list_control._get_viewport(), range(1))
+
+    def test_selected_choices(self):
+        list_control = InquirerPyListControl(
+            [
+                {"name": "apple", "value": "peach", "enabled": True},
+                "pear",
+                Separator(),
+                {"name": "melon", "value": "watermelon"},
+            ],
+            None,
+            INQUIRERPY_POINTER_SEQUENCE,
+            ">",
+            None,
+            True,
+            " ",
+        )
+        self.assertEqual(list_control.selected_count, 1)
+        list_control.choices[3]["enabled"] = True
+        list_control.choices[0]["enabled"] = False
+        self.assertEqual(list_control.selected_count, 1)
+        self.assertEqual(
+            list_control.selected_choices,
+            [{"name": "melon", "value": "watermelon", "enabled": True}],
+        )
+        list_control.choices = [
+            {"name": "1", "value": 1, "enabled": True},
+            {"name": "2", "value": 2, "enabled": True},
+        ]
+        self.assertEqual(list_control.selected_count, 2)
+
     def test_choice_count(self):
         choice = [
             {"name": "1", "value": 1, "enabled": True},
@@ -0,0 +1,69 @@
+import copy
+import pickle
+import unittest
+
+from InquirerPy.base.selection import SelectableChoice, SelectedIndices
+
+
+class TestSelection(unittest.TestCase):
+    def test_selected_indices(self) -> None:
+        selected = SelectedIndices()
+        selected.update(5, True)
+        selected.update(2, 1)
+        selected.update(7, False)
+        self.assertEqual(len(selected), 2)
+        self.assertEqual(list(selected), [2, 5])
+        self.assertIn(5, selected)
+        self.assertNotIn(7, selected)
+        selected.update(5, False)
+        self.assertEqual(list(selected), [2])
+        selected.clear()
+        self.assertEqual(len(selected), 0)
+
+    def test_selectable_choice(self) -> None:
+        selected = SelectedIndices()
+        choice = SelectableChoice(
+            {"name": "a", "value": 1, "enabled": True}, selected, 3
+        )
+        self.assertEqual(choice, {"name": "a", "value": 1, "enabled": True})
+        self.assertEqual(list(selected), [3])
+        choice["enabled"] = False
+        self.assertEqual(len(selected), 0)
+        choice["name"] = "b"
+        self.assertEqual(len(selected), 0)
+        choice["enabled"] = True
+        self.assertEqual(list(selected), [3])
+
+    def test_selectable_choice_mutations(self) -> None:
+        selected = SelectedIndices()
+        choice = SelectableChoice(
+            {"name": "a", "value": 1, "enabled": False}, selected, 3
+        )
+        choice.update({"enabled": True})
+        self.assertEqual(list(selected), [3])
+        choice.update(enabled=False)
+        self.assertEqual(len(selected), 0)
+        choice |= {"enabled": True}
+        self.assertIsInstance(choice, SelectableChoice)
+        self.assertEqual(list(selected), [3])
+        del choice["enabled"]
+        self.assertEqual(len(selected), 0)
+        self.assertTrue(choice.setdefault("enabled", True))
+        self.assertEqual(list(selected), [3])
+        self.assertTrue(choice.pop("enabled"))
+        self.assertEqual(len(selected), 0)
+        choice["enabled"] = True
+        choice.popitem()
+        self.assertEqual(len(selected), 0)
+        choice["enabled"] = True
+        choice.clear()
+        self.assertEqual(len(selected), 0)
+
+    def test_selectable_choice_pickle(self) -> None:
+        choice = SelectableChoice(
+            {"name": "a", "value": 1, "enabled": True}, SelectedIndices(), 0
+        )
+        loaded = pickle.loads(pickle.dumps(choice))
+        self.assertEqual(type(loaded), dict)
+        self.assertEqual(loaded, {"name": "a", "value": 1, "enabled": True})
+        self.assertEqual(type(copy.copy(choice)), dict)
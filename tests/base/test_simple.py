@@ -11,7 +11,7 @@ from prompt_toolkit.keys import Keys
 from InquirerPy.enum import INQUIRERPY_KEYBOARD_INTERRUPT
 from InquirerPy.exceptions import RequiredKeyNotFound
 from InquirerPy.prompts.input import InputPrompt
-from InquirerPy.utils import get_style
+from InquirerPy.utils import InquirerPyStyle, get_style
 from InquirerPy.validator import NumberValidator
 from tests.style import get_sample_style
 
@@ -19,11 +19,11 @@ from tests.style import get_sample_style
 class TestBaseSimple(unittest.TestCase):
     @patch("InquirerPy.base.simple.KeyBindings.add")
     @patch("InquirerPy.base.simple.Validator.from_callable")
-    @patch("InquirerPy.base.simple.Style.from_dict")
+    @patch("InquirerPy.base.simple.get_compiled_style")
     def test_constructor_default(self, mocked_style, mocked_validator, mocked_kb):
         input_prompt = InputPrompt(message="Enter your name", style=None, default="1")
         self.assertEqual(input_prompt._message, "Enter your name")
-        mocked_style.assert_has_calls([call(get_sample_style())])
+        mocked_style.assert_has_calls([call(InquirerPyStyle(get_sample_style()))])
         self.assertEqual(input_prompt._default, "1")
         self.assertEqual(input_prompt._qmark, "?")
         self.assertEqual(input_prompt._amark, "?")
@@ -34,7 +34,7 @@ class TestBaseSimple(unittest.TestCase):
         mocked_kb.assert_has_calls([call("c-c")])
 
     @patch("InquirerPy.base.simple.Validator.from_callable")
-    @patch("InquirerPy.base.simple.Style.from_dict")
+    @patch("InquirerPy.base.simple.get_compiled_style")
     def test_constructor_custom(self, mocked_style, mocked_validator):
         input_prompt = InputPrompt(
             message=lambda _: "Enter your name",
@@ -48,7 +48,7 @@ class TestBaseSimple(unittest.TestCase):
         style = get_sample_style()
         style["questionmark"] = "#111111"
         self.assertEqual(input_prompt._message, "Enter your name")
-        mocked_style.assert_has_calls([call(style)])
+        mocked_style.assert_has_calls([call(InquirerPyStyle(style))])
         self.assertEqual(input_prompt._default, "1")
         self.assertEqual(input_prompt._qmark, "[?]")
         self.assertEqual(input_prompt._amark, "*")
@@ -0,0 +1,97 @@
+import threading
+import unittest
+
+from InquirerPy.base.store import ChoiceStore, ChoiceView
+from InquirerPy.separator import Separator
+
+
+class TestChoiceStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.choices = [
+            {"name": "foo", "value": "foo", "enabled": False},
+            {"name": "1", "value": 1, "enabled": True},
+            {"name": "", "value": "", "enabled": False},
+            {"name": "bar", "value": {"a": 1}, "enabled": False, "instruction": None},
+            {"name": "baz", "value": "baz", "enabled": False, "extra": [1]},
+        ]
+        self.store = ChoiceStore(self.choices, block_size=2)
+
+    def test_constructor(self) -> None:
+        self.assertEqual(len(self.store), 5)
+        self.assertEqual(self.store, self.choices)
+        self.assertEqual(self.store, ChoiceStore(self.choices))
+        self.assertNotEqual(self.store, self.choices[:4])
+        self.assertIsInstance(self.store[0], ChoiceView)
+        self.assertEqual(self.store[-1]["name"], "baz")
+        self.assertRaises(IndexError, lambda: self.store[5])
+        self.assertEqual([choice["name"] for choice in self.store[1:3]], ["1", ""])
+
+    def test_view(self) -> None:
+        choice = self.store[3]
+        self.assertEqual(choice["value"], {"a": 1})
+        self.assertIsNone(choice["instruction"])
+        self.assertEqual(list(choice), ["name", "value", "enabled", "instruction"])
+        self.assertEqual(self.store[4]["extra"], [1])
+        self.assertRaises(KeyError, lambda: self.store[0]["extra"])
+
+        choice["enabled"] = True
+        choice["instruction"] = "hello"
+        self.assertTrue(self.store[3]["enabled"])
+        self.assertEqual(self.store[3]["instruction"], "hello")
+        del choice["instruction"]
+        self.assertNotIn("instruction", self.store[3])
+        self.assertRaises(KeyError, choice.__setitem__, "name", "hello")
+        self.assertRaises(KeyError, choice.__delitem__, "extra")
+
+    def test_indexed(self) -> None:
+        self.assertNotIn("index", self.store[1])
+        self.store.indexed = True
+        self.assertEqual(self.store[1]["index"], 1)
+        self.store[1]["index"] = 1
+        self.assertRaises(KeyError, self.store[1].__setitem__, "index", 2)
+
+    def test_separator_count(self) -> None:
+        self.assertEqual(self.store.separator_count, 0)
+        self.store.append({"name": "---", "value": Separator(), "enabled": False})
+        self.assertEqual(self.store.separator_count, 1)
+        self.store[5]["value"] = "---"
+        self.assertEqual(self.store.separator_count, 0)
+
+    def test_selected(self) -> None:
+        self.assertEqual(list(self.store.selected), [1])
+        self.store[3]["enabled"] = True
+        self.store[1]["enabled"] = False
+        self.store.append({"name": "qux", "value": "qux", "enabled": True})
+        self.assertEqual(list(self.store.selected), [3, 5])
+
+    def test_names(self) -> None:
+        names = [choice["name"] for choice in self.choices]
+        self.assertEqual(len(self.store.names), 5)
+        self.assertEqual(list(self.store.names), names)
+        self.assertEqual(self.store.names[-1], "baz")
+        self.assertRaises(IndexError, lambda: self.store.names[5])
+        for start in range(6):
+            for stop in range(start, 7):
+                self.assertEqual(self.store.names[start:stop], names[start:stop])
+        self.assertEqual(self.store.names[::2], names[::2])
+
+    def test_names_pending(self) -> None:
+        store = ChoiceStore(block_size=3)
+        store.append({"name": "a", "value": "a", "enabled": False})
+        self.assertEqual(store.names[0], "a")
+        store.append({"name": "b", "value": "b", "enabled": False})
+        self.assertEqual(store.names[:], ["a", "b"])
+
+    def test_names_concurrent(self) -> None:
+        store = ChoiceStore(block_size=7)
+        names = [str(i) for i in range(5000)]
+        thread = threading.Thread(
+            target=store.extend,
+            args=(({"name": name, "value": name, "enabled": False} for name in names),),
+        )
+        thread.start()
+        while thread.is_alive():
+            count = len(store)
+            self.assertEqual(store.names[:count], names[:count])
+        thread.join()
+        self.assertEqual(list(store.names), names)
@@ -0,0 +1,95 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from InquirerPy.containers.preview import PreviewControl, PreviewWindow
+
+
+class TestPreview(unittest.TestCase):
+    def setUp(self) -> None:
+        self.choices = [{"index": index, "value": index} for index in range(3)]
+        self.current = 0
+        self.calls = []
+
+    def get_choice(self):
+        return self.choices[self.current] if self.current is not None else None
+
+    def preview(self, value):
+        self.calls.append(value)
+        return "preview %s" % value
+
+    @patch("InquirerPy.containers.preview.get_app")
+    def test_sync_preview(self, mocked_app) -> None:
+        control = PreviewControl(preview=self.preview, get_choice=self.get_choice)
+
+        async def run():
+            self.assertEqual(control._get_text(), [])
+            await control._task
+            self.assertEqual(
+                control._get_text(), [("class:fuzzy_preview", "preview 0")]
+            )
+            self.current = 1
+            control._get_text()
+            await control._task
+            self.current = 0
+            self.assertEqual(
+                control._get_text(), [("class:fuzzy_preview", "preview 0")]
+            )
+            self.current = None
+            self.assertEqual(control._get_text(), [])
+
+        asyncio.run(run())
+        self.assertEqual(self.calls, [0, 1])
+        self.assertEqual(mocked_app().invalidate.call_count, 2)
+
+    @patch("InquirerPy.containers.preview.get_app")
+    def test_async_preview(self, mocked_app) -> None:
+        async def preview(value):
+            await asyncio.sleep(0)
+            return self.preview(value)
+
+        control = PreviewControl(preview=preview, get_choice=self.get_choice)
+
+        async def run():
+            control._get_text()
+            task = control._task
+            self.current = 1
+            control._get_text()
+            await asyncio.sleep(0)
+            self.assertTrue(task.cancelled())
+            await control._task
+            self.assertEqual(
+                control._get_text(), [("class:fuzzy_preview", "preview 1")]
+            )
+
+        asyncio.run(run())
+        self.assertEqual(self.calls, [1])
+        self.assertNotIn(0, control._cache)
+
+    @patch("InquirerPy.containers.preview.get_app")
+    def test_preview_error(self, _) -> None:
+        def preview(value):
+            raise ValueError("no preview")
+
+        control = PreviewControl(preview=preview, get_choice=self.get_choice)
+
+        async def run():
+            control._get_text()
+            task = control._task
+            await asyncio.wait([task])
+            self.assertEqual(
+                control._get_text(), [("class:fuzzy_preview", "no preview")]
+            )
+            self.assertIs(control._task, None)
+            control.cancel()
+            self.assertEqual(control._get_text(), [])
+
+        asyncio.run(run())
+        self.assertNotIn(0, control._cache)
+
+    def test_window(self) -> None:
+        window = PreviewWindow(
+            preview=self.preview, get_choice=self.get_choice, cache_size=2
+        )
+        self.assertIs(window.content, window.control)
+        self.assertEqual(window.control._cache._max_entries, 2)
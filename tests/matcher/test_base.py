@@ -0,0 +1,119 @@
+import asyncio
+import unittest
+from unittest.mock import call, patch
+
+from pfzy.score import fzy_scorer, substr_scorer
+
+from InquirerPy.matcher import Matcher, heap_chunk
+
+
+class TestMatcher(unittest.TestCase):
+    names = ["meat", "what", "whaaah", "weather", "haha", "awhile"]
+
+    def test_match(self) -> None:
+        matcher = Matcher(self.names, chunk_size=4)
+        self.assertEqual(
+            asyncio.run(matcher.match("wh", fzy_scorer)),
+            [
+                heap_chunk(fzy_scorer, "wh", self.names, range(4)),
+                heap_chunk(fzy_scorer, "wh", self.names, range(4, 6)),
+            ],
+        )
+        self.assertEqual(
+            asyncio.run(matcher.match("wh", fzy_scorer, [5, 0])),
+            [heap_chunk(fzy_scorer, "wh", self.names, [5, 0])],
+        )
+        self.assertEqual(asyncio.run(matcher.match("wh", fzy_scorer, [])), [])
+        matcher.close()
+
+    def test_on_chunk(self) -> None:
+        matcher = Matcher(self.names, chunk_size=4)
+        chunks = []
+        result = asyncio.run(
+            matcher.match(
+                "wh",
+                fzy_scorer,
+                on_chunk=lambda heap, scanned: chunks.append((heap, scanned)),
+            )
+        )
+        self.assertEqual(chunks, [(result[0], 4), (result[1], 2)])
+
+    def test_on_extend(self) -> None:
+        names = self.names[:3]
+        matcher = Matcher(names)
+        names.extend(self.names[3:])
+        matcher.on_extend(self.names[3:])
+        self.assertEqual(
+            asyncio.run(matcher.match("wh", fzy_scorer)),
+            [heap_chunk(fzy_scorer, "wh", self.names, range(6))],
+        )
+
+    def test_build_index(self) -> None:
+        names = self.names[:4]
+        matcher = Matcher(names, chunk_size=3)
+        asyncio.run(matcher.build_index())
+        self.assertEqual(len(matcher._index), 4)
+        names.extend(self.names[4:])
+        matcher.on_extend(self.names[4:])
+        self.assertEqual(len(matcher._index), 6)
+        with patch("InquirerPy.matcher.base.heap_chunk") as mocked_heap_chunk:
+            asyncio.run(matcher.match("wh", fzy_scorer))
+        mocked_heap_chunk.assert_has_calls(
+            [
+                call(fzy_scorer, "wh", names, [1, 2]),
+                call(fzy_scorer, "wh", names, [3, 5]),
+            ]
+        )
+        self.assertEqual(
+            asyncio.run(matcher.match("wh", fzy_scorer)),
+            [
+                heap_chunk(fzy_scorer, "wh", self.names, range(3)),
+                heap_chunk(fzy_scorer, "wh", self.names, range(3, 6)),
+            ],
+        )
+
+    def test_exact_index(self) -> None:
+        names = self.names[:5]
+        matcher = Matcher(names, chunk_size=2, exact_index=True)
+        expected = Matcher(self.names, chunk_size=2)
+        chunks = []
+
+        async def run():
+            result = await matcher.match("hah", substr_scorer)
+            await matcher._trigram_task
+            self.assertEqual(len(matcher._trigrams), 5)
+            names.extend(self.names[5:])
+            matcher.on_extend(self.names[5:])
+            self.assertEqual(len(matcher._trigrams), 6)
+            return result, await matcher.match(
+                "hah",
+                substr_scorer,
+                on_chunk=lambda heap, scanned: chunks.append((heap, scanned)),
+            )
+
+        before, after = asyncio.run(run())
+        self.assertEqual(before, asyncio.run(expected.match("hah", substr_scorer)))
+        self.assertEqual(after, [heap_chunk(substr_scorer, "hah", self.names, [4])])
+        self.assertEqual(chunks, [([], 5), (after[0], 1)])
+        self.assertEqual(
+            asyncio.run(matcher.match("wh", substr_scorer)),
+            asyncio.run(expected.match("wh", substr_scorer)),
+        )
+        matcher.close()
+
+    def test_yield_between_chunks(self) -> None:
+        matcher = Matcher(self.names * 10, chunk_size=1)
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0)
+
+        async def run():
+            task = asyncio.ensure_future(tick())
+            await matcher.match("wh", fzy_scorer)
+            task.cancel()
+
+        asyncio.run(run())
+        self.assertGreater(len(ticks), 10)
@@ -0,0 +1,102 @@
+import asyncio
+import unittest
+
+from pfzy.score import fzy_scorer
+
+from InquirerPy.exceptions import InvalidArgument
+from InquirerPy.matcher import ExecutorMatcher, RankedChoices, Matcher
+
+
+class TestExecutorMatcher(unittest.TestCase):
+    names = ["meat", "what", "whaaah", "weather", "haha", "awhile"]
+    choices = [{"name": name} for name in names]
+
+    def rank(self, heaps):
+        return [choice["name"] for choice in RankedChoices(self.choices, heaps)]
+
+    def test_match(self) -> None:
+        expected = self.rank(asyncio.run(Matcher(self.names).match("wh", fzy_scorer)))
+        for executor, workers in (("thread", 1), ("process", 1), ("process", 3)):
+            matcher = ExecutorMatcher(
+                self.names, executor=executor, chunk_size=2, workers=workers
+            )
+            try:
+                self.assertEqual(matcher.workers, workers)
+                result = asyncio.run(matcher.match("wh", fzy_scorer))
+                self.assertEqual(self.rank(result), expected)
+                result = asyncio.run(matcher.match("wh", fzy_scorer, [5, 0, 1]))
+                self.assertEqual(
+                    self.rank(result),
+                    [name for name in expected if name in {"what", "awhile"}],
+                )
+                self.assertEqual(asyncio.run(matcher.match("wh", fzy_scorer, [])), [])
+            finally:
+                matcher.close()
+            self.assertEqual(matcher._executors, [None] * workers)
+
+    def test_on_chunk(self) -> None:
+        matcher = ExecutorMatcher(self.names, executor="thread", chunk_size=4)
+        chunks = []
+        try:
+            result = asyncio.run(
+                matcher.match(
+                    "wh",
+                    fzy_scorer,
+                    on_chunk=lambda heap, scanned: chunks.append((heap, scanned)),
+                )
+            )
+        finally:
+            matcher.close()
+        self.assertEqual(chunks, [(result[0], 4), (result[1], 2)])
+
+    def test_on_extend(self) -> None:
+        names = self.names[:2]
+        matcher = ExecutorMatcher(names, executor="process", workers=3)
+        self.assertEqual(matcher.workers, 2)
+        names.extend(self.names[2:5])
+        matcher.on_extend(self.names[2:5])
+        self.assertEqual(matcher.workers, 3)
+        expected = self.rank(asyncio.run(Matcher(self.names).match("wh", fzy_scorer)))
+        try:
+            asyncio.run(matcher.match("wh", fzy_scorer))
+            names.extend(self.names[5:])
+            matcher.on_extend(self.names[5:])
+            self.assertEqual(matcher.workers, 3)
+            self.assertEqual(matcher._get_shard_range(2), range(4, 6))
+            result = asyncio.run(matcher.match("wh", fzy_scorer))
+            self.assertEqual(self.rank(result), expected)
+            result = asyncio.run(matcher.match("wh", fzy_scorer, [5]))
+            self.assertEqual(self.rank(result), ["awhile"])
+        finally:
+            matcher.close()
+
+    def test_workers_more_than_names(self) -> None:
+        matcher = ExecutorMatcher(["a", "b"], executor="process", workers=4)
+        self.assertEqual(matcher.workers, 2)
+        matcher = ExecutorMatcher([], executor="process", workers=4)
+        self.assertEqual(matcher.workers, 1)
+        self.assertEqual(asyncio.run(matcher.match("a", fzy_scorer)), [])
+
+    def test_cancel(self) -> None:
+        matcher = ExecutorMatcher(self.names * 1000, chunk_size=1)
+        queued = []
+
+        async def run():
+            task = asyncio.ensure_future(matcher.match("wh", fzy_scorer))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            queued.append(matcher._get_executor(0)._work_queue.qsize())
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        try:
+            asyncio.run(run())
+            self.assertLessEqual(queued[0], 1)
+        finally:
+            matcher.close()
+
+    def test_invalid_argument(self) -> None:
+        self.assertRaises(InvalidArgument, ExecutorMatcher, self.names, "asdf")
+        self.assertRaises(InvalidArgument, ExecutorMatcher, self.names, "thread", 10, 2)
@@ -0,0 +1,36 @@
+import random
+import unittest
+
+from InquirerPy.matcher import substr_score
+from InquirerPy.matcher.ngram import TrigramIndex
+
+
+class TestTrigramIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(0)
+        self.names = [
+            "".join(rng.choices("abcAB -İ", k=rng.randint(0, 12))) for _ in range(2000)
+        ]
+        self.index = TrigramIndex()
+        self.index.extend(self.names[:7])
+        self.index.extend(self.names[7:])
+
+    def test_search(self) -> None:
+        self.assertEqual(len(self.index), 2000)
+        self.assertIsNone(self.index.search("ab c"))
+        self.assertEqual(self.index.search("zzz"), set())
+        for needle in ["abc", "Bab", "aba cab", "aaaa", "i̇ab"]:
+            matched = self.index.search(needle)
+            for index, name in enumerate(self.names):
+                if substr_score(needle, name) is not None:
+                    self.assertIn(index, matched, (needle, name))
+
+    def test_filter(self) -> None:
+        index = TrigramIndex()
+        index.extend(["weather", "whatever", "wheat", "WHEAT"])
+        self.assertEqual(index.filter("eat", range(6)), [0, 2, 3, 4, 5])
+        self.assertEqual(index.filter("eat", range(1, 3)), [2])
+        self.assertEqual(index.filter("eat", [5, 3, 1]), [5, 3])
+        self.assertEqual(index.filter("ea", range(4)), range(4))
+        self.assertEqual(index.filter("eat", range(4, 6)), range(4, 6))
+        self.assertEqual(index.filter("wha eve", range(4)), [1])
@@ -0,0 +1,90 @@
+import random
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+from pfzy.score import fzy_scorer, substr_scorer
+
+from InquirerPy.matcher import fzy_score, substr_score
+from InquirerPy.matcher.prefilter import CharacterIndex, get_signature
+
+
+class TestCharacterIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(0)
+        self.names = [
+            "".join(rng.choices("abcAB/ -_.xéİΣσ\x00", k=rng.randint(0, 10)))
+            for _ in range(2000)
+        ]
+        self.index = CharacterIndex()
+        with patch("InquirerPy.matcher.prefilter.NUMPY_THRESHOLD", 1):
+            self.index.extend(self.names[:1])
+            self.index.extend(self.names[1:])
+
+    def test_signature(self) -> None:
+        self.assertEqual(get_signature("Ab"), get_signature("bba"))
+        self.assertEqual(get_signature(""), 0)
+        self.assertEqual(
+            self.index._signatures.tolist(), [get_signature(n) for n in self.names]
+        )
+        with patch("InquirerPy.matcher.prefilter._get_numpy", return_value=None):
+            index = CharacterIndex()
+            index.extend(self.names)
+        self.assertEqual(index._signatures, self.index._signatures)
+
+    def test_filter(self) -> None:
+        for needle in ["a", "ab", "a b", "İ", "Σa", "x.", "\x00", "  "]:
+            for scorer, score_only in (
+                (fzy_scorer, fzy_score),
+                (substr_scorer, substr_score),
+            ):
+                matched = [
+                    index
+                    for index, name in enumerate(self.names)
+                    if score_only(needle, name) is not None
+                ]
+                candidates = list(
+                    self.index.filter(needle, scorer, range(len(self.names)))
+                )
+                self.assertEqual(
+                    candidates,
+                    self.index.filter(needle, scorer, list(range(len(self.names)))),
+                )
+                self.assertTrue(set(matched).issubset(candidates), needle)
+                with patch(
+                    "InquirerPy.matcher.prefilter._get_numpy", return_value=None
+                ):
+                    self.assertEqual(
+                        list(self.index.filter(needle, scorer, range(len(self.names)))),
+                        candidates,
+                    )
+
+    def test_numpy_not_imported(self) -> None:
+        code = (
+            "import sys\n"
+            "from InquirerPy import inquirer\n"
+            "from InquirerPy.prompts.fuzzy import InquirerPyFuzzyControl\n"
+            "InquirerPyFuzzyControl(\n"
+            "    choices=['meat', 'what'], pointer='', marker='', current_text=str,\n"
+            "    max_lines=1, session_result=None, multiselect=False, marker_pl='',\n"
+            "    match_exact=False,\n"
+            ")\n"
+            "print('numpy' in sys.modules)\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "False")
+
+    def test_filter_unindexed(self) -> None:
+        index = CharacterIndex()
+        index.extend(["what", "meat", "whoa"])
+        self.assertEqual(index.filter("wh", fzy_scorer, range(5)), [0, 2, 3, 4])
+        self.assertEqual(index.filter("wh", fzy_scorer, [4, 1, 0]), [4, 0])
+        self.assertEqual(index.filter("wh", fzy_scorer, range(3, 5)), range(3, 5))
+        self.assertEqual(index.filter("wh", fzy_scorer, range(4, 6), 3), [5])
+        self.assertEqual(
+            index.filter("wh", lambda *_: (1, []), range(3)),
+            range(3),
+        )
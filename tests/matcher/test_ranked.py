@@ -0,0 +1,72 @@
+import unittest
+
+from pfzy.score import fzy_scorer
+
+from InquirerPy.matcher import RankedChoices, heap_chunk, score_chunk
+
+
+class TestRankedChoices(unittest.TestCase):
+    names = ["meat", "what", "whaaah", "weather", "haha", "awhile", "wh"]
+
+    def setUp(self) -> None:
+        self.choices = [{"name": name, "index": i} for i, name in enumerate(self.names)]
+        self.heaps = [
+            heap_chunk(fzy_scorer, "wh", self.names, range(0, 3)),
+            heap_chunk(fzy_scorer, "wh", self.names, range(3, 7)),
+        ]
+        self.expected = [
+            self.names[index]
+            for _, index in sorted(
+                score_chunk(fzy_scorer, "wh", self.names, range(7)),
+                key=lambda match: (-match[0], match[1]),
+            )
+        ]
+
+    def test_lazy_sort(self) -> None:
+        ranked = RankedChoices(self.choices, self.heaps, step=2)
+        self.assertEqual(len(ranked), 5)
+        self.assertEqual(len(ranked._ranked), 0)
+        self.assertEqual(ranked[0]["name"], self.expected[0])
+        self.assertEqual(len(ranked._ranked), 2)
+        self.assertEqual(ranked[1]["name"], self.expected[1])
+        self.assertEqual(len(ranked._ranked), 2)
+        self.assertEqual(ranked[2]["name"], self.expected[2])
+        self.assertEqual(len(ranked._ranked), 4)
+        self.assertEqual(ranked[-1]["name"], self.expected[-1])
+        self.assertEqual(len(ranked._ranked), 5)
+        self.assertEqual([choice["name"] for choice in ranked], self.expected)
+        self.assertEqual([choice["name"] for choice in ranked[1:3]], self.expected[1:3])
+        self.assertRaises(IndexError, ranked.__getitem__, 5)
+        self.assertRaises(IndexError, ranked.__getitem__, -6)
+
+    def test_needle(self) -> None:
+        ranked = RankedChoices(self.choices, self.heaps, needle="wh", scorer=fzy_scorer)
+        self.assertEqual(ranked.needle, "wh")
+        self.assertIs(ranked.scorer, fzy_scorer)
+        self.assertNotIn("indices", ranked[0])
+
+    def test_extend(self) -> None:
+        ranked = RankedChoices(self.choices, self.heaps[:1], step=1)
+        self.assertEqual(ranked[0]["name"], "what")
+        ranked.extend(self.heaps[1:] + [[]])
+        self.assertEqual(len(ranked), 5)
+        self.assertEqual([choice["name"] for choice in ranked], self.expected)
+        ranked.extend([])
+        self.assertEqual(len(ranked), 5)
+
+    def test_unordered(self) -> None:
+        ranked = RankedChoices(self.choices, self.heaps, step=1)
+        ranked[0]
+        self.assertEqual(
+            sorted(choice["name"] for choice in ranked.unordered()),
+            sorted(self.expected),
+        )
+
+    def test_eq(self) -> None:
+        ranked = RankedChoices(self.choices, self.heaps)
+        self.assertEqual(
+            ranked, [self.choices[self.names.index(n)] for n in self.expected]
+        )
+        self.assertNotEqual(ranked, [])
+        self.assertEqual(RankedChoices(self.choices, []), [])
+        self.assertEqual(len(RankedChoices(self.choices, [[], []])), 0)
@@ -0,0 +1,68 @@
+import unittest
+
+import random
+
+from pfzy.score import fzy_scorer, substr_scorer
+
+from InquirerPy.matcher import (
+    fzy_score,
+    get_score_only,
+    heap_chunk,
+    score_chunk,
+    substr_score,
+)
+
+
+class TestScore(unittest.TestCase):
+    names = ["meat", "what", "whaaah", "weather", "haha", "awhile"]
+
+    def test_score_chunk(self) -> None:
+        expected = [
+            (substr_scorer("ha", "whaaah")[0], 2),
+            (substr_scorer("ha", "haha")[0], 4),
+        ]
+        self.assertEqual(
+            score_chunk(substr_scorer, "ha", self.names, [2, 4, 0]), expected
+        )
+        self.assertEqual(
+            score_chunk(substr_scorer, "ha", self.names[2:5], [2, 4], offset=2),
+            expected,
+        )
+
+    def test_heap_chunk(self) -> None:
+        heap = heap_chunk(fzy_scorer, "wh", self.names, range(6))
+        self.assertEqual(len(heap), 4)
+        self.assertEqual(heap[0], min(heap))
+        self.assertEqual(
+            sorted(heap),
+            sorted(
+                (-score, index)
+                for score, index in score_chunk(fzy_scorer, "wh", self.names, range(6))
+            ),
+        )
+        self.assertEqual(heap_chunk(fzy_scorer, "wh", self.names, []), [])
+
+    def test_score_only(self) -> None:
+        random.seed(0)
+        chars = "abAB/_ .-c1"
+        for _ in range(2000):
+            haystack = "".join(random.choices(chars, k=random.randint(0, 12)))
+            needle = "".join(random.choices(chars, k=random.randint(0, 4)))
+            for score_only, scorer in (
+                (fzy_score, fzy_scorer),
+                (substr_score, substr_scorer),
+            ):
+                score, indices = scorer(needle, haystack)
+                self.assertEqual(
+                    score_only(needle, haystack), None if indices is None else score
+                )
+        self.assertEqual(fzy_score("Ab", "xab"), float("-inf"))
+        self.assertIsNone(fzy_score("Ab", "xa"))
+
+    def test_get_score_only(self) -> None:
+        self.assertIs(get_score_only(fzy_scorer), fzy_score)
+        self.assertIs(get_score_only(substr_scorer), substr_score)
+        custom = get_score_only(lambda needle, haystack: (1, None))
+        self.assertIsNone(custom("a", "a"))
+        custom = get_score_only(lambda needle, haystack: (1, [0]))
+        self.assertEqual(custom("a", "a"), 1)
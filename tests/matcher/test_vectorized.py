@@ -0,0 +1,69 @@
+import asyncio
+import random
+import unittest
+from unittest.mock import patch
+
+from pfzy.score import fzy_scorer, substr_scorer
+
+from InquirerPy.exceptions import InvalidArgument
+from InquirerPy.matcher import Matcher, VectorizedMatcher, fzy_score, substr_score
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+if numpy is not None:
+    from InquirerPy.matcher.vectorized import fzy_score_batch, substr_score_batch
+
+
+@unittest.skipUnless(numpy, "requires numpy")
+class TestScoreBatch(unittest.TestCase):
+    needles = ["a", "ab", "aB", "b/a", "a b", "  ", "x.x", "abab", "İ", "é", ""]
+
+    def setUp(self) -> None:
+        rng = random.Random(0)
+        self.haystacks = [
+            "".join(rng.choices("abcAB/ -_.xéİΣ\x00", k=rng.randint(0, 12)))
+            for _ in range(2000)
+        ] + ["a" * 300 + "b", "ab", ""]
+
+    @staticmethod
+    def scores(batch) -> list:
+        return [None if numpy.isnan(score) else score for score in batch.tolist()]
+
+    def test_fzy_score_batch(self) -> None:
+        for needle in self.needles:
+            self.assertEqual(
+                self.scores(fzy_score_batch(needle, self.haystacks)),
+                [fzy_score(needle, haystack) for haystack in self.haystacks],
+                needle,
+            )
+
+    def test_substr_score_batch(self) -> None:
+        for needle in self.needles:
+            self.assertEqual(
+                self.scores(substr_score_batch(needle, self.haystacks)),
+                [substr_score(needle, haystack) for haystack in self.haystacks],
+                needle,
+            )
+
+
+@unittest.skipUnless(numpy, "requires numpy")
+class TestVectorizedMatcher(unittest.TestCase):
+    names = ["meat", "what", "whaaah", "weather", "haha", "Whoa", "awhile"]
+
+    def test_match(self) -> None:
+        matcher = VectorizedMatcher(self.names, chunk_size=4)
+        expected = Matcher(self.names, chunk_size=4)
+        for needle in ("wh", "Wh", "aH"):
+            for scorer in (fzy_scorer, substr_scorer, lambda *_: (1, [])):
+                for candidates in (None, [6, 0, 1], []):
+                    self.assertEqual(
+                        asyncio.run(matcher.match(needle, scorer, candidates)),
+                        asyncio.run(expected.match(needle, scorer, candidates)),
+                    )
+
+    @patch("InquirerPy.matcher.vectorized.np", None)
+    def test_missing_numpy(self) -> None:
+        self.assertRaises(InvalidArgument, VectorizedMatcher, self.names)
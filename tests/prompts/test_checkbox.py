@@ -6,6 +6,7 @@ from prompt_toolkit.key_binding.key_bindings import KeyBindings
 from prompt_toolkit.styles.style import Style
 
 from InquirerPy.base.control import Choice
+from InquirerPy.base.store import ChoiceStore
 from InquirerPy.exceptions import InvalidArgument, RequiredKeyNotFound
 from InquirerPy.prompts.checkbox import CheckboxPrompt, InquirerPyCheckboxControl
 from InquirerPy.separator import Separator
@@ -226,3 +227,26 @@ class TestCheckbox(unittest.TestCase):
         )
         print(prompt.content_control.selection["instruction"])
         self.assertEqual("instruction", prompt.content_control.selection["instruction"])
+
+    def test_checkbox_compact(self):
+        prompts = [
+            CheckboxPrompt(message="", choices=self.choices, compact=compact)
+            for compact in (False, True)
+        ]
+        prompt, compact_prompt = prompts
+        self.assertIsInstance(compact_prompt.content_control.choices, ChoiceStore)
+        self.assertEqual(
+            compact_prompt.content_control.choices, prompt.content_control.choices
+        )
+        self.assertEqual(compact_prompt.content_control.selected_choice_index, 0)
+        for current in prompts:
+            current._handle_toggle_choice(None)
+            current._handle_up(None)
+            current._handle_toggle_choice(None)
+        self.assertEqual(
+            compact_prompt.content_control._get_formatted_choices(),
+            prompt.content_control._get_formatted_choices(),
+        )
+        self.assertEqual(compact_prompt.result_value, ["boy"])
+        compact_prompt._handle_toggle_all(None, True)
+        self.assertEqual(compact_prompt.result_value, ["boy", "girl", "boy&girl"])
@@ -235,7 +235,7 @@ class TestConfirmPrompt(unittest.TestCase):
         )
 
     @patch("InquirerPy.prompts.confirm.ConfirmPrompt._get_prompt_message")
-    @patch("InquirerPy.base.simple.Style.from_dict")
+    @patch("InquirerPy.base.simple.get_compiled_style")
     @patch("InquirerPy.base.simple.KeyBindings")
     @patch("InquirerPy.prompts.confirm.PromptSession")
     def test_callable_called(
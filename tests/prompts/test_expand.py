@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import ANY, call, patch
 
 from InquirerPy.base import BaseComplexPrompt
+from InquirerPy.base.store import ChoiceStore
 from InquirerPy.exceptions import InvalidArgument, RequiredKeyNotFound
 from InquirerPy.prompts.expand import (
     ExpandChoice,
@@ -418,3 +419,21 @@ class TestExpandPrompt(unittest.TestCase):
             expand_help=ExpandHelp(),
         )
         self.assertEqual("instruction", prompt.content_control.selection["instruction"])
+
+    def test_expand_compact(self):
+        prompt, compact_prompt = [
+            ExpandPrompt(message="", choices=self.choices, default="f", compact=compact)
+            for compact in (False, True)
+        ]
+        self.assertIsInstance(compact_prompt.content_control.choices, ChoiceStore)
+        self.assertEqual(
+            compact_prompt.content_control.choices, prompt.content_control.choices
+        )
+        self.assertEqual(compact_prompt.content_control.selected_choice_index, 3)
+        self.assertEqual(compact_prompt.instruction, "(bfh)")
+        for current in (prompt, compact_prompt):
+            current.content_control._expanded = True
+        self.assertEqual(
+            compact_prompt.content_control._get_formatted_choices(),
+            prompt.content_control._get_formatted_choices(),
+        )
@@ -211,7 +211,7 @@ class TestFilePath(unittest.TestCase):
 
     @patch("InquirerPy.prompts.input.SimpleLexer")
     @patch("InquirerPy.prompts.filepath.FilePathPrompt._get_prompt_message")
-    @patch("InquirerPy.base.simple.Style.from_dict")
+    @patch("InquirerPy.base.simple.get_compiled_style")
     @patch("InquirerPy.base.simple.KeyBindings")
     @patch("InquirerPy.prompts.input.PromptSession")
     def test_callable_called(
@@ -256,7 +256,7 @@ class TestFilePath(unittest.TestCase):
             bottom_toolbar=None,
         )
 
-        MockedStyle.assert_has_calls([call({"yes": ""})])
+        MockedStyle.assert_has_calls([call(InquirerPyStyle({"yes": ""}))])
 
     def test_invalid_argument(self):
         self.assertRaises(InvalidArgument, FilePathPrompt, "hello", None, False, 12)
@@ -1,8 +1,12 @@
 import asyncio
+import io
+import os
+import tempfile
 import unittest
 from typing import Callable, NamedTuple
 from unittest.mock import ANY, MagicMock, call, patch
 
+from pfzy import fuzzy_match
 from pfzy.score import fzy_scorer, substr_scorer
 from prompt_toolkit.application.application import Application
 from prompt_toolkit.buffer import Buffer
@@ -10,8 +14,14 @@ from prompt_toolkit.layout.layout import Layout
 
 from InquirerPy.base.complex import BaseComplexPrompt
 from InquirerPy.base.control import Choice
+from InquirerPy.base.store import ChoiceStore
+from InquirerPy.containers.preview import PreviewWindow
 from InquirerPy.enum import INQUIRERPY_POINTER_SEQUENCE
+from InquirerPy.exceptions import InvalidArgument
+from InquirerPy.history import FrecencyHistory
+from InquirerPy.matcher import RankedChoices
 from InquirerPy.prompts.fuzzy import FuzzyPrompt, InquirerPyFuzzyControl
+from InquirerPy.separator import Separator
 
 
 class AsyncMock(MagicMock):
@@ -56,35 +66,30 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 0,
-                    "indices": [],
                     "name": "haah",
                     "value": "haah",
                 },
                 {
                     "enabled": False,
                     "index": 1,
-                    "indices": [],
                     "name": "haha",
                     "value": "haha",
                 },
                 {
                     "enabled": False,
                     "index": 2,
-                    "indices": [],
                     "name": "what",
                     "value": "what",
                 },
                 {
                     "enabled": False,
                     "index": 3,
-                    "indices": [],
                     "name": "waht",
                     "value": "waht",
                 },
                 {
                     "enabled": False,
                     "index": 4,
-                    "indices": [],
                     "name": "weaht",
                     "value": "weaht",
                 },
@@ -96,35 +101,30 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 0,
-                    "indices": [],
                     "name": "haah",
                     "value": "haah",
                 },
                 {
                     "enabled": False,
                     "index": 1,
-                    "indices": [],
                     "name": "haha",
                     "value": "haha",
                 },
                 {
                     "enabled": False,
                     "index": 2,
-                    "indices": [],
                     "name": "what",
                     "value": "what",
                 },
                 {
                     "enabled": False,
                     "index": 3,
-                    "indices": [],
                     "name": "waht",
                     "value": "waht",
                 },
                 {
                     "enabled": False,
                     "index": 4,
-                    "indices": [],
                     "name": "weaht",
                     "value": "weaht",
                 },
@@ -138,7 +138,6 @@ class TestFuzzy(unittest.TestCase):
                 "name": "haah",
                 "enabled": False,
                 "value": "haah",
-                "indices": [],
             },
         )
         self.assertEqual(self.content_control.choice_count, 5)
@@ -190,35 +189,30 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 0,
-                    "indices": [],
                     "name": "meat",
                     "value": "meat",
                 },
                 {
                     "enabled": False,
                     "index": 1,
-                    "indices": [],
                     "name": "what",
                     "value": "what",
                 },
                 {
                     "enabled": False,
                     "index": 2,
-                    "indices": [],
                     "name": "whaaah",
                     "value": "whaaah",
                 },
                 {
                     "enabled": False,
                     "index": 3,
-                    "indices": [],
                     "name": "weather",
                     "value": "weather",
                 },
                 {
                     "enabled": False,
                     "index": 4,
-                    "indices": [],
                     "name": "haha",
                     "value": "haha",
                 },
@@ -231,21 +225,18 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 1,
-                    "indices": [0, 1],
                     "name": "what",
                     "value": "what",
                 },
                 {
                     "enabled": False,
                     "index": 2,
-                    "indices": [0, 1],
                     "name": "whaaah",
                     "value": "whaaah",
                 },
                 {
                     "enabled": False,
                     "index": 3,
-                    "indices": [0, 4],
                     "name": "weather",
                     "value": "weather",
                 },
@@ -258,29 +249,20 @@ class TestFuzzy(unittest.TestCase):
                 ("class:pointer", "❯"),
                 ("class:marker", " "),
                 ("[SetCursorPosition]", ""),
-                ("class:fuzzy_match", "w"),
-                ("class:fuzzy_match", "h"),
-                ("class:pointer", "a"),
-                ("class:pointer", "t"),
+                ("class:fuzzy_match", "wh"),
+                ("class:pointer", "at"),
                 ("", "\n"),
                 ("class:pointer", " "),
                 ("class:marker", " "),
-                ("class:fuzzy_match", "w"),
-                ("class:fuzzy_match", "h"),
-                ("", "a"),
-                ("", "a"),
-                ("", "a"),
-                ("", "h"),
+                ("class:fuzzy_match", "wh"),
+                ("", "aaah"),
                 ("", "\n"),
                 ("class:pointer", " "),
                 ("class:marker", " "),
                 ("class:fuzzy_match", "w"),
-                ("", "e"),
-                ("", "a"),
-                ("", "t"),
+                ("", "eat"),
                 ("class:fuzzy_match", "h"),
-                ("", "e"),
-                ("", "r"),
+                ("", "er"),
             ],
         )
         self.assertEqual(content_control.choice_count, 3)
@@ -298,7 +280,6 @@ class TestFuzzy(unittest.TestCase):
             marker_pl=" ",
             match_exact=False,
         )
-        content_control.choices[0]["indices"] = [1, 2, 3]
         asyncio.run(content_control._filter_choices(0.0))
         self.assertEqual(
             content_control._filtered_choices,
@@ -306,35 +287,30 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 0,
-                    "indices": [],
                     "name": "meat",
                     "value": "meat",
                 },
                 {
                     "enabled": False,
                     "index": 1,
-                    "indices": [],
                     "name": "what",
                     "value": "what",
                 },
                 {
                     "enabled": False,
                     "index": 2,
-                    "indices": [],
                     "name": "whaaah",
                     "value": "whaaah",
                 },
                 {
                     "enabled": False,
                     "index": 3,
-                    "indices": [],
                     "name": "weather",
                     "value": "weather",
                 },
                 {
                     "enabled": False,
                     "index": 4,
-                    "indices": [],
                     "name": "haha",
                     "value": "haha",
                 },
@@ -387,6 +363,16 @@ class TestFuzzy(unittest.TestCase):
             multiselect=False,
             marker_pl=" ",
             match_exact=False,
+            cache_size=32,
+            cache_budget=1000000,
+            executor=None,
+            workers=1,
+            backend="python",
+            exact_index=False,
+            chunk_size=10000,
+            history=None,
+            on_progress=None,
+            compact=False,
         )
 
         prompt = FuzzyPrompt(
@@ -418,6 +404,16 @@ class TestFuzzy(unittest.TestCase):
             multiselect=False,
             marker_pl=" ",
             match_exact=False,
+            cache_size=32,
+            cache_budget=1000000,
+            executor=None,
+            workers=1,
+            backend="python",
+            exact_index=False,
+            chunk_size=10000,
+            history=None,
+            on_progress=None,
+            compact=False,
         )
 
     def test_prompt_after_input(self):
@@ -444,6 +440,17 @@ class TestFuzzy(unittest.TestCase):
             [("", "  "), ("class:fuzzy_info", "3/3"), ("class:fuzzy_info", " *")],
         )
 
+    def test_prompt_after_input_progress(self):
+        prompt = FuzzyPrompt(
+            message="Select one of them",
+            choices=["haah", "haha", "what", "waht", "weaht"],
+        )
+        prompt.content_control._progress = (1, 3, 5)
+        self.assertEqual(
+            prompt._generate_after_input(),
+            [("", "  "), ("class:fuzzy_info", "1/3/5")],
+        )
+
     def test_prompt_before_input(self):
         prompt = FuzzyPrompt(
             message="Select one of them",
@@ -481,35 +488,30 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 0,
-                    "indices": [],
                     "name": "haah",
                     "value": "haah",
                 },
                 {
                     "enabled": False,
                     "index": 1,
-                    "indices": [],
                     "name": "haha",
                     "value": "haha",
                 },
                 {
                     "enabled": False,
                     "index": 2,
-                    "indices": [],
                     "name": "what",
                     "value": "what",
                 },
                 {
                     "enabled": False,
                     "index": 3,
-                    "indices": [],
                     "name": "waht",
                     "value": "waht",
                 },
                 {
                     "enabled": False,
                     "index": 4,
-                    "indices": [],
                     "name": "weaht",
                     "value": "weaht",
                 },
@@ -530,7 +532,6 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": i,
-                    "indices": [],
                     "name": "weaht",
                     "value": "weaht",
                 }
@@ -550,7 +551,6 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": i,
-                    "indices": [],
                     "name": "weaht",
                     "value": "weaht",
                 }
@@ -635,7 +635,6 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 0,
-                    "indices": [],
                     "name": "1",
                     "value": 1,
                 }
@@ -648,7 +647,6 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 0,
-                    "indices": [],
                     "name": "1",
                     "value": 1,
                 }
@@ -663,7 +661,6 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 0,
-                    "indices": [],
                     "name": "1",
                     "value": 1,
                 }
@@ -676,7 +673,6 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 0,
-                    "indices": [],
                     "name": "1",
                     "value": 1,
                 }
@@ -697,7 +693,6 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 0,
-                    "indices": [0, 1, 2, 3],
                     "name": "haha",
                     "value": "haha",
                 }
@@ -718,21 +713,18 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 0,
-                    "indices": [],
                     "name": "haha",
                     "value": "haha",
                 },
                 {
                     "enabled": False,
                     "index": 1,
-                    "indices": [],
                     "name": "asdfa",
                     "value": "asdfa",
                 },
                 {
                     "enabled": False,
                     "index": 2,
-                    "indices": [],
                     "name": "112321fd",
                     "value": "112321fd",
                 },
@@ -745,21 +737,18 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": True,
                     "index": 0,
-                    "indices": [],
                     "name": "haha",
                     "value": "haha",
                 },
                 {
                     "enabled": True,
                     "index": 1,
-                    "indices": [],
                     "name": "asdfa",
                     "value": "asdfa",
                 },
                 {
                     "enabled": True,
                     "index": 2,
-                    "indices": [],
                     "name": "112321fd",
                     "value": "112321fd",
                 },
@@ -772,21 +761,18 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": True,
                     "index": 0,
-                    "indices": [],
                     "name": "haha",
                     "value": "haha",
                 },
                 {
                     "enabled": True,
                     "index": 1,
-                    "indices": [],
                     "name": "asdfa",
                     "value": "asdfa",
                 },
                 {
                     "enabled": True,
                     "index": 2,
-                    "indices": [],
                     "name": "112321fd",
                     "value": "112321fd",
                 },
@@ -799,44 +785,76 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 0,
-                    "indices": [],
                     "name": "haha",
                     "value": "haha",
                 },
                 {
                     "enabled": False,
                     "index": 1,
-                    "indices": [],
                     "name": "asdfa",
                     "value": "asdfa",
                 },
                 {
                     "enabled": False,
                     "index": 2,
-                    "indices": [],
                     "name": "112321fd",
                     "value": "112321fd",
                 },
             ],
         )
 
-    def test_wait_time(self):
-        self.prompt.content_control.choices = []
+    @patch("asyncio.create_task")
+    def test_wait_time(self, _):
+        self.assertEqual(self.prompt._calculate_wait_time(), 0.0)
+        self.prompt._buffer.text = "w"
         self.assertEqual(self.prompt._calculate_wait_time(), 0.0)
-        self.prompt.content_control.choices = [{} for _ in range(9)]
+        self.prompt.content_control._cost = 0.001
         self.assertEqual(self.prompt._calculate_wait_time(), 0.0)
-        self.prompt.content_control.choices = [{} for _ in range(50)]
-        self.assertEqual(self.prompt._calculate_wait_time(), 0.05)
-        self.prompt.content_control.choices = [{} for _ in range(100)]
-        self.assertEqual(self.prompt._calculate_wait_time(), 0.1)
-        self.prompt.content_control.choices = [{} for _ in range(1000)]
-        self.assertEqual(self.prompt._calculate_wait_time(), 0.2)
-        self.prompt.content_control.choices = [{} for _ in range(10000)]
+        self.prompt.content_control._cost = 0.01
+        self.assertAlmostEqual(self.prompt._calculate_wait_time(), 0.05)
+        self.prompt.content_control._cost = 1.0
         self.assertEqual(self.prompt._calculate_wait_time(), 0.3)
-        self.prompt.content_control.choices = [{} for _ in range(100000)]
-        self.assertEqual(self.prompt._calculate_wait_time(), 0.6)
-        self.prompt.content_control.choices = [{} for _ in range(1000000)]
-        self.assertEqual(self.prompt._calculate_wait_time(), 1.2)
+        self.prompt._buffer.text = ""
+        self.assertEqual(self.prompt._calculate_wait_time(), 0.0)
+
+    def test_control_latency(self):
+        query = "wh"
+        content_control = InquirerPyFuzzyControl(
+            choices=["meat", "what", "whaaah", "weather", "haha"],
+            pointer=INQUIRERPY_POINTER_SEQUENCE,
+            marker=INQUIRERPY_POINTER_SEQUENCE,
+            current_text=lambda: query,
+            max_lines=80,
+            session_result=None,
+            multiselect=False,
+            marker_pl=" ",
+            match_exact=False,
+        )
+        self.assertEqual(content_control._estimate_latency("wh"), 0.0)
+        content_control._record_latency(0.5, 5)
+        self.assertEqual(content_control._cost, 0.1)
+        content_control._record_latency(1.0, 5)
+        self.assertAlmostEqual(content_control._cost, 0.13)
+        content_control._record_latency(1.0, 0)
+        self.assertAlmostEqual(content_control._cost, 0.13)
+        self.assertAlmostEqual(content_control._estimate_latency("wh"), 0.65)
+
+        content_control._cost = None
+        asyncio.run(content_control._filter_choices(0.0))
+        self.assertIsNotNone(content_control._cost)
+        content_control._cost = 0.1
+        self.assertAlmostEqual(content_control._estimate_latency("wha"), 0.3)
+        self.assertEqual(content_control._estimate_latency(""), 0.0)
+
+        content_control._append_choices(["whoa", "meh"])
+        with patch.object(content_control, "_get_haystacks") as get_haystacks:
+            self.assertAlmostEqual(content_control._estimate_latency("wha"), 0.5)
+            self.assertAlmostEqual(content_control._estimate_latency("ha"), 0.7)
+        get_haystacks.assert_not_called()
+        self.assertEqual(
+            content_control._get_haystack_count("wha"),
+            len(content_control._get_haystacks("wha")),
+        )
 
     def test_prompt_validator_index(self):
         class Hello(NamedTuple):
@@ -855,14 +873,18 @@ class TestFuzzy(unittest.TestCase):
         event = Event(App(exit=lambda result: True))
         self.prompt._handle_enter(event)
 
+    @patch.object(Application, "create_background_task")
     @patch.object(FuzzyPrompt, "_on_text_changed")
-    def test_on_rendered(self, _):
+    def test_on_rendered(self, _, mocked_task):
         prompt = FuzzyPrompt(message="", choices=[1, 2, 3], default="yes")
         self.assertEqual(prompt._buffer.text, "")
         self.assertEqual(prompt._buffer.cursor_position, 0)
         prompt._on_rendered(None)
         self.assertEqual(prompt._buffer.text, "yes")
         self.assertEqual(prompt._buffer.cursor_position, 3)
+        mocked_task.assert_called_once()
+        asyncio.run(mocked_task.call_args[0][0])
+        self.assertEqual(len(prompt.content_control._matcher._index), 3)
 
     @patch.object(FuzzyPrompt, "_on_rendered")
     @patch.object(BaseComplexPrompt, "register_kb")
@@ -913,6 +935,38 @@ class TestFuzzy(unittest.TestCase):
         self.assertEqual(control._last_line, 6)
         self.assertEqual(control._first_line, 2)
 
+    def test_control_fragment_cache(self) -> None:
+        query = ""
+        control = InquirerPyFuzzyControl(
+            choices=["meat", "what", "whaaah", "weather", "haha"],
+            pointer="",
+            marker=">",
+            current_text=lambda: query,
+            max_lines=80,
+            session_result=None,
+            multiselect=True,
+            marker_pl=" ",
+            match_exact=False,
+        )
+        control._get_formatted_choices()
+        with patch.object(
+            control, "_get_normal_text", wraps=control._get_normal_text
+        ) as mocked_normal:
+            control._get_formatted_choices()
+            mocked_normal.assert_not_called()
+
+            query = "wh"
+            control._filtered_choices = asyncio.run(control._filter_choices(0.0))
+            self.assertEqual(
+                control._get_formatted_choices()[-3:],
+                [("", "eat"), ("class:fuzzy_match", "h"), ("", "er")],
+            )
+            self.assertEqual(mocked_normal.call_count, 2)
+
+            control.choices[3]["enabled"] = True
+            control._get_formatted_choices()
+            self.assertEqual(mocked_normal.call_count, 3)
+
     def test_control_exact_match(self) -> None:
         content_control = InquirerPyFuzzyControl(
             choices=["meat", "what", "whaaah", "weather", "haha"],
@@ -931,35 +985,30 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 0,
-                    "indices": [],
                     "name": "meat",
                     "value": "meat",
                 },
                 {
                     "enabled": False,
                     "index": 1,
-                    "indices": [],
                     "name": "what",
                     "value": "what",
                 },
                 {
                     "enabled": False,
                     "index": 2,
-                    "indices": [],
                     "name": "whaaah",
                     "value": "whaaah",
                 },
                 {
                     "enabled": False,
                     "index": 3,
-                    "indices": [],
                     "name": "weather",
                     "value": "weather",
                 },
                 {
                     "enabled": False,
                     "index": 4,
-                    "indices": [],
                     "name": "haha",
                     "value": "haha",
                 },
@@ -972,7 +1021,6 @@ class TestFuzzy(unittest.TestCase):
                 {
                     "enabled": False,
                     "index": 2,
-                    "indices": [2, 3],
                     "name": "whaaah",
                     "value": "whaaah",
                 }
@@ -997,3 +1045,625 @@ class TestFuzzy(unittest.TestCase):
         self.assertEqual(
             "instruction", prompt.content_control.choices[0]["instruction"]
         )
+
+    def test_control_narrow_haystacks(self) -> None:
+        query = "w"
+        content_control = InquirerPyFuzzyControl(
+            choices=["meat", "what", "whaaah", "weather", "haha"],
+            pointer=INQUIRERPY_POINTER_SEQUENCE,
+            marker=INQUIRERPY_POINTER_SEQUENCE,
+            current_text=lambda: query,
+            max_lines=80,
+            session_result=None,
+            multiselect=False,
+            marker_pl=" ",
+            match_exact=False,
+        )
+        self.assertEqual(content_control._get_haystacks("w"), content_control.choices)
+        asyncio.run(content_control._filter_choices(0.0))
+        self.assertEqual(
+            sorted(choice["index"] for choice in content_control._get_haystacks("wh")),
+            [1, 2, 3],
+        )
+
+        query = "wha"
+        result = asyncio.run(content_control._filter_choices(0.0))
+        self.assertEqual([choice["name"] for choice in result], ["what", "whaaah"])
+        self.assertEqual(
+            sorted(
+                choice["index"] for choice in content_control._get_haystacks("what")
+            ),
+            [1, 2],
+        )
+
+        # deletion fallback to full scan
+        self.assertEqual(content_control._get_haystacks("wh"), content_control.choices)
+        self.assertEqual(content_control._get_haystacks("h"), content_control.choices)
+
+        # toggling the scorer fallback to full scan
+        content_control._scorer = substr_scorer
+        self.assertEqual(
+            content_control._get_haystacks("what"), content_control.choices
+        )
+
+        query = ""
+        asyncio.run(content_control._filter_choices(0.0))
+        content_control._scorer = fzy_scorer
+        self.assertEqual(
+            content_control._get_haystacks("what"), content_control.choices
+        )
+
+    def test_control_narrow_mixed_case(self) -> None:
+        query = ""
+
+        def get_control():
+            return InquirerPyFuzzyControl(
+                choices=["ab", "xAb", "ba", "AB"],
+                pointer=INQUIRERPY_POINTER_SEQUENCE,
+                marker=INQUIRERPY_POINTER_SEQUENCE,
+                current_text=lambda: query,
+                max_lines=80,
+                session_result=None,
+                multiselect=False,
+                marker_pl=" ",
+                match_exact=False,
+            )
+
+        narrowed = get_control()
+        for query in ["A", "Ab"]:
+            result = asyncio.run(narrowed._filter_choices(0.0))
+            full = asyncio.run(get_control()._filter_choices(0.0))
+            expected = fuzzy_match(query, ["ab", "xAb", "ba", "AB"])
+            self.assertEqual(
+                [choice["name"] for choice in result],
+                [choice["name"] for choice in full],
+            )
+            self.assertEqual(
+                sorted(choice["name"] for choice in result),
+                sorted(choice["value"] for choice in asyncio.run(expected)),
+            )
+        self.assertEqual(
+            sorted(choice["name"] for choice in result), ["AB", "ab", "xAb"]
+        )
+
+    def test_control_cached_choices(self) -> None:
+        query = "wh"
+        content_control = InquirerPyFuzzyControl(
+            choices=["meat", "what", "whaaah", "weather", "haha"],
+            pointer=INQUIRERPY_POINTER_SEQUENCE,
+            marker=INQUIRERPY_POINTER_SEQUENCE,
+            current_text=lambda: query,
+            max_lines=80,
+            session_result=None,
+            multiselect=False,
+            marker_pl=" ",
+            match_exact=False,
+            cache_size=1,
+        )
+        self.assertIsNone(content_control._get_cached_choices("wh"))
+        result = asyncio.run(content_control._filter_choices(0.0))
+        query = "wa"
+        asyncio.run(content_control._filter_choices(0.0))
+        self.assertIsNone(content_control._get_cached_choices("wh"))
+        cached = content_control._get_cached_choices("wa")
+        self.assertEqual(
+            [choice["name"] for choice in cached], ["what", "whaaah", "weather"]
+        )
+        content_control._filtered_choices = cached
+        self.assertEqual(content_control._get_indices(cached[2]), [0, 2])
+        self.assertIsNone(content_control._get_cached_choices(""))
+
+        query = "wh"
+        asyncio.run(content_control._filter_choices(0.0))
+        self.assertIsNot(content_control._get_cached_choices("wh"), result)
+        self.assertEqual(content_control._get_cached_choices("wh"), result)
+        content_control._filtered_choices = content_control._get_cached_choices("wh")
+        self.assertEqual(
+            content_control._get_indices(content_control._filtered_choices[2]), [0, 4]
+        )
+        self.assertEqual(content_control._previous_query, "wh")
+
+        content_control._scorer = substr_scorer
+        self.assertIsNone(content_control._get_cached_choices("wh"))
+
+    @patch("asyncio.create_task")
+    def test_prompt_on_text_changed_cached(self, mocked) -> None:
+        cached = RankedChoices(
+            self.prompt.content_control.choices,
+            [[(-1.0, 1)]],
+            needle="ha",
+            scorer=self.prompt.content_control._scorer,
+        )
+        self.prompt.content_control._cache.set(
+            ("ha", self.prompt.content_control._scorer), cached
+        )
+        self.prompt._buffer.text = "ha"
+        mocked.assert_not_called()
+        self.assertIs(self.prompt.content_control._filtered_choices, cached)
+        self.assertEqual(
+            self.prompt.content_control._get_indices(
+                self.prompt.content_control.selection
+            ),
+            [0, 1],
+        )
+        self.prompt._buffer.text = "hah"
+        mocked.assert_called()
+
+    def test_control_indices(self) -> None:
+        query = "wh"
+        content_control = InquirerPyFuzzyControl(
+            choices=["meat", "what", "whaaah", "weather", "haha"],
+            pointer=INQUIRERPY_POINTER_SEQUENCE,
+            marker=INQUIRERPY_POINTER_SEQUENCE,
+            current_text=lambda: query,
+            max_lines=80,
+            session_result=None,
+            multiselect=False,
+            marker_pl=" ",
+            match_exact=False,
+        )
+        self.assertEqual(content_control._get_indices(content_control.choices[1]), [])
+        content_control._filtered_choices = asyncio.run(
+            content_control._filter_choices(0.0)
+        )
+        self.assertNotIn("indices", content_control.choices[1])
+        self.assertEqual(len(content_control._indices_cache), 0)
+        content_control._get_formatted_choices()
+        self.assertEqual(len(content_control._indices_cache), 3)
+        indices = content_control._get_indices(content_control.choices[3])
+        self.assertEqual(indices, [0, 4])
+        self.assertIs(content_control._get_indices(content_control.choices[3]), indices)
+
+    def test_control_executor(self) -> None:
+        choices = ["meat", "what", "whaaah", "weather", "haha", "Whoa", "awhile"]
+        for executor, workers in (("thread", 1), ("process", 1), ("process", 3)):
+            query = "wh"
+            content_control = InquirerPyFuzzyControl(
+                choices=choices,
+                pointer=INQUIRERPY_POINTER_SEQUENCE,
+                marker=INQUIRERPY_POINTER_SEQUENCE,
+                current_text=lambda: query,
+                max_lines=80,
+                session_result=None,
+                multiselect=False,
+                marker_pl=" ",
+                match_exact=False,
+                executor=executor,
+                workers=workers,
+            )
+            expected = asyncio.run(
+                fuzzy_match(query, [{"name": name} for name in choices], key="name")
+            )
+            try:
+                result = asyncio.run(content_control._filter_choices(0.0))
+                content_control._filtered_choices = result
+                self.assertEqual(
+                    [
+                        (choice["name"], content_control._get_indices(choice))
+                        for choice in result
+                    ],
+                    [(choice["name"], choice["indices"]) for choice in expected],
+                )
+                query = "wha"
+                result = asyncio.run(content_control._filter_choices(0.0))
+                self.assertEqual(
+                    [choice["name"] for choice in result], ["what", "whaaah", "Whoa"]
+                )
+            finally:
+                content_control._close()
+            self.assertEqual(content_control._matcher._executors, [None] * workers)
+
+    def test_control_chunk_size(self) -> None:
+        choices = ["meat", "what", "whaaah", "weather", "haha", "Whoa", "awhile"]
+        kwargs = dict(
+            choices=choices,
+            pointer=INQUIRERPY_POINTER_SEQUENCE,
+            marker=INQUIRERPY_POINTER_SEQUENCE,
+            current_text=lambda: "wh",
+            max_lines=80,
+            session_result=None,
+            multiselect=False,
+            marker_pl=" ",
+            match_exact=False,
+        )
+        self.assertRaises(
+            InvalidArgument, InquirerPyFuzzyControl, **kwargs, chunk_size=0
+        )
+        content_control = InquirerPyFuzzyControl(**kwargs, chunk_size=2)
+        self.assertEqual(content_control._matcher._chunk_size, 2)
+        expected = asyncio.run(
+            fuzzy_match("wh", [{"name": name} for name in choices], key="name")
+        )
+        with patch.object(
+            content_control._matcher,
+            "_heap_chunk",
+            wraps=content_control._matcher._heap_chunk,
+        ) as mocked_chunk:
+            result = asyncio.run(content_control._filter_choices(0.0))
+        self.assertEqual(mocked_chunk.call_count, 4)
+        self.assertEqual(
+            [choice["name"] for choice in result],
+            [choice["name"] for choice in expected],
+        )
+
+    def test_control_backend(self) -> None:
+        kwargs = dict(
+            choices=["meat", "what", "whaaah", "weather", "haha", "Whoa", "awhile"],
+            pointer=INQUIRERPY_POINTER_SEQUENCE,
+            marker=INQUIRERPY_POINTER_SEQUENCE,
+            current_text=lambda: "wh",
+            max_lines=80,
+            session_result=None,
+            multiselect=False,
+            marker_pl=" ",
+            match_exact=False,
+        )
+        self.assertRaises(InvalidArgument, InquirerPyFuzzyControl, **kwargs, backend="")
+        self.assertRaises(
+            InvalidArgument,
+            InquirerPyFuzzyControl,
+            **kwargs,
+            backend="numpy",
+            executor="thread",
+        )
+        with patch("InquirerPy.matcher.vectorized.np", None):
+            self.assertRaises(
+                InvalidArgument, InquirerPyFuzzyControl, **kwargs, backend="numpy"
+            )
+
+    def test_control_progress(self) -> None:
+        query = "wh"
+        published = []
+        content_control = InquirerPyFuzzyControl(
+            choices=["meat", "what", "whaaah", "weather", "haha", "awhile"],
+            pointer=INQUIRERPY_POINTER_SEQUENCE,
+            marker=INQUIRERPY_POINTER_SEQUENCE,
+            current_text=lambda: query,
+            max_lines=2,
+            session_result=None,
+            multiselect=False,
+            marker_pl=" ",
+            match_exact=False,
+            on_progress=lambda choices: published.append(
+                (content_control._progress, [choice["name"] for choice in choices])
+            ),
+        )
+        content_control._matcher._chunk_size = 3
+        with patch("InquirerPy.prompts.fuzzy.PROGRESS_INTERVAL", 0):
+            result = asyncio.run(content_control._filter_choices(0.0))
+        self.assertEqual(
+            published,
+            [
+                ((2, 3, 6), ["what", "whaaah"]),
+                ((4, 6, 6), ["what", "whaaah"]),
+            ],
+        )
+        self.assertIsNone(content_control._progress)
+        self.assertEqual(
+            [choice["name"] for choice in result],
+            ["what", "whaaah", "awhile", "weather"],
+        )
+
+    @patch("asyncio.create_task")
+    def test_prompt_on_progress(self, _) -> None:
+        partial = RankedChoices(
+            self.prompt.content_control.choices, [[(-1.0, 2, [0, 1])]]
+        )
+        with patch.object(self.prompt._application, "invalidate") as mocked:
+            self.prompt._on_progress(partial)
+            mocked.assert_called_once()
+        self.assertIs(self.prompt.content_control._filtered_choices, partial)
+        self.prompt.content_control._progress = (1, 2, 5)
+        self.prompt._buffer.text = "w"
+        self.assertIsNone(self.prompt.content_control._progress)
+
+    def test_control_stream(self) -> None:
+        query = ""
+        content_control = InquirerPyFuzzyControl(
+            choices=io.StringIO("meat\nwhat\n"),
+            pointer=INQUIRERPY_POINTER_SEQUENCE,
+            marker=INQUIRERPY_POINTER_SEQUENCE,
+            current_text=lambda: query,
+            max_lines=80,
+            session_result=None,
+            multiselect=False,
+            marker_pl=" ",
+            match_exact=False,
+        )
+        self.assertEqual(content_control.choices, [])
+        self.assertIsNotNone(content_control._source)
+        self.assertEqual(content_control._get_formatted_choices(), [])
+
+        content_control._append_choices(["meat", "what"])
+        self.assertEqual(
+            [(choice["name"], choice["index"]) for choice in content_control.choices],
+            [("meat", 0), ("what", 1)],
+        )
+        self.assertEqual(content_control._height, 2)
+        self.assertEqual(content_control._filtered_choices, content_control.choices)
+
+        query = "wh"
+        content_control._filtered_choices = asyncio.run(
+            content_control._filter_choices(0.0)
+        )
+        self.assertIsNotNone(content_control._get_cached_choices("wh"))
+        content_control._append_choices(["whaaah", "haha"])
+        self.assertIsNone(content_control._get_cached_choices("wh"))
+        self.assertEqual(
+            [choice["name"] for choice in content_control._get_haystacks("wha")],
+            ["what", "whaaah", "haha"],
+        )
+        asyncio.run(content_control._filter_appended())
+        self.assertEqual(
+            [choice["name"] for choice in content_control._filtered_choices],
+            ["what", "whaaah"],
+        )
+        self.assertEqual(
+            [choice["name"] for choice in content_control._get_haystacks("wha")],
+            ["what", "whaaah"],
+        )
+        self.assertRaises(
+            InvalidArgument, content_control._append_choices, [Separator()]
+        )
+
+    def test_control_stream_none_value(self) -> None:
+        content_control = InquirerPyFuzzyControl(
+            choices=io.StringIO(""),
+            pointer=INQUIRERPY_POINTER_SEQUENCE,
+            marker=INQUIRERPY_POINTER_SEQUENCE,
+            current_text=lambda: "",
+            max_lines=80,
+            session_result=None,
+            multiselect=False,
+            marker_pl=" ",
+            match_exact=False,
+        )
+        content_control._append_choices(["meat", "what", "haha"])
+        content_control.selected_choice_index = 2
+        content_control._append_choices(["whaaah", {"name": "none", "value": None}])
+        self.assertEqual(content_control.selected_choice_index, 2)
+        self.assertEqual(content_control.choices[4]["value"], None)
+        self.assertRaises(
+            InvalidArgument, content_control._append_choices, [Separator()]
+        )
+        self.assertEqual(content_control.selected_choice_index, 2)
+
+    def test_control_compact(self) -> None:
+        query = ""
+        choices = ["haah", "haha", {"name": "what", "value": 1}, "waht", "weaht"]
+        controls = [
+            InquirerPyFuzzyControl(
+                choices=choices,
+                pointer=INQUIRERPY_POINTER_SEQUENCE,
+                marker=INQUIRERPY_POINTER_SEQUENCE,
+                current_text=lambda: query,
+                max_lines=80,
+                session_result=None,
+                multiselect=True,
+                marker_pl=" ",
+                match_exact=False,
+                compact=compact,
+            )
+            for compact in (False, True)
+        ]
+        content_control, compact_control = controls
+        self.assertIsInstance(compact_control.choices, ChoiceStore)
+        self.assertEqual(compact_control.choices, content_control.choices)
+        self.assertEqual(compact_control.choices[2]["value"], 1)
+
+        query = "wh"
+        for control in controls:
+            control._filtered_choices = asyncio.run(control._filter_choices(0.0))
+        self.assertEqual(
+            list(compact_control._filtered_choices),
+            list(content_control._filtered_choices),
+        )
+        self.assertEqual(
+            compact_control._get_formatted_choices(),
+            content_control._get_formatted_choices(),
+        )
+
+        compact_control._filtered_choices[0]["enabled"] = True
+        self.assertTrue(compact_control.choices[2]["enabled"])
+        with patch.object(
+            ChoiceStore, "append", autospec=True, side_effect=ChoiceStore.append
+        ) as append:
+            compact_control._append_choices(["whoa"])
+        append.assert_called_once_with(compact_control.choices, ANY)
+        self.assertEqual(compact_control.choices[5]["index"], 5)
+        self.assertEqual(compact_control._names[5], "whoa")
+
+    def test_control_stream_cache_size(self) -> None:
+        query = "wh"
+        content_control = InquirerPyFuzzyControl(
+            choices=io.StringIO(""),
+            pointer=INQUIRERPY_POINTER_SEQUENCE,
+            marker=INQUIRERPY_POINTER_SEQUENCE,
+            current_text=lambda: query,
+            max_lines=80,
+            session_result=None,
+            multiselect=False,
+            marker_pl=" ",
+            match_exact=False,
+            cache_budget=3,
+        )
+        content_control._append_choices(["meat", "what"])
+        content_control._filtered_choices = asyncio.run(
+            content_control._filter_choices(0.0)
+        )
+        key = ("wh", content_control._scorer)
+        content_control._append_choices(["whaaah", "whoa"])
+        content_control._cache.set(key, content_control._filtered_choices)
+        self.assertEqual(content_control._cache.size, 1)
+        asyncio.run(content_control._filter_appended())
+        self.assertEqual(len(content_control._filtered_choices), 3)
+        self.assertEqual(content_control._cache.size, 3)
+        self.assertIs(
+            content_control._cache.get(key), content_control._filtered_choices
+        )
+
+        content_control._append_choices(["whee"])
+        content_control._cache.set(key, content_control._filtered_choices)
+        asyncio.run(content_control._filter_appended())
+        self.assertEqual(len(content_control._filtered_choices), 4)
+        self.assertNotIn(key, content_control._cache)
+        self.assertEqual(content_control._cache.size, 0)
+
+    def test_control_stream_while_filtering(self) -> None:
+        query = "wh"
+        content_control = InquirerPyFuzzyControl(
+            choices=io.StringIO(""),
+            pointer=INQUIRERPY_POINTER_SEQUENCE,
+            marker=INQUIRERPY_POINTER_SEQUENCE,
+            current_text=lambda: query,
+            max_lines=80,
+            session_result=None,
+            multiselect=False,
+            marker_pl=" ",
+            match_exact=False,
+            on_progress=lambda _: content_control._append_choices(["weather"])
+            if len(content_control.choices) < 3
+            else None,
+        )
+        content_control._append_choices(["meat", "what"])
+        result = asyncio.run(content_control._filter_choices(0.0))
+        self.assertEqual([choice["name"] for choice in result], ["what", "weather"])
+        self.assertEqual(content_control._previous_count, 3)
+
+    def test_prompt_generator_choices(self) -> None:
+        prompt = FuzzyPrompt(message="", choices=(name for name in ["meat", "what"]))
+        self.assertIsNone(prompt.content_control._source)
+        self.assertEqual(
+            [choice["name"] for choice in prompt.content_control.choices],
+            ["meat", "what"],
+        )
+        self.assertRaises(InvalidArgument, FuzzyPrompt, message="", choices=iter([]))
+
+    @patch.object(FuzzyPrompt, "_redraw")
+    def test_prompt_stream_choices(self, _) -> None:
+        prompt = FuzzyPrompt(message="", choices=io.StringIO("meat\nwhat\nwhaaah\n"))
+        self.assertEqual(
+            prompt._generate_after_input(), [("", "  "), ("class:fuzzy_info", "0/0")]
+        )
+        prompt.content_control.loading = True
+        self.assertEqual(
+            prompt._generate_after_input(),
+            [
+                ("", "  "),
+                ("class:fuzzy_info", "0/0"),
+                ("class:fuzzy_info", " (loading)"),
+            ],
+        )
+        asyncio.run(prompt._stream_choices())
+        self.assertFalse(prompt.content_control.loading)
+        self.assertEqual(
+            [choice["name"] for choice in prompt.content_control.choices],
+            ["meat", "what", "whaaah"],
+        )
+
+    def test_control_history(self) -> None:
+        query = ""
+        history = MagicMock()
+        history.get_frecency.return_value = {"haha": 1.0, "weather": 4.0}
+        control = InquirerPyFuzzyControl(
+            choices=["meat", "what", "whaaah", "weather", "haha"],
+            pointer="",
+            marker=">",
+            current_text=lambda: query,
+            max_lines=80,
+            session_result=None,
+            multiselect=False,
+            marker_pl=" ",
+            match_exact=False,
+            history=history,
+        )
+        self.assertEqual(control._boosts, {3: 1.0, 4: 0.25})
+        self.assertEqual(
+            [choice["name"] for choice in control._filtered_choices],
+            ["weather", "haha", "meat", "what", "whaaah"],
+        )
+        self.assertEqual(control.selection["name"], "weather")
+
+        query = "ea"
+        control._filtered_choices = asyncio.run(control._filter_choices(0.0))
+        self.assertEqual(
+            [choice["name"] for choice in control._filtered_choices],
+            ["weather", "meat"],
+        )
+
+        query = ""
+        control._filtered_choices = asyncio.run(control._filter_choices(0.0))
+        self.assertEqual(control._filtered_choices[0]["name"], "weather")
+        history.get_frecency.assert_called_once_with()
+
+    def test_control_stream_history(self) -> None:
+        query = ""
+        history = MagicMock()
+        history.get_frecency.return_value = {"haha": 1.0, "weather": 4.0}
+        control = InquirerPyFuzzyControl(
+            choices=io.StringIO(""),
+            pointer="",
+            marker=">",
+            current_text=lambda: query,
+            max_lines=80,
+            session_result=None,
+            multiselect=False,
+            marker_pl=" ",
+            match_exact=False,
+            history=history,
+        )
+        control._append_choices(["meat", "haha"])
+        self.assertEqual(
+            [choice["name"] for choice in control._filtered_choices],
+            ["haha", "meat"],
+        )
+        control._append_choices(["what", "weather"])
+        self.assertEqual(
+            [choice["name"] for choice in control._filtered_choices],
+            ["weather", "haha", "meat", "what"],
+        )
+
+        query = "ea"
+        control._filtered_choices = asyncio.run(control._filter_choices(0.0))
+        filtered = control._filtered_choices
+        control._append_choices(["heat"])
+        self.assertIs(control._filtered_choices, filtered)
+
+    def test_prompt_history_no_match(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "history")
+            for multiselect in (False, True):
+                prompt = FuzzyPrompt(
+                    message="",
+                    choices=["haha", "what"],
+                    multiselect=multiselect,
+                    history=FrecencyHistory(path, key="fuzzy"),
+                )
+                prompt.content_control._filtered_choices = []
+                prompt._handle_enter(MagicMock())
+                self.assertTrue(prompt.status["answered"])
+                prompt._record_history()
+            self.assertFalse(os.path.exists(path))
+
+            prompt.content_control._filtered_choices = prompt.content_control.choices
+            prompt._handle_enter(MagicMock())
+            prompt._record_history()
+            self.assertEqual(
+                list(FrecencyHistory(path, key="fuzzy").get_frecency()), ["haha"]
+            )
+
+    def test_prompt_preview(self) -> None:
+        prompt = FuzzyPrompt(message="", choices=["haha", "what"])
+        self.assertIsNone(prompt._preview_window)
+
+        prompt = FuzzyPrompt(
+            message="", choices=["haha", "what"], preview=str, preview_cache_size=4
+        )
+        self.assertIsInstance(prompt._preview_window, PreviewWindow)
+        self.assertEqual(prompt._preview_window.control._cache._max_entries, 4)
+        self.assertEqual(prompt._get_highlighted_choice()["name"], "haha")
+        prompt.content_control._filtered_choices = []
+        self.assertIsNone(prompt._get_highlighted_choice())
+        with patch.object(prompt._preview_window.control, "cancel") as mocked_cancel:
+            prompt._close()
+            mocked_cancel.assert_called_once_with()
@@ -178,7 +178,7 @@ class TestInputPrompt(unittest.TestCase):
     @patch("InquirerPy.prompts.input.NestedCompleter.from_nested_dict")
     @patch("InquirerPy.prompts.input.SimpleLexer")
     @patch("InquirerPy.prompts.input.InputPrompt._get_prompt_message")
-    @patch("InquirerPy.base.simple.Style.from_dict")
+    @patch("InquirerPy.base.simple.get_compiled_style")
     @patch("InquirerPy.base.simple.KeyBindings")
     @patch("InquirerPy.prompts.input.PromptSession")
     def test_callable_called(
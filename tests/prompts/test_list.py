@@ -1,9 +1,13 @@
+import os
+import tempfile
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from InquirerPy.base.control import Choice
+from InquirerPy.base.store import ChoiceStore
 from InquirerPy.enum import INQUIRERPY_KEYBOARD_INTERRUPT, INQUIRERPY_POINTER_SEQUENCE
 from InquirerPy.exceptions import InvalidArgument, RequiredKeyNotFound
+from InquirerPy.history import FrecencyHistory
 from InquirerPy.prompts.list import InquirerPyListControl, ListPrompt
 from InquirerPy.separator import Separator
 from InquirerPy.utils import InquirerPyStyle
@@ -189,3 +193,83 @@ class TestListPrompt(unittest.TestCase):
         self.assertEqual(
             "instruction", prompt.content_control.choices[0]["instruction"]
         )
+
+    def test_list_viewport(self):
+        prompt = ListPrompt(message="", choices=list(range(100)), max_height=5)
+        self.assertEqual(prompt.content_control.max_lines, 5)
+        prompt.content_control.selected_choice_index = 50
+        self.assertEqual(
+            [
+                text
+                for _, text in prompt.content_control._get_formatted_choices()
+                if text.isdigit()
+            ],
+            ["46", "47", "48", "49", "50"],
+        )
+
+    def test_list_history(self):
+        history = MagicMock()
+        history.get_frecency.return_value = {"b": 1.0, "c": 2.0, "sep": 5.0}
+        prompt = ListPrompt(
+            message="",
+            choices=["a", Separator("sep"), "b", "c"],
+            history=history,
+        )
+        self.assertEqual(prompt.content_control.selected_choice_index, 3)
+        prompt = ListPrompt(
+            message="", choices=["a", "b", "c"], default="b", history=history
+        )
+        self.assertEqual(prompt.content_control.selected_choice_index, 1)
+
+        prompt._record_history()
+        history.record.assert_not_called()
+        prompt.status["answered"] = True
+        prompt.status["result"] = "b"
+        prompt._record_history()
+        history.record.assert_called_once_with(["b"])
+        prompt.status["skipped"] = True
+        prompt._record_history()
+        history.record.assert_called_once_with(["b"])
+
+    def test_list_history_unwritable(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "file")
+            with open(path, "w") as file:
+                file.write("")
+            prompt = ListPrompt(
+                message="",
+                choices=["a", "b"],
+                history=FrecencyHistory(os.path.join(path, "history"), key="list"),
+            )
+            with patch("prompt_toolkit.utils.Event") as mock:
+                prompt._handle_enter(mock.return_value)
+            prompt._record_history()
+            self.assertEqual(prompt.status["result"], "a")
+
+    def test_list_compact(self):
+        choices = ["a", Separator("sep"), Choice("b", instruction="i"), "c"]
+        prompts = [
+            ListPrompt(
+                message="",
+                choices=choices,
+                multiselect=True,
+                compact=compact,
+            )
+            for compact in (False, True)
+        ]
+        prompt, compact_prompt = prompts
+        self.assertIsInstance(compact_prompt.content_control.choices, ChoiceStore)
+        self.assertEqual(
+            compact_prompt.content_control.choices, prompt.content_control.choices
+        )
+        for current in prompts:
+            current._handle_down(None)
+            current._handle_toggle_choice(None)
+            current._handle_down(None)
+            current._handle_toggle_choice(None)
+        self.assertEqual(
+            compact_prompt.content_control._get_formatted_choices(),
+            prompt.content_control._get_formatted_choices(),
+        )
+        self.assertEqual(compact_prompt.result_value, ["b", "c"])
+        self.assertEqual(compact_prompt.result_value, prompt.result_value)
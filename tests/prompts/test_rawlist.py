@@ -3,6 +3,7 @@ from unittest.mock import ANY, call, patch
 
 from InquirerPy.base import BaseComplexPrompt
 from InquirerPy.base.control import Choice
+from InquirerPy.base.store import ChoiceStore
 from InquirerPy.exceptions import InvalidArgument, RequiredKeyNotFound
 from InquirerPy.prompts.rawlist import InquirerPyRawlistControl, RawlistPrompt
 from InquirerPy.separator import Separator
@@ -233,3 +234,18 @@ class TestRawList(unittest.TestCase):
         self.assertEqual(
             "instruction", prompt.content_control.choices[0]["instruction"]
         )
+
+    def test_rawlist_compact(self):
+        prompt, compact_prompt = [
+            RawlistPrompt(message="", choices=self.choices, default=3, compact=compact)
+            for compact in (False, True)
+        ]
+        self.assertIsInstance(compact_prompt.content_control.choices, ChoiceStore)
+        self.assertEqual(
+            compact_prompt.content_control.choices, prompt.content_control.choices
+        )
+        self.assertEqual(compact_prompt.content_control.selected_choice_index, 3)
+        self.assertEqual(
+            compact_prompt.content_control._get_formatted_choices(),
+            prompt.content_control._get_formatted_choices(),
+        )
@@ -105,7 +105,7 @@ class TestSecret(unittest.TestCase):
 
     @patch("InquirerPy.prompts.input.SimpleLexer")
     @patch("InquirerPy.prompts.secret.SecretPrompt._get_prompt_message")
-    @patch("InquirerPy.base.simple.Style.from_dict")
+    @patch("InquirerPy.base.simple.get_compiled_style")
     @patch("InquirerPy.base.simple.KeyBindings")
     @patch("InquirerPy.prompts.input.PromptSession")
     def test_callable_called(
@@ -147,7 +147,7 @@ class TestSecret(unittest.TestCase):
         MockedStyle.assert_has_calls(
             [
                 call(),
-                call(get_sample_style()),
+                call(InquirerPyStyle(get_sample_style())),
             ]
         )
         MockedLexer.assert_has_calls([call("class:input")])
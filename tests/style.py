@@ -25,6 +25,7 @@ def get_sample_style(val=None) -> Dict[str, str]:
         "fuzzy_info": "#abb2bf",
         "frame.border": "#4b5263",
         "fuzzy_match": "#c678dd",
+        "fuzzy_preview": "",
         "spinner_pattern": "#e5c07b",
         "spinner_text": "",
         "bottom-toolbar": "noreverse",
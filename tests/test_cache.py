@@ -0,0 +1,41 @@
+import unittest
+
+from InquirerPy.cache import LRUCache
+
+
+class TestCache(unittest.TestCase):
+    def test_entries(self) -> None:
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.set("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("b", "default"), "default")
+
+    def test_size(self) -> None:
+        cache = LRUCache(max_entries=10, max_size=5, sizeof=len)
+        cache.set("a", [1, 2])
+        cache.set("b", [1, 2])
+        self.assertEqual(cache.size, 4)
+        cache.set("c", [1, 2])
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.size, 4)
+        cache.set("d", [1, 2, 3, 4, 5, 6])
+        self.assertNotIn("d", cache)
+        self.assertEqual(cache.size, 4)
+        cache.set("b", [1])
+        self.assertEqual(cache.size, 3)
+        self.assertEqual(cache.pop("b"), [1])
+        self.assertEqual(cache.size, 2)
+        cache.clear()
+        self.assertEqual(cache.size, 0)
+        self.assertEqual(len(cache), 0)
+
+    def test_disabled(self) -> None:
+        cache = LRUCache(max_entries=0)
+        cache.set("a", 1)
+        self.assertNotIn("a", cache)
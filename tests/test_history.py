@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from InquirerPy.history import FrecencyHistory, PromotedChoices
+
+
+class TestHistory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache", "history")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_frecency(self) -> None:
+        history = FrecencyHistory(self.path, key="prompt", half_life=10)
+        self.assertEqual(history.get_frecency(), {})
+        with patch("InquirerPy.history.time.time", return_value=100):
+            history.record(["a", "b"])
+            history.record(["a"])
+        with patch("InquirerPy.history.time.time", return_value=110):
+            self.assertEqual(history.get_frecency(), {"a": 1.0, "b": 0.5})
+            history.record([])
+            self.assertEqual(history.get_frecency(), {"a": 1.0, "b": 0.5})
+
+        with patch("InquirerPy.history.time.time", return_value=110):
+            reloaded = FrecencyHistory(self.path, key="prompt", half_life=10)
+            self.assertEqual(reloaded.get_frecency(), {"a": 1.0, "b": 0.5})
+            other = FrecencyHistory(self.path, key="other")
+            self.assertEqual(other.get_frecency(), {})
+
+    def test_compact(self) -> None:
+        history = FrecencyHistory(self.path, key="prompt", max_entries=2)
+        other = FrecencyHistory(self.path, key="other", max_entries=2)
+        other.record(["x"])
+        for name in "abcdefghij":
+            history.record([name])
+        with open(self.path, encoding="utf-8") as file:
+            self.assertLess(len(file.readlines()), 9)
+        history.compact()
+        with open(self.path, encoding="utf-8") as file:
+            lines = [json.loads(line) for line in file]
+        self.assertEqual(
+            [(key, name) for _, key, name in lines],
+            [("other", "x"), ("prompt", "i"), ("prompt", "j")],
+        )
+        self.assertEqual(set(history.get_frecency()), {"i", "j"})
+
+    def test_corrupted(self) -> None:
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write('not json\n[1, "prompt", "a"]\n')
+        history = FrecencyHistory(self.path, key="prompt")
+        self.assertEqual(list(history.get_frecency()), ["a"])
+
+    def test_unwritable(self) -> None:
+        with open(os.path.join(self.directory.name, "file"), "w") as file:
+            file.write("")
+        path = os.path.join(self.directory.name, "file", "history")
+        history = FrecencyHistory(path, key="prompt", max_entries=1)
+        history.record(["a"])
+        history.record(["b"])
+        self.assertEqual(set(history.get_frecency()), {"a", "b"})
+        self.assertEqual(FrecencyHistory(path, key="prompt").get_frecency(), {})
+
+        history = FrecencyHistory(self.path, key="prompt", max_entries=1)
+        history.record(["a"])
+        with patch("InquirerPy.history.os.replace", side_effect=OSError):
+            history.record(["b"])
+            history.record(["c"])
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["history"])
+        reloaded = FrecencyHistory(self.path, key="prompt")
+        self.assertEqual(set(reloaded.get_frecency()), {"a", "b", "c"})
+
+    def test_promoted_choices(self) -> None:
+        choices = list(range(10))
+        promoted = PromotedChoices(choices, [7, 2, 3])
+        self.assertEqual(list(promoted), [7, 2, 3, 0, 1, 4, 5, 6, 8, 9])
+        self.assertEqual(promoted[-1], 9)
+        self.assertEqual(promoted[1:4], [2, 3, 0])
+        self.assertRaises(IndexError, lambda: promoted[10])
+        choices.append(10)
+        self.assertEqual(promoted[10], 10)
+        self.assertEqual(list(PromotedChoices(choices, [])), choices)
@@ -1,7 +1,11 @@
 import re
+import subprocess
+import sys
 import unittest
 
-from InquirerPy import inquirer
+import InquirerPy
+from InquirerPy import inquirer, resolver
+from InquirerPy.prompts import FuzzyPrompt
 from InquirerPy.resolver import question_mapping
 
 
@@ -18,3 +22,28 @@ class TestInquirer(unittest.TestCase):
             prompt = special_mapping.get(prompt, prompt)
             if prompt not in inquirer_lookup:
                 self.fail()
+
+    def test_lazy_import(self) -> None:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; from InquirerPy import inquirer, prompt; inquirer.confirm;"
+                "print(sorted(m for m in sys.modules if m.startswith(('pfzy', 'InquirerPy.prompts.'))))",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        self.assertEqual(result.stdout.strip(), "['InquirerPy.prompts.confirm']")
+
+    def test_lazy_attributes(self) -> None:
+        self.assertIs(inquirer.fuzzy, FuzzyPrompt)
+        self.assertIs(question_mapping["fuzzy"], FuzzyPrompt)
+        self.assertIs(resolver.FuzzyPrompt, FuzzyPrompt)
+        self.assertEqual(len(question_mapping), 10)
+        self.assertIn("prompt", dir(InquirerPy))
+        with self.assertRaises(AttributeError):
+            inquirer.unknown
+        with self.assertRaises(AttributeError):
+            resolver.UnknownPrompt
@@ -0,0 +1,72 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from prompt_toolkit.document import Document
+from prompt_toolkit.validation import ValidationError, Validator
+
+from InquirerPy.profiler import Profiler, get_profiler
+
+
+class TestProfiler(unittest.TestCase):
+    def test_span(self) -> None:
+        callback = MagicMock()
+        profiler = Profiler(callback=callback)
+        with profiler.span("render"):
+            pass
+        with self.assertRaises(ValueError):
+            with profiler.span("render"):
+                raise ValueError
+        metric = profiler.metrics["render"]
+        self.assertEqual(metric.count, 2)
+        self.assertGreaterEqual(metric.total, metric.max)
+        self.assertAlmostEqual(metric.mean, metric.total / 2)
+        self.assertEqual(callback.call_count, 2)
+        self.assertEqual(callback.call_args[0][0], "render")
+
+    def test_wrap(self) -> None:
+        profiler = Profiler()
+        self.assertEqual(profiler.wrap("add", lambda a, b: a + b)(1, 2), 3)
+
+        async def double(value):
+            return value * 2
+
+        self.assertEqual(asyncio.run(profiler.wrap_async("double", double)(2)), 4)
+        self.assertEqual(profiler.metrics["add"].count, 1)
+        self.assertEqual(profiler.metrics["double"].count, 1)
+
+        validator = profiler.wrap_validator(
+            Validator.from_callable(lambda text: text == "yes")
+        )
+        validator.validate(Document("yes"))
+        self.assertRaises(ValidationError, validator.validate, Document("no"))
+        self.assertEqual(profiler.metrics["validate"].count, 2)
+
+    def test_write(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            Profiler().write()
+            self.assertFalse(os.path.exists(path))
+
+            profiler = Profiler(trace_file=path, max_events=1)
+            profiler.record("render", 0.0, 0.5)
+            profiler.record("render", 1.0, 0.5)
+            profiler.write()
+            with open(path) as file:
+                events = json.load(file)["traceEvents"]
+            self.assertEqual(len(events), 1)
+            self.assertEqual(events[0]["name"], "render")
+            self.assertEqual(events[0]["ph"], "X")
+            self.assertEqual(events[0]["dur"], 500000)
+            self.assertEqual(profiler.metrics["render"].count, 2)
+
+    def test_get_profiler(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(get_profiler())
+        with patch.dict(os.environ, {"INQUIRERPY_PROFILE": "trace.json"}):
+            profiler = get_profiler()
+            self.assertIsNotNone(profiler)
+            self.assertIs(get_profiler(), profiler)
@@ -0,0 +1,87 @@
+import asyncio
+import unittest
+
+from prompt_toolkit.application.current import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+from InquirerPy.prompts import ConfirmPrompt, InputPrompt, ListPrompt
+from InquirerPy.resolver import prompt, prompt_async
+from InquirerPy.session import SessionApplication, get_session
+
+
+class TestSession(unittest.TestCase):
+    def setUp(self) -> None:
+        self.questions = [
+            {"type": "input", "message": "Name:", "name": "name", "default": "a"},
+            {
+                "type": "list",
+                "message": "Pick:",
+                "choices": ["1", "2"],
+                "name": "pick",
+                "mandatory": False,
+            },
+            {"type": "confirm", "message": "Confirm:", "name": "confirm"},
+        ]
+
+    def test_run_session(self) -> None:
+        applications = []
+
+        async def ask():
+            self.assertIsInstance(get_session(), SessionApplication)
+            name = InputPrompt(message="Name:")
+            pick = ListPrompt(message="Pick:", choices=["1", "2"])
+            confirm = ConfirmPrompt(message="Confirm:")
+            applications.extend([name._session.app, pick.application])
+            return [
+                await name.execute_async(),
+                await pick.execute_async(),
+                await confirm.execute_async(),
+            ]
+
+        with create_pipe_input() as pipe, create_app_session(
+            input=pipe, output=DummyOutput()
+        ):
+            pipe.send_text("hello\r\x1b[B\ry")
+            session = SessionApplication()
+            self.assertEqual(session.run_session(ask()), ["hello", "2", True])
+        self.assertIsNone(get_session())
+        for application in applications:
+            self.assertFalse(application.is_running)
+            self.assertNotIn("exit", vars(application))
+
+    def test_prompt(self) -> None:
+        with create_pipe_input() as pipe, create_app_session(
+            input=pipe, output=DummyOutput()
+        ):
+            pipe.send_text("b\r\ry")
+            result = prompt(self.questions, single_application=True)
+        self.assertEqual(result, {"name": "ab", "pick": "1", "confirm": True})
+
+    def test_prompt_async(self) -> None:
+        with create_pipe_input() as pipe, create_app_session(
+            input=pipe, output=DummyOutput()
+        ):
+            pipe.send_text("\r\x1b[B\rn")
+            result = asyncio.run(prompt_async(self.questions, single_application=True))
+        self.assertEqual(result, {"name": "a", "pick": "2", "confirm": False})
+
+    def test_keyboard_interrupt(self) -> None:
+        with create_pipe_input() as pipe, create_app_session(
+            input=pipe, output=DummyOutput()
+        ):
+            pipe.send_text("\r\x03")
+            self.assertRaises(
+                KeyboardInterrupt, prompt, self.questions, single_application=True
+            )
+
+        with create_pipe_input() as pipe, create_app_session(
+            input=pipe, output=DummyOutput()
+        ):
+            pipe.send_text("\r\x03y")
+            result = prompt(
+                self.questions,
+                raise_keyboard_interrupt=False,
+                single_application=True,
+            )
+        self.assertEqual(result, {"name": "a", "pick": None, "confirm": True})
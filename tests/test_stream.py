@@ -0,0 +1,57 @@
+import asyncio
+import io
+import unittest
+
+from InquirerPy.stream import is_stream, iter_batches
+
+
+async def collect(source, interval=0.01):
+    return [batch async for batch in iter_batches(source, interval=interval)]
+
+
+class TestStream(unittest.TestCase):
+    def test_is_stream(self) -> None:
+        async def agen():
+            yield 1
+
+        self.assertFalse(is_stream([1, 2]))
+        self.assertFalse(is_stream((1, 2)))
+        self.assertFalse(is_stream(iter([1, 2])))
+        self.assertFalse(is_stream(x for x in range(2)))
+        self.assertTrue(is_stream(agen()))
+        self.assertTrue(is_stream(io.StringIO("a\n")))
+
+    def test_iter_batches_sync(self) -> None:
+        batches = asyncio.run(collect(iter(range(100))))
+        self.assertEqual(
+            [item for batch in batches for item in batch], list(range(100))
+        )
+
+    def test_iter_batches_async(self) -> None:
+        async def agen():
+            for i in range(3):
+                await asyncio.sleep(0.03)
+                yield i
+
+        batches = asyncio.run(collect(agen()))
+        self.assertEqual(batches, [[0], [1], [2]])
+
+    def test_iter_batches_lines(self) -> None:
+        batches = asyncio.run(collect(io.StringIO("a\nb\r\n\nc")))
+        self.assertEqual(
+            [item for batch in batches for item in batch], ["a", "b", "", "c"]
+        )
+        batches = asyncio.run(collect(io.BytesIO(b"a\nb\n")))
+        self.assertEqual([item for batch in batches for item in batch], ["a", "b"])
+
+    def test_iter_batches_exception(self) -> None:
+        def gen():
+            yield 1
+            raise ValueError("stream failed")
+
+        async def agen():
+            yield 1
+            raise ValueError("stream failed")
+
+        self.assertRaises(ValueError, asyncio.run, collect(gen()))
+        self.assertRaises(ValueError, asyncio.run, collect(agen()))
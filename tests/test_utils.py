@@ -5,7 +5,13 @@ from unittest.mock import PropertyMock, patch
 from prompt_toolkit.application.application import Application
 
 from InquirerPy.exceptions import InvalidArgument
-from InquirerPy.utils import InquirerPyStyle, calculate_height, color_print, get_style
+from InquirerPy.utils import (
+    InquirerPyStyle,
+    calculate_height,
+    color_print,
+    get_compiled_style,
+    get_style,
+)
 
 from .style import get_sample_style
 
@@ -53,6 +59,7 @@ class TestUtils(unittest.TestCase):
         os.environ["INQUIRERPY_STYLE_MARKER"] = "#bbbbbb"
         os.environ["INQUIRERPY_STYLE_FUZZY_BORDER"] = "#cccccc"
         os.environ["INQUIRERPY_STYLE_FUZZY_MATCH"] = "#dddddd"
+        os.environ["INQUIRERPY_STYLE_FUZZY_PREVIEW"] = "#eeeeee"
         os.environ["INQUIRERPY_STYLE_VALIDATOR"] = "#dddddd"
         os.environ["INQUIRERPY_STYLE_SPINNER_PATTERN"] = "#ssssss"
         os.environ["INQUIRERPY_STYLE_SPINNER_TEXT"] = "#llllll"
@@ -81,6 +88,7 @@ class TestUtils(unittest.TestCase):
                     "marker": "#bbbbbb",
                     "validation-toolbar": "#dddddd",
                     "fuzzy_match": "#dddddd",
+                    "fuzzy_preview": "#eeeeee",
                     "frame.border": "#cccccc",
                     "spinner_pattern": "#ssssss",
                     "spinner_text": "#llllll",
@@ -109,6 +117,7 @@ class TestUtils(unittest.TestCase):
             "marker": "#bbbbbb",
             "validator": "#dddddd",
             "fuzzy_match": "#dddddd",
+            "fuzzy_preview": "#eeeeee",
             "fuzzy_border": "#cccccc",
             "spinner_pattern": "#ssssss",
             "spinner_text": "#llllll",
@@ -122,6 +131,27 @@ class TestUtils(unittest.TestCase):
             InquirerPyStyle(raw),
         )
 
+    def test_style_cache(self):
+        style = get_style({"answer": "#000000"}, style_override=False)
+        style.dict["answer"] = "#ffffff"
+        self.assertEqual(
+            get_style({"answer": "#000000"}, style_override=False).dict["answer"],
+            "#000000",
+        )
+
+        with patch.dict(os.environ, {"INQUIRERPY_STYLE_POINTER": "#111111"}):
+            self.assertEqual(get_style().dict["pointer"], "#111111")
+        with patch.dict(os.environ, {"INQUIRERPY_STYLE_POINTER": "#222222"}):
+            self.assertEqual(get_style().dict["pointer"], "#222222")
+
+    def test_compiled_style(self):
+        compiled = get_compiled_style(get_style({"answer": "#000000"}))
+        self.assertIs(compiled, get_compiled_style(get_style({"answer": "#000000"})))
+        self.assertIsNot(compiled, get_compiled_style(get_style({"answer": "#111111"})))
+        self.assertEqual(
+            compiled.get_attrs_for_style_str("class:answer").color, "000000"
+        )
+
     @patch("InquirerPy.utils.print_formatted_text")
     @patch("InquirerPy.utils.run_in_terminal")
     @patch.object(Application, "is_running", new_callable=PropertyMock)